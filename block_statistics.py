@@ -0,0 +1,294 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the cache of statistics of sensors values over fixed-size blocks of samples
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import numpy as np
+
+#   Number of samples of each block
+BLOCK_STATISTICS_SIZE = 1024
+
+#   Number of bins of the histograms used to estimate percentiles
+BLOCK_HISTOGRAM_BINS = 128
+
+#   Number of blocks processed at once while the cache is built (bounds the size of temporary arrays)
+BLOCK_STATISTICS_CHUNK = 64
+
+"""
+
+    BlockStatistics
+
+    In charge of answering statistics queries (min, max, mean, standard deviation, percentiles) of each sensor over
+    any window of frames without scanning all of its samples.
+    Samples are cut into blocks of block_size frames whose aggregates (count, min, max, sum and sum of squared
+    deviations from the mean of the block) are precomputed, a window is then answered by combining the whole blocks
+    it covers with, at most, two partial scans of the blocks at its edges.
+
+    Percentiles are estimated from per-block histograms (built at the first percentile query) with bins spread over
+    the range of each sensor, so they are only precise to one bin width (range / nb_of_bins). Windows that don't cover
+    any whole block are always answered exactly.
+
+    Windows are given as frame indices [start; end[ like Python slices.
+
+"""
+
+
+class BlockStatistics:
+    __values: np.ndarray
+    __block_size: int
+    __nb_of_bins: int
+
+    #   Shape is (number of blocks, number of sensors), except for counts (number of blocks)
+    __counts: np.ndarray
+    __min: np.ndarray
+    __max: np.ndarray
+    __sum: np.ndarray
+    __squared_deviations: np.ndarray
+
+    #   Only built at the first percentile query, shape is (number of blocks, number of sensors, number of bins)
+    __histograms: np.ndarray | None
+    __histogram_edges: np.ndarray | None
+
+    #   values is a (number of samples, number of sensors) array
+    def __init__(self, values: np.ndarray, block_size: int = BLOCK_STATISTICS_SIZE,
+                 nb_of_bins: int = BLOCK_HISTOGRAM_BINS):
+        if block_size < 1:
+            raise Exception("BlockStatistics: Block size must be at least 1 !")
+
+        if nb_of_bins < 1:
+            raise Exception("BlockStatistics: Number of bins must be at least 1 !")
+
+        self.__block_size = block_size
+        self.__nb_of_bins = nb_of_bins
+
+        nb_of_sensors = values.shape[1]
+
+        self.__counts = np.empty(0, dtype=np.int64)
+        self.__min = np.empty((0, nb_of_sensors))
+        self.__max = np.empty((0, nb_of_sensors))
+        self.__sum = np.empty((0, nb_of_sensors))
+        self.__squared_deviations = np.empty((0, nb_of_sensors))
+
+        self.__histograms = None
+        self.__histogram_edges = None
+
+        self.__values = values
+        self.__compute_blocks(0)
+
+    #   Get the number of samples of each block
+    def get_block_size(self) -> int:
+        return self.__block_size
+
+    #   Get the number of samples covered by the cache
+    def get_nb_of_samples(self) -> int:
+        return len(self.__values)
+
+    #   Will update the cache with a longer version of the values (e.g. frames appended to the dataset), only the last
+    #   incomplete block and the new ones are computed again
+    def extend(self, values: np.ndarray) -> None:
+        first_block = len(self.__values) // self.__block_size
+
+        self.__values = values
+        self.__compute_blocks(first_block)
+
+    #   Will compute the aggregates of each block from the given one to the last one
+    def __compute_blocks(self, first_block: int) -> None:
+        nb_of_samples, nb_of_sensors = self.__values.shape
+        nb_of_blocks = -(-nb_of_samples // self.__block_size)
+
+        counts = np.empty(nb_of_blocks - first_block, dtype=np.int64)
+        blocks_min = np.empty((nb_of_blocks - first_block, nb_of_sensors))
+        blocks_max = np.empty_like(blocks_min)
+        blocks_sum = np.empty_like(blocks_min)
+        blocks_squared_deviations = np.empty_like(blocks_min)
+
+        #   Whole blocks are reduced by chunks of blocks, the last block may be incomplete
+        for chunk_start in range(first_block, nb_of_blocks, BLOCK_STATISTICS_CHUNK):
+            chunk_end = min(chunk_start + BLOCK_STATISTICS_CHUNK, nb_of_blocks)
+            chunk = np.asarray(self.__values[chunk_start * self.__block_size:chunk_end * self.__block_size],
+                               dtype=float)
+
+            nb_of_whole_blocks = len(chunk) // self.__block_size
+
+            for i, block in enumerate(self.__split_chunk(chunk, nb_of_whole_blocks)):
+                index = chunk_start - first_block + (0 if i == 0 else nb_of_whole_blocks)
+                size = block.shape[1]
+
+                counts[index:index + len(block)] = size
+                blocks_min[index:index + len(block)] = block.min(axis=1)
+                blocks_max[index:index + len(block)] = block.max(axis=1)
+                blocks_sum[index:index + len(block)] = block.sum(axis=1)
+                blocks_squared_deviations[index:index + len(block)] = \
+                    ((block - blocks_sum[index:index + len(block), np.newaxis] / size) ** 2).sum(axis=1)
+
+        self.__counts = np.concatenate((self.__counts[:first_block], counts))
+        self.__min = np.concatenate((self.__min[:first_block], blocks_min))
+        self.__max = np.concatenate((self.__max[:first_block], blocks_max))
+        self.__sum = np.concatenate((self.__sum[:first_block], blocks_sum))
+        self.__squared_deviations = np.concatenate((self.__squared_deviations[:first_block],
+                                                    blocks_squared_deviations))
+
+        #   Histograms are only kept if new values are still in their range
+        if self.__histograms is not None:
+            new_min = blocks_min.min(axis=0) if len(blocks_min) > 0 else self.__histogram_edges[:, 0]
+            new_max = blocks_max.max(axis=0) if len(blocks_max) > 0 else self.__histogram_edges[:, -1]
+
+            if np.all(new_min >= self.__histogram_edges[:, 0]) and np.all(new_max <= self.__histogram_edges[:, -1]):
+                self.__histograms = np.concatenate((self.__histograms[:first_block],
+                                                    self.__compute_histograms(first_block, nb_of_blocks)))
+            else:
+                self.__histograms = None
+                self.__histogram_edges = None
+
+    #   Will split a chunk of samples into a (number of whole blocks, block size, number of sensors) array and a
+    #   (1, size of the incomplete block, number of sensors) array (if the chunk ends with an incomplete block)
+    def __split_chunk(self, chunk: np.ndarray, nb_of_whole_blocks: int) -> [np.ndarray]:
+        whole_size = nb_of_whole_blocks * self.__block_size
+        blocks = []
+
+        if nb_of_whole_blocks > 0:
+            blocks.append(chunk[:whole_size].reshape(nb_of_whole_blocks, self.__block_size, chunk.shape[1]))
+
+        if whole_size < len(chunk):
+            blocks.append(chunk[whole_size:][np.newaxis])
+
+        return blocks
+
+    #   Will compute the histogram of each sensor in each block from first_block to end_block (excluded)
+    def __compute_histograms(self, first_block: int, end_block: int) -> np.ndarray:
+        histograms = np.empty((end_block - first_block, self.__values.shape[1], self.__nb_of_bins), dtype=np.int64)
+
+        for block in range(first_block, end_block):
+            histograms[block - first_block] = self.__get_histograms(
+                self.__values[block * self.__block_size:(block + 1) * self.__block_size])
+
+        return histograms
+
+    #   Will compute the histogram of each sensor over the given samples, shape is (number of sensors, number of bins)
+    def __get_histograms(self, samples: np.ndarray) -> np.ndarray:
+        samples = np.asarray(samples, dtype=float)
+        lower, upper = self.__histogram_edges[:, 0], self.__histogram_edges[:, -1]
+        width = np.where(upper > lower, upper - lower, 1)
+
+        #   Bin of each sample, the maximum of a sensor goes into its last bin
+        bins = np.clip(((samples - lower) / width * self.__nb_of_bins).astype(np.int64), 0, self.__nb_of_bins - 1)
+        bins += np.arange(samples.shape[1]) * self.__nb_of_bins
+
+        return np.bincount(bins.ravel(), minlength=samples.shape[1] * self.__nb_of_bins) \
+            .reshape(samples.shape[1], self.__nb_of_bins)
+
+    #   Will check a window and split it into the range of whole blocks it covers and the partial samples at its edges
+    #   Return the first whole block, the end of whole blocks (excluded) and the samples before and after them
+    def __split_window(self, start: int, end: int) -> (int, int, [np.ndarray]):
+        if not 0 <= start < end <= len(self.__values):
+            raise Exception("BlockStatistics: Invalid window [{:d}; {:d}[ for {:d} samples !"
+                            .format(start, end, len(self.__values)))
+
+        first_block = -(-start // self.__block_size)
+        end_block = end // self.__block_size
+
+        #   The window doesn't cover any whole block, it is scanned
+        if first_block >= end_block:
+            return 0, 0, [np.asarray(self.__values[start:end], dtype=float)]
+
+        partial_samples = [np.asarray(self.__values[start:first_block * self.__block_size], dtype=float),
+                           np.asarray(self.__values[end_block * self.__block_size:end], dtype=float)]
+
+        return first_block, end_block, [samples for samples in partial_samples if len(samples) > 0]
+
+    #   Get the minimum of each sensor over the window [start; end[
+    def get_min(self, start: int, end: int) -> np.ndarray:
+        first_block, end_block, partial_samples = self.__split_window(start, end)
+
+        return np.min([self.__min[first_block:end_block].min(axis=0, initial=np.inf)] +
+                      [samples.min(axis=0) for samples in partial_samples], axis=0)
+
+    #   Get the maximum of each sensor over the window [start; end[
+    def get_max(self, start: int, end: int) -> np.ndarray:
+        first_block, end_block, partial_samples = self.__split_window(start, end)
+
+        return np.max([self.__max[first_block:end_block].max(axis=0, initial=-np.inf)] +
+                      [samples.max(axis=0) for samples in partial_samples], axis=0)
+
+    #   Will combine count, sum and squared deviations of whole blocks and partial samples of the window [start; end[
+    #   Squared deviations of each part are moved to the global mean (parallel variance algorithm)
+    def __get_moments(self, start: int, end: int) -> (int, np.ndarray, np.ndarray):
+        first_block, end_block, partial_samples = self.__split_window(start, end)
+
+        counts = [self.__counts[first_block:end_block]] + [np.array([len(samples)]) for samples in partial_samples]
+        sums = [self.__sum[first_block:end_block]] + [samples.sum(axis=0)[np.newaxis] for samples in partial_samples]
+        squared_deviations = [self.__squared_deviations[first_block:end_block]] + \
+                             [((samples - samples.mean(axis=0)) ** 2).sum(axis=0)[np.newaxis]
+                              for samples in partial_samples]
+
+        counts = np.concatenate(counts)
+        sums = np.concatenate(sums)
+        squared_deviations = np.concatenate(squared_deviations)
+
+        nb_of_samples = int(counts.sum())
+        mean = sums.sum(axis=0) / nb_of_samples
+
+        total_squared_deviations = squared_deviations.sum(axis=0) + \
+            (counts[:, np.newaxis] * (sums / counts[:, np.newaxis] - mean) ** 2).sum(axis=0)
+
+        return nb_of_samples, mean, total_squared_deviations
+
+    #   Get the mean of each sensor over the window [start; end[
+    def get_mean(self, start: int, end: int) -> np.ndarray:
+        return self.__get_moments(start, end)[1]
+
+    #   Get the standard deviation of each sensor over the window [start; end[
+    #   ddof works like for numpy.std (0 for the population standard deviation)
+    def get_std(self, start: int, end: int, ddof: int = 0) -> np.ndarray:
+        nb_of_samples, _, squared_deviations = self.__get_moments(start, end)
+
+        if nb_of_samples - ddof <= 0:
+            return np.full(len(squared_deviations), np.nan)
+
+        return np.sqrt(squared_deviations / (nb_of_samples - ddof))
+
+    #   Get the given percentile (from 0 to 100) of each sensor over the window [start; end[
+    #   Estimated from histograms when the window covers whole blocks (see the description of the class)
+    def get_percentile(self, percentile: float, start: int, end: int) -> np.ndarray:
+        if not 0 <= percentile <= 100:
+            raise Exception("BlockStatistics: Percentile must be between 0 and 100 !")
+
+        first_block, end_block, partial_samples = self.__split_window(start, end)
+
+        if first_block >= end_block:
+            return np.percentile(partial_samples[0], percentile, axis=0)
+
+        if self.__histograms is None:
+            self.__histogram_edges = np.linspace(self.__min.min(axis=0), self.__max.max(axis=0),
+                                                 self.__nb_of_bins + 1, axis=1)
+            self.__histograms = self.__compute_histograms(0, len(self.__counts))
+
+        histograms = self.__histograms[first_block:end_block].sum(axis=0)
+
+        for samples in partial_samples:
+            histograms += self.__get_histograms(samples)
+
+        #   Rank of the percentile among samples of the window, then position of this rank in the bin holding it
+        rank = percentile / 100 * (end - start - 1)
+        cumulated_counts = np.cumsum(histograms, axis=1)
+
+        bins = np.array([np.searchsorted(counts, rank, side='right') for counts in cumulated_counts])
+        bins = np.minimum(bins, self.__nb_of_bins - 1)
+
+        sensors = np.arange(len(bins))
+        counts_before = np.where(bins > 0, cumulated_counts[sensors, np.maximum(bins - 1, 0)], 0)
+        fraction = (rank - counts_before + 0.5) / np.maximum(histograms[sensors, bins], 1)
+
+        lower = self.__histogram_edges[sensors, bins]
+        upper = self.__histogram_edges[sensors, bins + 1]
+        estimation = lower + np.clip(fraction, 0, 1) * (upper - lower)
+
+        #   The estimation can't be out of the bounds of the window
+        return np.clip(estimation, self.get_min(start, end), self.get_max(start, end))
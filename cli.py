@@ -0,0 +1,414 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the command-line interface, used to import data and export derived outputs without any display
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import argparse
+import csv
+import json
+import os
+import sys
+
+import numpy as np
+
+#   Import of custom modules
+from columnar_store import save_columnar
+from dataset import DataSet
+from dataset_cache import DataSetCache
+from import_module import DataImportModule
+from import_profiler import ImportProfiler
+from import_progress import ImportProgress
+from import_selection import ImportSelection
+from model import Model
+from resampling import ResamplingMethod, ResamplingSettings
+from sensors_storage import StorageType
+from utils import zip_contains
+
+#   Exit codes of the command-line interface
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+EXIT_USAGE_ERROR = 2
+EXIT_DATA_ERROR = 3
+EXIT_LAYOUT_ERROR = 4
+EXIT_OUTPUT_ERROR = 5
+
+"""
+
+    CliError
+
+    Raised by commands to stop with a message and a specific exit code.
+
+"""
+
+
+class CliError(Exception):
+    exit_code: int
+
+    def __init__(self, message: str, exit_code: int = EXIT_FAILURE):
+        super().__init__(message)
+        self.exit_code = exit_code
+
+
+#   Will print a message on the error output
+def print_error(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+#   Will build the resampling settings asked by the arguments (None if data isn't resampled)
+def get_resampling_settings(arguments: argparse.Namespace) -> ResamplingSettings | None:
+    if arguments.resample_rate is None and arguments.decimate is None:
+        return None
+
+    return ResamplingSettings(ResamplingMethod[arguments.resample_method],
+                              target_rate=arguments.resample_rate,
+                              decimation_factor=arguments.decimate)
+
+
+#   Will build the selection asked by the arguments (None if everything is imported)
+def get_import_selection(arguments: argparse.Namespace) -> ImportSelection | None:
+    if arguments.sensors is None and arguments.time_range is None:
+        return None
+
+    return ImportSelection(None if arguments.sensors is None else arguments.sensors.split(","),
+                           None if arguments.time_range is None else tuple(arguments.time_range))
+
+
+#   Will import the data file given by the arguments (CSV file, CSV+SVG files or columnar file)
+#   Return the model and the background paths, raise a CliError if data cannot be imported
+def import_model(arguments: argparse.Namespace) -> (Model, list):
+    errors: dict[str, Exception] = {}
+
+    def on_data_error(e: Exception):
+        errors.setdefault("data", e)
+
+    def on_layout_error(e: Exception):
+        errors.setdefault("layout", e)
+
+    #   Nobody can be asked for the delimiter, the one given as argument is used (if any)
+    def on_delimiters_error():
+        if arguments.delimiter is None:
+            raise Exception("CSV settings cannot be detected, give the delimiter with --delimiter")
+
+        return arguments.delimiter
+
+    def on_no_bg_path_found():
+        print_error("WARNING: A path without id has been found in the SVG file, background may be incomplete")
+
+    try:
+        resampling = get_resampling_settings(arguments)
+        selection = get_import_selection(arguments)
+
+    except Exception as e:
+        raise CliError(str(e), EXIT_USAGE_ERROR)
+
+    profiler = ImportProfiler() if arguments.profile is not None else None
+    progress = ImportProgress((lambda phase: print_error(phase.value[1] + "...")) if arguments.verbose else None,
+                              profiler)
+
+    try:
+        svg_file_path = arguments.svg
+
+        #   A zip archive may contain the SVG file with the CSV file
+        if svg_file_path is None and zip_contains(arguments.input, ".svg"):
+            svg_file_path = arguments.input
+
+        if arguments.input.endswith(".sdc"):
+            result = DataImportModule().get_model_columnar(arguments.input, on_data_error, progress)
+            result = None if result is None else (result[0], result[2])
+
+        else:
+            import_module = DataImportModule(None if arguments.no_cache else DataSetCache(arguments.cache_directory),
+                                             arguments.workers, None,
+                                             resampling, selection,
+                                             storage_type=StorageType[arguments.storage])
+
+            if svg_file_path is not None:
+                result = import_module.get_model_dsf(arguments.input, svg_file_path, on_delimiters_error,
+                                                     on_layout_error, on_no_bg_path_found, on_data_error, progress)
+            else:
+                result = (import_module.get_model_ff(arguments.input, on_delimiters_error, on_data_error, progress),
+                          [])
+
+    except Exception as e:
+        on_data_error(e)
+        result = None
+
+    finally:
+        progress.finish()
+
+    if profiler is not None:
+        write_output(lambda: profiler.save_json(arguments.profile, input=arguments.input, svg=arguments.svg))
+
+    if "layout" in errors:
+        raise CliError("Cannot use the SVG file: {0}".format(errors["layout"]), EXIT_LAYOUT_ERROR)
+
+    if result is None or "data" in errors:
+        raise CliError("Cannot import the data file: {0}".format(errors.get("data")), EXIT_DATA_ERROR)
+
+    return result
+
+
+#   Will call a function writing an output, raise a CliError if the output cannot be written
+def write_output(write_function: 'function') -> None:
+    try:
+        write_function()
+
+    except Exception as e:
+        raise CliError("Cannot write the output: {0}".format(e), EXIT_OUTPUT_ERROR)
+
+
+#   Will give the frames asked by the arguments of the heatmap command
+def get_heatmap_frames(arguments: argparse.Namespace, dataset: DataSet) -> [int]:
+    nb_of_frames = len(dataset.get_temporal_set())
+
+    if arguments.frames is not None:
+        frames = arguments.frames
+    elif arguments.times is not None:
+        #   The frame displayed at a time is the last frame starting before it
+        frames = [dataset.get_frame_at(time) for time in arguments.times]
+    else:
+        frames = list(range(0, nb_of_frames, arguments.step))
+
+    for frame in frames:
+        if not 0 <= frame < nb_of_frames:
+            raise CliError("Frame {:d} is out of the recording (0 to {:d})".format(frame, nb_of_frames - 1),
+                           EXIT_USAGE_ERROR)
+
+    return frames
+
+
+#   Will compute metrics of a dataset (counts, durations, sensors statistics and center of mass trajectory)
+def compute_metrics(dataset: DataSet) -> dict:
+    temporal_set = np.asarray(dataset.get_temporal_set(), dtype=float)
+    statistics = dataset.get_statistics()
+    duration = float(temporal_set[-1] - temporal_set[0]) if len(temporal_set) > 0 else 0.0
+
+    metrics = {"nb_of_frames": len(temporal_set),
+               "nb_of_sensors": len(dataset.get_sensor_names()),
+               "duration": duration,
+               "mean_rate": (len(temporal_set) - 1) / duration if duration > 0 else None,
+               "map_width": dataset.get_map_width(),
+               "map_height": dataset.get_map_height(),
+               "min": dataset.get_sensor_set_min(),
+               "max": dataset.get_sensor_set_max(),
+               "sensors": [{"name": name,
+                            "min": float(sensor_min),
+                            "max": float(sensor_max),
+                            "mean": float(sensor_mean),
+                            "std": float(sensor_std),
+                            "median": float(sensor_median)}
+                           for name, sensor_min, sensor_max, sensor_mean, sensor_std, sensor_median
+                           in zip(dataset.get_sensor_names(),
+                                  statistics.get_min(0, len(temporal_set)),
+                                  statistics.get_max(0, len(temporal_set)),
+                                  statistics.get_mean(0, len(temporal_set)),
+                                  statistics.get_std(0, len(temporal_set)),
+                                  statistics.get_percentile(50, 0, len(temporal_set)))]}
+
+    #   Frames without any load have no center of mass
+    center_of_mass = np.empty((0, 2))
+
+    if dataset.is_ctr_of_mass_pos_calculated():
+        center_of_mass = np.asarray(dataset.get_c_o_m_positions(), dtype=float)[~dataset.get_c_o_m_zero_load_mask()]
+
+    if len(center_of_mass) > 0:
+        metrics["center_of_mass"] = {"nb_of_zero_load_frames": len(temporal_set) - len(center_of_mass),
+                                     "mean_x": float(center_of_mass[:, 0].mean()),
+                                     "mean_y": float(center_of_mass[:, 1].mean()),
+                                     "min_x": float(center_of_mass[:, 0].min()),
+                                     "max_x": float(center_of_mass[:, 0].max()),
+                                     "min_y": float(center_of_mass[:, 1].min()),
+                                     "max_y": float(center_of_mass[:, 1].max()),
+                                     "path_length": float(np.hypot(*np.diff(center_of_mass, axis=0).T).sum())}
+    else:
+        metrics["center_of_mass"] = None
+
+    return metrics
+
+
+"""
+
+            COMMANDS
+
+"""
+
+
+#   Import (and save into the cache unless --no-cache is given), optionally export a columnar file
+def command_import(arguments: argparse.Namespace) -> int:
+    model, svg_bg_path = import_model(arguments)
+    dataset = model.get_dataset()
+
+    if arguments.columnar is not None:
+        write_output(lambda: save_columnar(dataset, arguments.columnar, arguments.invert_y_axis, svg_bg_path))
+
+    print("{:d} sensors, {:d} frames".format(len(dataset.get_sensor_names()), model.get_steps_number()))
+    return EXIT_SUCCESS
+
+
+#   Export the trajectory of the center of mass as a CSV file (time, x, y) ("-" for the standard output)
+def command_com(arguments: argparse.Namespace) -> int:
+    dataset = import_model(arguments)[0].get_dataset()
+
+    if not dataset.is_ctr_of_mass_pos_calculated():
+        raise CliError("The center of mass cannot be computed for this recording", EXIT_DATA_ERROR)
+
+    def write_rows(file):
+        csv_writer = csv.writer(file)
+        csv_writer.writerow(["time", "x", "y"])
+
+        #   Frames without any load have no center of mass, their coordinates are left empty
+        for time, (x, y), zero_load in zip(dataset.get_temporal_set(),
+                                           dataset.get_c_o_m_positions().tolist(),
+                                           dataset.get_c_o_m_zero_load_mask()):
+            csv_writer.writerow([time, "", ""] if zero_load else [time, x, y])
+
+    if arguments.output == "-":
+        write_rows(sys.stdout)
+        return EXIT_SUCCESS
+
+    def write_com():
+        with open(arguments.output, 'w', newline='') as file:
+            write_rows(file)
+
+    write_output(write_com)
+    return EXIT_SUCCESS
+
+
+#   Export gaussian heatmap images of some frames
+def command_heatmap(arguments: argparse.Namespace) -> int:
+    dataset = import_model(arguments)[0].get_dataset()
+    frames = get_heatmap_frames(arguments, dataset)
+
+    #   Images are rendered without any display
+    import matplotlib
+    matplotlib.use("Agg")
+
+    try:
+        from gaussian_generation import generate_save_image
+
+    except ImportError as e:
+        raise CliError("Heatmaps cannot be generated: {0}".format(e), EXIT_FAILURE)
+
+    def write_heatmaps():
+        os.makedirs(arguments.output, exist_ok=True)
+
+        for frame in frames:
+            generate_save_image(dataset.get_centers(),
+                                dataset.get_sensors_normalized_values_at(frame),
+                                (dataset.get_map_width(), dataset.get_map_height()),
+                                os.path.join(arguments.output, "heatmap_{:06d}.jpg".format(frame)))
+
+    write_output(write_heatmaps)
+    return EXIT_SUCCESS
+
+
+#   Export metrics of the recording as a JSON file ("-" for the standard output)
+def command_metrics(arguments: argparse.Namespace) -> int:
+    metrics = json.dumps(compute_metrics(import_model(arguments)[0].get_dataset()), indent=4)
+
+    if arguments.output == "-":
+        print(metrics)
+        return EXIT_SUCCESS
+
+    def write_metrics():
+        with open(arguments.output, 'w') as file:
+            file.write(metrics)
+
+    write_output(write_metrics)
+    return EXIT_SUCCESS
+
+
+#   Will build the parser of the command-line interface
+def build_parser() -> argparse.ArgumentParser:
+    #   Options shared by every command, describing how data is imported
+    input_parser = argparse.ArgumentParser(add_help=False)
+    input_parser.add_argument("input", help="data file: CSV file (may be compressed), zip archive or columnar file")
+    input_parser.add_argument("--svg", help="SVG file describing the sensors (CSV+SVG import)")
+    input_parser.add_argument("--delimiter", help="CSV delimiter, used if it cannot be detected")
+    input_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                              help="number of processes decoding big files (default: number of CPUs)")
+    input_parser.add_argument("--no-cache", action="store_true", help="neither load from nor save into the cache")
+    input_parser.add_argument("--cache-directory", help="directory of the cache (default: user cache directory)")
+    input_parser.add_argument("--sensors", help="names of the sensors to import, separated by commas")
+    input_parser.add_argument("--time-range", type=float, nargs=2, metavar=("START", "END"),
+                              help="time range to import (in seconds)")
+    input_parser.add_argument("--resample-method", choices=[method.name for method in ResamplingMethod],
+                              default=ResamplingMethod.mean.name, help="resampling method (default: mean)")
+    resampling_group = input_parser.add_mutually_exclusive_group()
+    resampling_group.add_argument("--resample-rate", type=float, help="resample data to this rate (in Hz)")
+    resampling_group.add_argument("--decimate", type=int, help="resample data by this decimation factor")
+    input_parser.add_argument("--storage", choices=[storage_type.name for storage_type in StorageType],
+                              default=StorageType.float64.name,
+                              help="precision of stored values of sensors, float32 and int16 use less memory "
+                                   "(default: float64)")
+    input_parser.add_argument("--profile", help="save the profile of the import into this JSON file")
+    input_parser.add_argument("--verbose", action="store_true", help="print the phases of the import")
+
+    parser = argparse.ArgumentParser(prog="main.py",
+                                     description="Soles Data Visualisation, without arguments the graphical "
+                                                 "interface is launched",
+                                     epilog="Exit codes: 0 success, 1 failure, 2 usage error, 3 data error, "
+                                            "4 SVG error, 5 output error")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_command = commands.add_parser("import", parents=[input_parser],
+                                         help="import data (and save it into the cache)")
+    import_command.add_argument("--columnar", help="export the imported data as this columnar file")
+    import_command.add_argument("--invert-y-axis", action="store_true",
+                                help="store an inverted y-axis in the columnar file")
+    import_command.set_defaults(function=command_import)
+
+    com_command = commands.add_parser("com", parents=[input_parser],
+                                      help="export the center of mass trajectory as a CSV file")
+    com_command.add_argument("output", help="CSV file to write (- for the standard output)")
+    com_command.set_defaults(function=command_com)
+
+    heatmap_command = commands.add_parser("heatmap", parents=[input_parser],
+                                          help="export gaussian heatmap images")
+    heatmap_command.add_argument("output", help="directory where images are written")
+    frames_group = heatmap_command.add_mutually_exclusive_group(required=True)
+    frames_group.add_argument("--frames", type=int, nargs="+", help="indices of the frames to render")
+    frames_group.add_argument("--times", type=float, nargs="+", help="times (in seconds) of the frames to render")
+    frames_group.add_argument("--step", type=int, help="render one frame every STEP frames")
+    heatmap_command.set_defaults(function=command_heatmap)
+
+    metrics_command = commands.add_parser("metrics", parents=[input_parser],
+                                          help="export metrics of the recording as a JSON file")
+    metrics_command.add_argument("output", help="JSON file to write (- for the standard output)")
+    metrics_command.set_defaults(function=command_metrics)
+
+    return parser
+
+
+#   Will run the command-line interface with the given arguments
+#   Return the exit code
+def main(argv: [str]) -> int:
+    parser = build_parser()
+
+    try:
+        arguments = parser.parse_args(argv)
+
+    except SystemExit as e:
+        return EXIT_USAGE_ERROR if e.code else EXIT_SUCCESS
+
+    if arguments.command == "heatmap" and arguments.step is not None and arguments.step < 1:
+        print_error("--step must be at least 1")
+        return EXIT_USAGE_ERROR
+
+    try:
+        return arguments.function(arguments)
+
+    except CliError as e:
+        print_error(str(e))
+        return e.exit_code
+
+    except Exception as e:
+        print_error("An unexpected error occurred: {0}".format(e))
+        return EXIT_FAILURE
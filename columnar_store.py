@@ -0,0 +1,161 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the columnar on-disk format of a dataset
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import json
+import os
+import struct
+
+import numpy as np
+import svg.path as svg
+
+#   Import of custom modules
+from dataset import DataSet
+
+"""
+
+    Columnar file layout (.sdc)
+
+    All values are little-endian.
+
+        - Preamble (16 bytes): magic number (8 bytes), format version (uint32), header length (uint32)
+        - Header: a JSON document with names, positions, characteristics, map size and bounds of each sensor,
+          the y-axis inversion setting and the background paths
+        - Padding up to the next multiple of COLUMNAR_ALIGNMENT bytes
+        - Columns, each one contiguous and made of float64 values (one per sample):
+            temporal column, one raw column per sensor, one normalized column per sensor,
+            center of mass x column, center of mass y column (NaN for frames without any load)
+
+    Columns are opened with numpy.memmap so nothing is loaded up front, the OS page cache will only serve
+    the samples that are really read. Sensors columns are given to the dataset as transposed views, so a frame
+    of an opened file is a strided row (nothing is copied).
+
+"""
+
+COLUMNAR_MAGIC = b"SOLECOL\x00"
+COLUMNAR_VERSION = 1
+COLUMNAR_ALIGNMENT = 64
+COLUMNAR_DTYPE = np.dtype('<f8')
+
+__PREAMBLE_FORMAT = "<8sII"
+
+
+#   Will write the given dataset into a columnar file
+def save_columnar(dataset: DataSet, file_path: str, y_axis_inversion: bool = False,
+                  svg_bg_path: [svg.Path] = None) -> None:
+    nb_of_sensors = dataset.get_number_of_sensors()
+    nb_of_samples = len(dataset.get_temporal_set())
+
+    header = json.dumps({
+        "nb_of_samples": nb_of_samples,
+        "nb_of_sensors": nb_of_sensors,
+        "sensors_name": dataset.get_sensor_names(),
+        "sensors_positions": dataset.get_positions_array().tolist(),
+        "sensors_characteristics": [[int(x) for x in c] for c in dataset.get_sensors_characteristics()],
+        "sensors_bounds": [[float(x) for x in bounds]
+                           for bounds in zip(dataset.get_sensors_min(), dataset.get_sensors_max(),
+                                             dataset.get_sensors_min_normalized(),
+                                             dataset.get_sensors_max_normalized())],
+        "map_width": int(dataset.get_map_width()),
+        "map_height": int(dataset.get_map_height()),
+        "y_axis_inversion": y_axis_inversion,
+        "svg_bg_path": [path.d() for path in svg_bg_path or []]
+    }).encode()
+
+    preamble = struct.pack(__PREAMBLE_FORMAT, COLUMNAR_MAGIC, COLUMNAR_VERSION, len(header))
+    data_offset = -(-(len(preamble) + len(header)) // COLUMNAR_ALIGNMENT) * COLUMNAR_ALIGNMENT
+
+    #   Write into a temporary file first so an interrupted save never leaves a corrupted file
+    tmp_path = file_path + ".tmp"
+
+    try:
+        with open(tmp_path, 'wb') as file:
+            file.write(preamble)
+            file.write(header)
+            file.write(b"\x00" * (data_offset - len(preamble) - len(header)))
+
+            #   Each column is written one after the other
+            np.ascontiguousarray(dataset.get_temporal_set(), dtype=COLUMNAR_DTYPE).tofile(file)
+
+            for values in dataset.get_sensors_values_matrix().T:
+                np.ascontiguousarray(values, dtype=COLUMNAR_DTYPE).tofile(file)
+
+            for values in dataset.get_sensors_normalized_values_matrix().T:
+                np.ascontiguousarray(values, dtype=COLUMNAR_DTYPE).tofile(file)
+
+            c_o_m_positions = dataset.get_c_o_m_positions()
+            np.ascontiguousarray(c_o_m_positions[:, 0], dtype=COLUMNAR_DTYPE).tofile(file)
+            np.ascontiguousarray(c_o_m_positions[:, 1], dtype=COLUMNAR_DTYPE).tofile(file)
+
+        os.replace(tmp_path, file_path)
+
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+#   Will read the header of a columnar file
+#   Return the header and the offset of the first column
+def read_columnar_header(file_path: str) -> (dict, int):
+    preamble_size = struct.calcsize(__PREAMBLE_FORMAT)
+
+    with open(file_path, 'rb') as file:
+        preamble = file.read(preamble_size)
+
+        if len(preamble) != preamble_size:
+            raise Exception("COLUMNAR LOADER: File is too short to be a columnar file !")
+
+        magic, version, header_length = struct.unpack(__PREAMBLE_FORMAT, preamble)
+
+        if magic != COLUMNAR_MAGIC:
+            raise Exception("COLUMNAR LOADER: Not a columnar file !")
+
+        if version != COLUMNAR_VERSION:
+            raise Exception("COLUMNAR LOADER: Unsupported version of columnar file ({:d}) !".format(version))
+
+        header = json.loads(file.read(header_length).decode())
+
+    data_offset = -(-(preamble_size + header_length) // COLUMNAR_ALIGNMENT) * COLUMNAR_ALIGNMENT
+
+    return header, data_offset
+
+
+#   Will open a columnar file as a dataset, columns are memory-mapped and never copied
+#   Return the dataset, the y-axis inversion setting and the background paths stored in the file
+def open_columnar(file_path: str) -> (DataSet, bool, [svg.Path]):
+    header, data_offset = read_columnar_header(file_path)
+
+    nb_of_samples = header["nb_of_samples"]
+    nb_of_sensors = header["nb_of_sensors"]
+
+    if nb_of_samples < 1 or nb_of_sensors < 1:
+        raise Exception("COLUMNAR LOADER: No enough data in the columnar file !")
+
+    expected_size = data_offset + (1 + 2 * nb_of_sensors + 2) * nb_of_samples * COLUMNAR_DTYPE.itemsize
+    if os.path.getsize(file_path) < expected_size:
+        raise Exception("COLUMNAR LOADER: Columnar file is truncated !")
+
+    columns = np.memmap(file_path, dtype=COLUMNAR_DTYPE, mode='r', offset=data_offset,
+                        shape=(1 + 2 * nb_of_sensors + 2, nb_of_samples))
+
+    dataset = DataSet.from_precomputed(columns[0],
+                                       header["sensors_name"],
+                                       np.array(header["sensors_positions"], dtype=int),
+                                       header["sensors_characteristics"],
+                                       columns[1:nb_of_sensors + 1].T,
+                                       columns[nb_of_sensors + 1:2 * nb_of_sensors + 1].T,
+                                       columns[-2:].T,
+                                       header["map_width"],
+                                       header["map_height"],
+                                       header["sensors_bounds"])
+
+    return dataset, header["y_axis_inversion"], [svg.parse_path(path) for path in header["svg_bg_path"]]
@@ -9,27 +9,55 @@
 ------------------------------------------------------------------------------------------------------------------------
 """
 #   Import of basic modules
+import os
+import queue
 import threading
 import time
 import tkinter as tk
-from tkinter import Menu, messagebox
+from tkinter import Menu, messagebox, simpledialog
 from tkinter import filedialog as fd
 
 #   Import of custom modules
-from tkinter.filedialog import asksaveasfile
+from tkinter.filedialog import asksaveasfile, asksaveasfilename
+from svg.path import Path
 
+from columnar_store import save_columnar
 from dataset import DataSet
+from dataset_cache import DataSetCache
 from gaussian_generation import generate_save_image
-from import_module import DataImportModule
+from import_module import DataImportModule, BatchImportResult, list_batch_files
+from import_profiler import ImportProfiler
+from import_progress import ImportProgress, ImportPhase, ImportCancelled
+from import_selection import ImportSelection
 from model import Model, PlaySpeed
+from resampling import ResamplingMethod, ResamplingSettings
+from svg_layout import SvgLayoutRegistry
 from utils import multiple_svg_path_to_grp_pts, get_color_gradient_array, get_color_hex_array, \
-    get_formatted_timestamp_from_value, extract_positive_numerical_value
+    get_formatted_timestamp_from_value, extract_positive_numerical_value, zip_contains, get_available_memory
 from views.confirm_config_pop_up import ConfirmConfigPopUp
 from views.control_panel_view import ControlPanel
+from views.import_profile_pop_up import ImportProfilePopUp
 from views.main_view import MainView
 from views.sensors_graph_view import SensorsGraphView
 from views.sensors_map_view import SensorsMapView
 
+#   Delay (in milliseconds) between two checks of the import thread messages
+IMPORT_POLL_DELAY = 50
+
+#   Number of frames between two checks of the import cancellation during the cache generation
+CACHE_CANCELLATION_CHECK_PERIOD = 1024
+
+#   Delay (in milliseconds) between two reads of a followed data file
+FOLLOW_POLL_DELAY = 250
+
+#   Default memory (in bytes) holding the frames of a followed data file, the oldest frames are dropped beyond it
+#   It never exceeds a share of the physical memory available when the application starts
+FOLLOW_MEMORY_LIMIT = 256 * 1024 * 1024
+FOLLOW_AVAILABLE_MEMORY_SHARE = 0.5
+
+#   Maximum number of file errors listed at the end of a batch import
+BATCH_MAX_LISTED_ERRORS = 10
+
 """
 
     Controller
@@ -52,10 +80,27 @@ class Controller:
     __thread_ask_stop_flag: bool
     __thread_ask_wait_flag: bool
     __thread_wait_status_flag: bool
-    __sensor_color_cache: [[str]]
-    __timestamp_cache: [str]
+    #   Caches are None while a data file is followed, colors and timestamps are then computed when a step is drawn
+    __sensor_color_cache: list[list[str]] | None
+    __timestamp_cache: list[str] | None
     __bg_pts_grps: [[[int, int]]]
+    __svg_bg_path: [Path]
+    __y_axis_inverted: bool
     __data_loaded: bool
+    __import_progress: ImportProgress | None
+    __import_queue: queue.Queue
+    __followed_import_module: DataImportModule | None
+    #   Frames dropped from the start of the followed dataset that have already been removed from caches
+    __nb_of_dropped_frames: int
+    __svg_layout_registry: SvgLayoutRegistry
+    __batch_result: BatchImportResult | None
+    __resampling: ResamplingSettings | None
+    __resampling_choice: tk.StringVar
+    __selection: ImportSelection | None
+    #   Memory (in bytes) holding the frames of a followed data file
+    __follow_memory_limit: int
+    __profile_imports: tk.BooleanVar
+    __last_import_profile: tuple[ImportProfiler, dict] | None
 
     """
 
@@ -72,6 +117,11 @@ class Controller:
         self.__window.minsize(800, 600)
         self.__window.resizable(True, True)
 
+        self.__resampling = None
+        self.__selection = None
+        self.__last_import_profile = None
+        self.__follow_memory_limit = self.__get_default_follow_memory_limit()
+
         #   Init toolbar and main ui
         self.__init_ui__()
         self.__toolbar_init__()
@@ -79,6 +129,12 @@ class Controller:
         self.__window.bind('<Configure>', self.on_resize)
         self.__data_loaded = False
         self.__thread_ask_stop_flag = False
+        self.__import_progress = None
+        self.__import_queue = queue.Queue()
+        self.__followed_import_module = None
+        self.__nb_of_dropped_frames = 0
+        self.__svg_layout_registry = SvgLayoutRegistry()
+        self.__batch_result = None
 
     """
 
@@ -116,7 +172,34 @@ class Controller:
                                 command=lambda: self.on_import(DataImportModule.ImportTypes.Full_File))
         import_menu.add_command(label="Data file + SVG file",
                                 command=lambda: self.on_import(DataImportModule.ImportTypes.Data_SVG_Files))
+        import_menu.add_command(label="Columnar file",
+                                command=lambda: self.on_import(DataImportModule.ImportTypes.Columnar_File))
+        import_menu.add_command(label="Follow data file + SVG file",
+                                command=lambda: self.on_import(DataImportModule.ImportTypes.Followed_Data_SVG_Files))
+        import_menu.add_command(label="Directory of data files + SVG file",
+                                command=lambda: self.on_import(DataImportModule.ImportTypes.Batch_Data_SVG_Files))
         file_menu.add_cascade(label="Import data", menu=import_menu)
+
+        #   Declare resampling menu, the choice applies to the next imports
+        self.__resampling_choice = tk.StringVar(value="None")
+        resampling_menu = Menu(file_menu, tearoff=False)
+        resampling_menu.add_radiobutton(label="None", variable=self.__resampling_choice, value="None",
+                                        command=lambda: self.__on_change_resampling(None))
+
+        for method in ResamplingMethod:
+            resampling_menu.add_radiobutton(label=method.value[1], variable=self.__resampling_choice,
+                                            value=method.value[1],
+                                            command=lambda m=method: self.__on_change_resampling(m))
+
+        file_menu.add_cascade(label="Resampling", menu=resampling_menu)
+        file_menu.add_command(label="Sensors and time selection", command=self.__on_change_selection)
+        file_menu.add_command(label="Followed data file memory", command=self.__on_change_follow_memory_limit)
+        file_menu.add_command(label="Export columnar file", command=self.on_export_columnar)
+
+        #   Profiling of imports, the profile is shown once the import is over
+        self.__profile_imports = tk.BooleanVar(value=False)
+        file_menu.add_checkbutton(label="Profile imports", variable=self.__profile_imports)
+        file_menu.add_command(label="Last import profile", command=self.__show_last_import_profile)
         file_menu.add_command(label="Reset", command=self.on_reset)
         file_menu.add_command(label="Exit", command=self.on_exit)
 
@@ -149,6 +232,9 @@ class Controller:
     def get_model(self) -> Model:
         return self.__model
 
+    def get_batch_result(self) -> BatchImportResult | None:
+        return self.__batch_result
+
     """
 
             CONTROLLER CALLBACK FUNCTIONS INITIALIZATION SECTION (FOR MAIN ACTIONS)
@@ -157,13 +243,29 @@ class Controller:
 
     #   Will be executed when the user ask to import data into the software
     def on_import(self, import_type: DataImportModule.ImportTypes) -> None:
+        #   Only one import at a time
+        if self.__import_progress is not None:
+            messagebox.showinfo("Import in progress",
+                                "An import is already in progress, wait for its end or cancel it")
+            return
+
         self.on_reset()
 
+        #   A columnar file contains everything, nothing else will be asked
+        if import_type == DataImportModule.ImportTypes.Columnar_File:
+            self.__on_import_columnar()
+            return
+
+        #   A batch needs a directory of CSV files instead of a single one
+        if import_type == DataImportModule.ImportTypes.Batch_Data_SVG_Files:
+            self.__on_import_batch()
+            return
+
         #   Begin by ask the CSV file which will be  needed in both cases
         filename = fd.askopenfilename(
             title='Open a data file',
             initialdir='~/',
-            filetypes=(("CSV Files", ".csv"),))
+            filetypes=(("CSV Files", ".csv"), ("Compressed CSV Files", (".gz", ".xz", ".zip"))))
 
         #   The user didn't select anything or just close the dialog
         #   So we just abort the function
@@ -172,35 +274,33 @@ class Controller:
                                  "You need to select an CSV file to continue")
             return
 
-        import_module: DataImportModule = DataImportModule()
+        import_module: DataImportModule = DataImportModule(DataSetCache(), os.cpu_count() or 1,
+                                                           self.__svg_layout_registry, self.__resampling,
+                                                           self.__selection, self.__follow_memory_limit)
 
-        if import_type == DataImportModule.ImportTypes.Full_File:
-            self.__model = import_module.get_model_ff(filename,
-                                                      #  On delimiter error, ask user to enter the delimiter
-                                                      lambda: self.__main_view.ask_for_csv_settings([("Comma", ','),
-                                                                                                     ("Semi-colon", ';'),
-                                                                                                     ("Colon", '.'),
-                                                                                                     ("Tabulation",
-                                                                                                    '\t')]),
-                                                      #  On errors that cannot be handled
-                                                      lambda x: messagebox.showerror("CSV ERROR",
-                                                                                     "An error occurred during the analysis of the given CSV file\n {0}".format(
-                                                                                         x)))
-
-            #   An error or an user abortion happened during the import of the file
-            #   So we will stop the progression here
-            if self.__model is None:
-                return
+        #  On delimiter error, ask user to enter the delimiter
+        on_delimiters_error = self.__on_main_thread(lambda: self.__main_view.ask_for_csv_settings([("Comma", ','),
+                                                                                                   ("Semi-colon", ';'),
+                                                                                                   ("Colon", '.'),
+                                                                                                   ("Tabulation",
+                                                                                                    '\t')]))
 
-            #   For this type of import there is no bg "image"
-            self.__bg_pts_grps = None
+        if import_type == DataImportModule.ImportTypes.Full_File:
+            self.__start_import_job(lambda progress: self.__import_ff(import_module, filename,
+                                                                      on_delimiters_error, progress),
+                                    {"type": import_type.name, "files": [filename]})
 
         else:
+            #   A zip archive may contain the SVG file with the CSV file, nothing else is asked then
+            if zip_contains(filename, ".svg"):
+                filename_svg = filename
+
             #   Begin by ask the CSV file which will be  needed in both cases
-            filename_svg = fd.askopenfilename(
-                title='Open a SVG file',
-                initialdir='~/',
-                filetypes=(("SVG Files", ".svg"),))
+            else:
+                filename_svg = fd.askopenfilename(
+                    title='Open a SVG file',
+                    initialdir='~/',
+                    filetypes=(("SVG Files", ".svg"), ("Compressed SVG Files", (".gz", ".xz", ".zip"))))
             print(filename_svg)
             #   The user didn't select anything or just close the dialog
             #   So we just abort the function
@@ -209,43 +309,309 @@ class Controller:
                                      "You need to select an SVG file to continue")
                 return
 
-            importation_result = import_module.get_model_dsf(filename,
-                                                             filename_svg,
-                                                             #  On delimiter error, ask user to enter the delimiter
-                                                             lambda: self.__main_view.ask_for_csv_settings(
-                                                                 [("Comma", ','),
-                                                                  ("Semi-colon", ';'),
-                                                                  ("Colon", '.'),
-                                                                  ("Tabulation",
-                                                                   '\t')]),
-                                                             #  On errors that cannot be handled during SVG analysis
-                                                             lambda x: messagebox.showerror("ERROR",
-                                                                                            "An error occurred during the analysis of the given SVG file\n {0}".format(x)),
-                                                             #  When no background path has been found
-                                                             lambda: messagebox.showinfo("No background found",
-                                                                                          "The analysis of the SVG haven't revealed background path, don't forget to put \"BG_PATH\" in the id of the path to get a background"),
-                                                             #  On errors that cannot be handled during CSV analysis
-                                                             lambda x: messagebox.showerror("ERROR",
-                                                                                            "An error occurred during the analysis of the given CSV file\n {0}".format(x)))
-
-            #   An error or an user abortion happened during the import of the files
-            #   So we will stop the progression here
-            if importation_result is None:
-                return
+            #   The data file will be followed after its import, new rows will be imported as they are written
+            follow = import_type == DataImportModule.ImportTypes.Followed_Data_SVG_Files
+
+            if follow:
+                self.__followed_import_module = import_module
+
+            self.__start_import_job(lambda progress: self.__import_dsf(import_module, filename, filename_svg,
+                                                                       on_delimiters_error, progress, follow),
+                                    {"type": import_type.name, "files": [filename, filename_svg]}, not follow)
+
+    #   Will import a full CSV file (executed by the import thread)
+    #   Will return the model, the background paths and the y-axis inversion setting or None on error
+    def __import_ff(self, import_module: DataImportModule,
+                    filename: str,
+                    on_delimiters_error: 'function',
+                    progress: ImportProgress):
+        try:
+            model = import_module.get_model_ff(filename,
+                                               on_delimiters_error,
+                                               #  On errors that cannot be handled
+                                               self.__on_main_thread(lambda x: messagebox.showerror("CSV ERROR",
+                                                                                                    "An error occurred during the analysis of the given CSV file\n {0}".format(
+                                                                                                        x))),
+                                               progress)
+
+        #   The error has already been reported by the import module
+        except ImportCancelled:
+            raise
+
+        except Exception:
+            return None
+
+        #   For this type of import there is no bg "image" and the y-axis is inverted
+        return model, [], True
+
+    #   Will import a CSV + SVG files pair (executed by the import thread)
+    #   If follow is True, the CSV file will be kept open to follow rows appended to it
+    #   Will return the model, the background paths and the y-axis inversion setting or None on error
+    def __import_dsf(self, import_module: DataImportModule,
+                     filename: str, filename_svg: str,
+                     on_delimiters_error: 'function',
+                     progress: ImportProgress,
+                     follow: bool = False):
+        import_function = import_module.follow_dsf if follow else import_module.get_model_dsf
+
+        importation_result = import_function(filename,
+                                             filename_svg,
+                                             on_delimiters_error,
+                                             #  On errors that cannot be handled during SVG analysis
+                                             self.__on_main_thread(lambda x: messagebox.showerror("ERROR",
+                                                                                                  "An error occurred during the analysis of the given SVG file\n {0}".format(x))),
+                                             #  When no background path has been found
+                                             self.__on_main_thread(lambda: messagebox.showinfo("No background found",
+                                                                                               "The analysis of the SVG haven't revealed background path, don't forget to put \"BG_PATH\" in the id of the path to get a background")),
+                                             #  On errors that cannot be handled during CSV analysis
+                                             self.__on_main_thread(lambda x: messagebox.showerror("ERROR",
+                                                                                                  "An error occurred during the analysis of the given CSV file\n {0}".format(x))),
+                                             progress)
+
+        #   An error happened during the import of the files
+        if importation_result is None:
+            return None
+
+        #   For this type of import the y-axis is not inverted
+        return importation_result[0], importation_result[1], False
+
+    #   Will be executed when the user ask to import a columnar file
+    def __on_import_columnar(self) -> None:
+        filename = fd.askopenfilename(
+            title='Open a columnar data file',
+            initialdir='~/',
+            filetypes=(("Columnar Files", ".sdc"),))
+
+        #   The user didn't select anything or just close the dialog
+        #   So we just abort the function
+        if filename == "" or filename == "()":
+            messagebox.showerror("Columnar file needed",
+                                 "You need to select a columnar file to continue")
+            return
+
+        self.__start_import_job(lambda progress: self.__import_columnar(filename, progress),
+                                {"type": DataImportModule.ImportTypes.Columnar_File.name, "files": [filename]})
+
+    #   Will import a columnar file (executed by the import thread)
+    #   Will return the model, the background paths and the y-axis inversion setting or None on error
+    def __import_columnar(self, filename: str, progress: ImportProgress):
+        importation_result = DataImportModule().get_model_columnar(filename,
+                                                                   #  On errors that cannot be handled
+                                                                   self.__on_main_thread(lambda x: messagebox.showerror("ERROR",
+                                                                                                                        "An error occurred during the analysis of the given columnar file\n {0}".format(x))),
+                                                                   progress)
+
+        #   An error happened during the import of the file
+        if importation_result is None:
+            return None
+
+        model, y_axis_inverted, svg_bg_path = importation_result
+        return model, svg_bg_path, y_axis_inverted
+
+    #   Will be executed when the user ask to import a directory of CSV files sharing the same SVG file
+    def __on_import_batch(self) -> None:
+        directory = fd.askdirectory(title='Open a directory of data files', initialdir='~/')
+
+        #   The user didn't select anything or just close the dialog
+        #   So we just abort the function
+        if directory == "" or directory == "()":
+            messagebox.showerror("Directory needed",
+                                 "You need to select a directory of CSV files to continue")
+            return
 
-            #   Decompose importation result
-            self.__model, svg_path_data = importation_result
-            self.__bg_pts_grps = multiple_svg_path_to_grp_pts(svg_path_data)
+        filename_svg = fd.askopenfilename(
+            title='Open a SVG file',
+            initialdir='~/',
+            filetypes=(("SVG Files", ".svg"), ("Compressed SVG Files", (".gz", ".xz", ".zip"))))
+
+        if filename_svg == "" or filename_svg == "()":
+            messagebox.showerror("SVG file needed",
+                                 "You need to select an SVG file to continue")
+            return
 
-        #   Ask for a confirmation of the de-parsed data
+        import_module: DataImportModule = DataImportModule(DataSetCache(), os.cpu_count() or 1,
+                                                           self.__svg_layout_registry, self.__resampling,
+                                                           self.__selection)
+
+        self.__start_import_job(lambda progress: self.__import_batch(import_module, directory, filename_svg,
+                                                                     progress),
+                                {"type": DataImportModule.ImportTypes.Batch_Data_SVG_Files.name,
+                                 "files": [directory, filename_svg]})
+
+    #   Will import a directory of CSV files sharing the same SVG file (executed by the import thread)
+    #   Errors are reported once for the whole batch, the first imported dataset is then visualised
+    #   Will return the model, the background paths and the y-axis inversion setting or None on error
+    def __import_batch(self, import_module: DataImportModule,
+                       directory: str, filename_svg: str,
+                       progress: ImportProgress):
+        file_paths = list_batch_files(directory)
+
+        if len(file_paths) == 0:
+            self.__on_main_thread(lambda: messagebox.showerror("CSV files needed",
+                                                               "No CSV file has been found in the selected directory"))()
+            return None
+
+        batch_result = import_module.get_datasets_batch(file_paths,
+                                                        filename_svg,
+                                                        #  On errors that cannot be handled during SVG analysis
+                                                        self.__on_main_thread(lambda x: messagebox.showerror("ERROR",
+                                                                                                             "An error occurred during the analysis of the given SVG file\n {0}".format(x))),
+                                                        #  After each file, only the progress is updated
+                                                        lambda file_path, nb_of_files_done, nb_of_files, error:
+                                                        self.__import_queue.put(("status", "Importing data files ({:d}/{:d})".format(nb_of_files_done, nb_of_files))),
+                                                        progress)
+
+        #   An error happened during the analysis of the SVG file
+        if batch_result is None:
+            return None
+
+        self.__batch_result = batch_result
+
+        errors = batch_result.get_errors()
+
+        if len(errors) > 0:
+            errors_description = "\n".join("{:s}: {}".format(os.path.basename(file_path), error)
+                                           for file_path, error in list(errors.items())[:BATCH_MAX_LISTED_ERRORS])
+
+            if len(errors) > BATCH_MAX_LISTED_ERRORS:
+                errors_description += "\n..."
+
+            self.__on_main_thread(lambda: messagebox.showwarning("Batch import",
+                                                                 "{:d} file(s) imported, {:d} file(s) failed:\n{:s}".format(
+                                                                     len(batch_result), len(errors),
+                                                                     errors_description)))()
+
+        if len(batch_result) == 0:
+            return None
+
+        #   For this type of import the y-axis is not inverted
+        return Model(next(iter(batch_result.get_datasets().values())), import_module), \
+            batch_result.get_svg_bg_path(), False
+
+    #   Ask for a confirmation of the de-parsed data
+    def __ask_for_config_confirmation(self, y_axis_inverted: bool) -> None:
         ConfirmConfigPopUp(self.__main_view,
                            #    On confirm, will initialize sensors_map_ui and need to know
                            #    if the y-axis need to be inverted
-                           lambda: self.__on_config_confirmed(import_type == DataImportModule.ImportTypes.Full_File),
+                           lambda: self.__on_config_confirmed(y_axis_inverted),
                            #    If the user simply close or exit the window
                            self.__on_loading_cancel,
                            self.__on_manual_config).show(self.__model.get_dataset())
 
+    #   When user choose how the next imports will be resampled (None to import data as it is)
+    #   The target rate (or the decimation factor) is asked, the previous choice is kept if nothing valid is given
+    def __on_change_resampling(self, method: ResamplingMethod | None) -> None:
+        if method is None:
+            self.__resampling = None
+            return
+
+        answer = simpledialog.askstring("Resampling",
+                                        "Target rate in Hz (e.g. 100)\nor decimation factor preceded by / (e.g. /20)",
+                                        parent=self.__window)
+
+        try:
+            if answer is None:
+                raise Exception("Resampling has been cancelled")
+
+            answer = answer.strip()
+
+            if answer.startswith("/"):
+                self.__resampling = ResamplingSettings(method, decimation_factor=int(answer[1:]))
+            else:
+                self.__resampling = ResamplingSettings(method, target_rate=float(answer))
+
+        except Exception as e:
+            if answer is not None:
+                messagebox.showerror("Wrong value entered",
+                                     "The value must be a positive rate or a decimation factor\n {0}".format(e))
+
+        #   Show the settings really used
+        self.__resampling_choice.set("None" if self.__resampling is None
+                                     else self.__resampling.get_method().value[1])
+
+    #   When user choose which sensors and which time range will be imported by the next imports
+    #   Empty answers select every sensor or the whole recording, the previous selection is kept on cancellation
+    def __on_change_selection(self) -> None:
+        current_names = "" if self.__selection is None or self.__selection.get_sensors_name() is None \
+            else ", ".join(self.__selection.get_sensors_name())
+        current_range = "" if self.__selection is None or self.__selection.get_time_range() is None \
+            else "{:g} {:g}".format(*self.__selection.get_time_range())
+
+        answered_names = simpledialog.askstring("Sensors selection",
+                                                "Names of the sensors to import separated by commas\n"
+                                                "(empty to import every sensor)",
+                                                initialvalue=current_names, parent=self.__window)
+
+        if answered_names is None:
+            return
+
+        answered_range = simpledialog.askstring("Time selection",
+                                                "Start and end (in seconds) of the time range to import\n"
+                                                "separated by a space (empty to import the whole recording)",
+                                                initialvalue=current_range, parent=self.__window)
+
+        if answered_range is None:
+            return
+
+        try:
+            sensors_name = [name.strip() for name in answered_names.split(",") if name.strip() != ""]
+            time_range = [float(value) for value in answered_range.split()]
+
+            if len(time_range) not in (0, 2):
+                raise Exception("Both start and end of the time range must be given")
+
+            if len(sensors_name) == 0 and len(time_range) == 0:
+                self.__selection = None
+            else:
+                self.__selection = ImportSelection(sensors_name if len(sensors_name) > 0 else None,
+                                                   tuple(time_range) if len(time_range) > 0 else None)
+
+        except Exception as e:
+            messagebox.showerror("Wrong value entered",
+                                 "The selection cannot be used\n {0}".format(e))
+
+    #   When user choose the memory holding the frames of the next followed data files, the previous one is kept on
+    #   cancellation
+    def __on_change_follow_memory_limit(self) -> None:
+        answered_memory = simpledialog.askinteger("Followed data file memory",
+                                                  "Memory (in MB) holding the frames of a followed data file\n"
+                                                  "(the oldest frames are dropped beyond it)",
+                                                  initialvalue=self.__follow_memory_limit // (1024 * 1024),
+                                                  minvalue=1, parent=self.__window)
+
+        if answered_memory is not None:
+            self.__follow_memory_limit = answered_memory * 1024 * 1024
+
+    #   Get the default memory (in bytes) holding the frames of a followed data file (see FOLLOW_MEMORY_LIMIT)
+    @staticmethod
+    def __get_default_follow_memory_limit() -> int:
+        available_memory = get_available_memory()
+
+        if available_memory is None:
+            return FOLLOW_MEMORY_LIMIT
+
+        return max(1024 * 1024, min(FOLLOW_MEMORY_LIMIT, int(available_memory * FOLLOW_AVAILABLE_MEMORY_SHARE)))
+
+    #   When user want to export the loaded data as a columnar file
+    def on_export_columnar(self) -> None:
+        if not self.__data_loaded:
+            messagebox.showerror("No data loaded",
+                                 "You need to import data before exporting it")
+            return
+
+        filename = asksaveasfilename(defaultextension=".sdc", filetypes=(("Columnar Files", ".sdc"),))
+
+        #   The user didn't select anything or just close the dialog
+        if filename == "" or filename == "()":
+            return
+
+        try:
+            save_columnar(self.get_dataset(), filename, self.__y_axis_inverted, self.__svg_bg_path)
+
+        except Exception as e:
+            messagebox.showerror("ERROR",
+                                 "An error occurred during the export of the columnar file\n {0}".format(e))
+
     #   When user want to generate gaussian visualisation as an image
     def on_gaussian_image_gen(self) -> None:
         self.get_model().pause()
@@ -265,13 +631,15 @@ class Controller:
 
             current_step = self.__model.get_current_step_number()
             self.__draw_sensors(len(self.get_dataset().get_sensor_names()),
-                                self.__sensor_color_cache[current_step])
+                                self.__get_sensors_colors(current_step))
             self.__sensors_map.draw_center_of_mass(current_step)
 
         self.__thread_ask_wait_flag = True
 
     #   Will be executed everytime the user ask to reset or everytime data is loaded
     def on_reset(self) -> None:
+        self.__stop_following()
+
         if self.__data_loaded:
             self.__data_loaded = False
             if self.__thread is not None:
@@ -293,6 +661,9 @@ class Controller:
 
     #   When the window is closed
     def on_exit(self) -> None:
+        if self.__import_progress is not None:
+            self.__import_progress.cancel()
+
         self.on_reset()
         self.__window.quit()
 
@@ -307,12 +678,12 @@ class Controller:
         for i in range(sensors_number):
             self.__sensors_map.draw_sensor(i, sensors_color[i], sensors_names[i])
 
-        self.__sensors_map.draw_sensor_names(self.get_dataset().get_centers(),
+        self.__sensors_map.draw_sensor_names(self.get_dataset().get_centers_array(),
                                              sensors_names)
 
     def __update_sensors(self, step_number: int) -> None:
         sensors_names = self.get_dataset().get_sensor_names()
-        sensors_colors = self.__sensor_color_cache[step_number]
+        sensors_colors = self.__get_sensors_colors(step_number)
 
         for i in range(self.get_dataset().get_number_of_sensors()):
             self.__sensors_map.update_sensor(sensors_colors[i], sensors_names[i])
@@ -339,7 +710,7 @@ class Controller:
                 self.__update_sensors(current_step)
                 self.__sensors_map.draw_center_of_mass(current_step)
 
-                self.__control_panel.update_actual_time_label(self.__timestamp_cache[current_step])
+                self.__control_panel.update_actual_time_label(self.__get_timestamp(current_step))
                 self.__control_panel.update_actual_time_scale(current_step)
 
                 #   Put visualisation in pause if a play bound as been reached
@@ -348,10 +719,14 @@ class Controller:
 
                 #   We will check if the drawing time to compare it to the wait time
                 #   If the drawing time is greater than the wait time, we skip the wait otherwise we wait
+                #   If the drawing was longer, steps whose time has already passed are skipped
                 else:
                     sleep_time = self.__model.get_time_next() - (time.time() - start_time)
                     if sleep_time > 0:
                         time.sleep(sleep_time)
+                    else:
+                        self.__model.skip_time(time.time() - start_time)
+                        continue
 
                 self.__model.next_step()
 
@@ -364,31 +739,292 @@ class Controller:
         self.__model.play()
 
         self.__draw_sensors(self.get_dataset().get_number_of_sensors(),
-                            self.__sensor_color_cache[self.__model.get_current_step_number()])
+                            self.__get_sensors_colors(self.__model.get_current_step_number()))
     """
     
         CACHE GENERATION SECTION
         
     """
 
-    #   Will generate the cache containing each color value of each sensor at each period
-    def __update_colors_cache(self):
-        self.__sensor_color_cache = list()
+    #   Will generate the cache containing each color value of each sensor at each period from the given one
+    #   If a progress is given, the cancellation of the import is checked regularly
+    @staticmethod
+    def __generate_colors_cache(dataset: DataSet, first_period: int = 0,
+                                progress: ImportProgress | None = None) -> [[str]]:
+        sensor_color_cache = list()
+
+        for index in range(first_period, len(dataset.get_temporal_set())):
+
+            if progress is not None and index % CACHE_CANCELLATION_CHECK_PERIOD == 0:
+                progress.check_cancelled()
+
+            sensor_color_cache.append(Controller.__get_colors(dataset, index))
+
+        return sensor_color_cache
+
+    #   Will generate the cache containing the formatted timestamp of each period from the given one
+    @staticmethod
+    def __generate_timestamps_cache(dataset: DataSet, first_period: int = 0) -> [str]:
+        timestamp_cache = list()
+
+        temporal_set = dataset.get_temporal_set()
+
+        for value in temporal_set[first_period:]:
+            timestamp_cache.append(get_formatted_timestamp_from_value(value))
 
-        for index in range(self.__model.get_steps_number()):
+        return timestamp_cache
 
-            tmp = self.__model.get_dataset().get_sensors_normalized_values_at(index)
-            tmp = get_color_gradient_array(tmp)
-            self.__sensor_color_cache.append(get_color_hex_array(tmp))
+    #   Will compute the color value of each sensor at the given period
+    @staticmethod
+    def __get_colors(dataset: DataSet, index: int) -> [str]:
+        return get_color_hex_array(get_color_gradient_array(dataset.get_sensors_normalized_values_at(index)))
 
-    #   Will generate the cache containing the formatted timestamp of each period
-    def __update_timestamps_cache(self):
-        self.__timestamp_cache = list()
+    #   Get the color value of each sensor at the given step, computed from the dataset if colors are not cached
+    def __get_sensors_colors(self, step_number: int) -> [str]:
+        if self.__sensor_color_cache is None:
+            return self.__get_colors(self.get_dataset(), step_number)
 
-        temporal_set = self.get_dataset().get_temporal_set()
+        return self.__sensor_color_cache[step_number]
 
-        for value in temporal_set:
-            self.__timestamp_cache.append(get_formatted_timestamp_from_value(value))
+    #   Get the formatted timestamp of the given step, computed from the dataset if timestamps are not cached
+    def __get_timestamp(self, step_number: int) -> str:
+        if self.__timestamp_cache is None:
+            return get_formatted_timestamp_from_value(self.get_dataset().get_temporal_set()[step_number])
+
+        return self.__timestamp_cache[step_number]
+
+    """
+
+            IMPORT THREADING SECTION
+
+    """
+
+    #   Will give a function that, once called from the import thread, runs the given function on the Tk main thread
+    #   and waits for its result (Tk must only be used from the main thread)
+    def __on_main_thread(self, function: 'function') -> 'function':
+        def call(*args):
+            result = []
+            done = threading.Event()
+
+            self.__import_queue.put(("call", lambda: result.append(function(*args)), done))
+            done.wait()
+
+            return result[0] if len(result) > 0 else None
+
+        return call
+
+    #   Will launch an import in a background thread and show its progress
+    #   import_function will be called with the progress and must return the model, the background paths and the
+    #   y-axis inversion setting or None on error
+    #   If imports are profiled, import_information (e.g. the type of import and its files) is kept with the profile
+    #   If cached is False, colors and timestamps of the imported data are not put in cache (e.g. for a followed data
+    #   file, they are computed when a step is drawn)
+    def __start_import_job(self, import_function: 'function', import_information: dict = None,
+                           cached: bool = True) -> None:
+        profiler = ImportProfiler() if self.__profile_imports.get() else None
+
+        if profiler is not None:
+            self.__last_import_profile = (profiler, import_information or {})
+
+        self.__import_progress = ImportProgress(lambda phase: self.__import_queue.put(("phase", phase)), profiler)
+        self.__import_queue = queue.Queue()
+
+        self.__main_view.show_import_progress(len(ImportPhase), self.__on_import_cancel)
+
+        threading.Thread(name="import_handler",
+                         target=self.__executable_import_thread,
+                         args=(import_function, self.__import_progress, cached),
+                         daemon=True).start()
+
+        self.__window.after(IMPORT_POLL_DELAY, self.__poll_import_job)
+
+    #   Executed by the import thread, the finished model is handed back only once all caches are built
+    def __executable_import_thread(self, import_function: 'function', progress: ImportProgress,
+                                   cached: bool = True) -> None:
+        try:
+            importation_result = import_function(progress)
+
+            #   An error happened and has already been reported
+            if importation_result is None:
+                progress.finish()
+                self.__import_queue.put(("failed",))
+                return
+
+            model, svg_bg_path, y_axis_inverted = importation_result
+
+            progress.start_phase(ImportPhase.caches)
+            sensor_color_cache = None
+            timestamp_cache = None
+
+            if cached:
+                sensor_color_cache = self.__generate_colors_cache(model.get_dataset(), progress=progress)
+                timestamp_cache = self.__generate_timestamps_cache(model.get_dataset())
+
+            #   Summaries drawn by the graph are built here rather than when the graph is drawn by the interface
+            model.get_dataset().get_min_max_pyramid()
+            progress.check_cancelled()
+
+            progress.finish()
+            self.__import_queue.put(("done", model, svg_bg_path, y_axis_inverted, sensor_color_cache, timestamp_cache))
+
+        except ImportCancelled:
+            progress.finish()
+            print("Import cancelled...")
+            self.__import_queue.put(("cancelled",))
+
+        except Exception as e:
+            progress.finish()
+            print("An error occurred during the import")
+            print("\tException: {0}".format(e))
+            self.__import_queue.put(("failed",))
+
+    #   Executed regularly on the main thread while an import is in progress to handle import thread messages
+    def __poll_import_job(self) -> None:
+        while not self.__import_queue.empty():
+            message = self.__import_queue.get()
+
+            if message[0] == "phase":
+                self.__main_view.update_import_progress(message[1].value[1], message[1].value[0])
+
+            elif message[0] == "status":
+                current_phase = self.__import_progress.get_current_phase()
+                self.__main_view.update_import_progress(message[1],
+                                                        current_phase.value[0] if current_phase is not None else -1)
+
+            elif message[0] == "call":
+                try:
+                    message[1]()
+
+                except Exception as e:
+                    print("An error occurred during a call from the import thread")
+                    print("\tException: {0}".format(e))
+
+                finally:
+                    message[2].set()
+
+            elif message[0] == "done":
+                self.__import_progress = None
+                self.__main_view.hide_import_progress()
+                self.__on_import_done(*message[1:])
+                return
+
+            else:
+                self.__import_progress = None
+                self.__main_view.hide_import_progress()
+                self.__on_import_failed()
+                return
+
+        self.__window.after(IMPORT_POLL_DELAY, self.__poll_import_job)
+
+    #   When the user ask to cancel the import in progress
+    def __on_import_cancel(self) -> None:
+        if self.__import_progress is not None:
+            self.__import_progress.cancel()
+            self.__main_view.update_import_progress("Cancelling...")
+
+    #   When the import thread has failed or has been cancelled, nothing can be followed
+    def __on_import_failed(self) -> None:
+        self.__stop_following()
+
+    #   When the import thread has finished, everything is ready to be confirmed by the user
+    def __on_import_done(self, model: Model, svg_bg_path: [Path], y_axis_inverted: bool,
+                         sensor_color_cache: list[list[str]] | None, timestamp_cache: list[str] | None) -> None:
+        self.__model = model
+        self.__svg_bg_path = svg_bg_path
+        self.__bg_pts_grps = multiple_svg_path_to_grp_pts(svg_bg_path) if len(svg_bg_path) > 0 else None
+        self.__sensor_color_cache = sensor_color_cache
+        self.__timestamp_cache = timestamp_cache
+        self.__nb_of_dropped_frames = model.get_dataset().get_nb_of_dropped_frames()
+
+        if self.__profile_imports.get():
+            self.__show_last_import_profile()
+
+        self.__ask_for_config_confirmation(y_axis_inverted)
+
+    #   Will show the profile of the last profiled import
+    def __show_last_import_profile(self) -> None:
+        if self.__last_import_profile is None:
+            messagebox.showinfo("No import profile",
+                                "Enable the profiling of imports and import data to get a profile")
+            return
+
+        profiler, import_information = self.__last_import_profile
+        ImportProfilePopUp(self.__window,
+                           lambda: self.__export_import_profile(profiler, import_information)).show(profiler)
+
+    #   Will export an import profile as a JSON file
+    def __export_import_profile(self, profiler: ImportProfiler, import_information: dict) -> None:
+        filename = asksaveasfilename(defaultextension=".json", filetypes=(("JSON Files", ".json"),))
+
+        #   The user didn't select anything or just close the dialog
+        if filename == "" or filename == "()":
+            return
+
+        try:
+            profiler.save_json(filename, **import_information)
+
+        except Exception as e:
+            messagebox.showerror("ERROR",
+                                 "An error occurred during the export of the import profile\n {0}".format(e))
+
+    """
+
+            FOLLOWED DATA FILE SECTION
+
+    """
+
+    #   Executed regularly on the main thread while a data file is followed to import its new rows
+    def __poll_followed_file(self) -> None:
+        import_module = self.__followed_import_module
+
+        if not self.__data_loaded or import_module is None or not import_module.is_following():
+            return
+
+        try:
+            nb_of_new_frames, frames_modified = import_module.poll_followed_file()
+
+        except Exception as e:
+            print("An error occurred while following the data file")
+            print("\tException: {0}".format(e))
+
+            self.__stop_following()
+            messagebox.showerror("ERROR",
+                                 "An error occurred while following the data file, it will not be followed anymore\n {0}".format(e))
+            return
+
+        if nb_of_new_frames > 0:
+            self.__on_frames_appended(nb_of_new_frames, frames_modified)
+
+        self.__window.after(FOLLOW_POLL_DELAY, self.__poll_followed_file)
+
+    #   Will update caches and the interface with frames appended to the dataset
+    #   Colors and timestamps of a followed data file are not cached (they are computed when a step is drawn), only
+    #   center of mass positions of new frames are put in cache, except if existing frames have been modified too
+    #   Frames dropped from the start of the dataset (see RingBufferDataSet) are dropped from the cache as frames are
+    #   appended to it
+    def __on_frames_appended(self, nb_of_new_frames: int, frames_modified: bool) -> None:
+        dataset = self.get_dataset()
+        first_new_frame = max(0, len(dataset.get_temporal_set()) - nb_of_new_frames)
+
+        nb_of_dropped_frames = dataset.get_nb_of_dropped_frames() - self.__nb_of_dropped_frames
+        self.__nb_of_dropped_frames += nb_of_dropped_frames
+
+        if frames_modified:
+            self.__sensors_map.update_cache_position()
+        else:
+            self.__sensors_map.extend_cache_c_o_m_position(first_new_frame)
+
+        #   New frames can be played only once everything is ready for them
+        self.__model.update_steps_number(nb_of_dropped_frames)
+
+        self.__control_panel.update_end_time_label(self.__get_timestamp(self.__model.get_steps_number() - 1))
+        self.__control_panel.update_end_time_scale(self.__model.get_steps_number() - 1)
+
+    #   Will stop following the data file (if any)
+    def __stop_following(self) -> None:
+        if self.__followed_import_module is not None:
+            self.__followed_import_module.stop_following()
+            self.__followed_import_module = None
 
     """
 
@@ -402,6 +1038,7 @@ class Controller:
         self.__sensors_map.update_map_settings(self.get_dataset().get_map_height(),
                                                self.get_dataset().get_map_width(),
                                                y_axis_inverted)
+        self.__y_axis_inverted = y_axis_inverted
         self.__data_loaded = True
 
         self.__sensors_map.update_scale_factor()
@@ -410,14 +1047,10 @@ class Controller:
         if self.__bg_pts_grps is not None:
             self.__sensors_map.draw_bg(self.__bg_pts_grps)
 
-        self.__sensors_graph.plot(self.get_dataset().get_sensors_values(),
-                                  self.get_dataset().get_sensor_names(),
-                                  self.get_dataset().get_temporal_set())
-
-        self.__update_colors_cache()
-        self.__update_timestamps_cache()
+        self.__sensors_graph.plot(self.get_dataset().get_min_max_pyramid(),
+                                  self.get_dataset().get_sensor_names())
 
-        self.__control_panel.update_end_time_label(self.__timestamp_cache[self.__model.get_steps_number() - 1])
+        self.__control_panel.update_end_time_label(self.__get_timestamp(self.__model.get_steps_number() - 1))
         self.__control_panel.update_end_time_scale(self.__model.get_steps_number() - 1)
         self.__control_panel.unlock_time_sliders()
         self.__control_panel.unlock_play_controls()
@@ -428,8 +1061,13 @@ class Controller:
 
         self.launch_thread()
 
+        if self.__followed_import_module is not None:
+            self.__window.after(FOLLOW_POLL_DELAY, self.__poll_followed_file)
+
     #   When the loaded configuration as been invalidated or canceled
     def __on_loading_cancel(self) -> None:
+        self.__stop_following()
+
         #   Model deletion
         if self.__model is not None:
             del self.__model
@@ -507,7 +1145,7 @@ class Controller:
 
         self.__update_sensors(current_step_number)
         self.__sensors_map.draw_center_of_mass(current_step_number)
-        self.__control_panel.update_actual_time_label(self.__timestamp_cache[current_step_number])
+        self.__control_panel.update_actual_time_label(self.__get_timestamp(current_step_number))
 
     #   To handle change of the play direction normal or reverse
     def __on_change_play_direction(self, direction: str) -> None:
@@ -9,16 +9,42 @@
 ------------------------------------------------------------------------------------------------------------------------
 """
 
+#   Import of basic modules
+import numpy as np
+
 #   Custom modules and classes
+from block_statistics import BlockStatistics
 from force_sensor import ForceSensor
-from position import Position
+from growable_buffer import GrowableBuffer
+from min_max_pyramid import MinMaxPyramid
+from import_progress import ImportProgress, ImportPhase, start_import_phase
+from position import Position, get_positions_array
+from sensors_storage import SensorsStorage, StorageType, STORAGE_DECODE_CHUNK
 from utils import get_sensor_center_position
 
+#   Maximum distance (relative to the sampling period) between the time of a frame and its place on a uniform grid for
+#   the sampling of a dataset to be seen as uniform
+UNIFORM_SAMPLING_TOLERANCE = 0.01
+
 """
 
     DataSet
 
     In charge of everything related to data storage such has temporal values, ForceSensors and map settings
+    Values of all sensors are stored in one (number of samples, number of sensors) array (and another one for
+    normalized values), each ForceSensor only holds views over its column so a frame is a single row of the array.
+    Times are mapped to frames by binary search over the temporal set, or by index arithmetic if the sampling of the
+    dataset is uniform (detected when it is loaded).
+    Geometry is kept the same way, in (number of sensors, 2) arrays of sensors positions and centers.
+
+    Values can be stored with a reduced precision (float32 or int16 with a scale and a minimum for each sensor, see
+    SensorsStorage) to cut the memory used by long recordings. Getters of values then give decoded 64-bit floats
+    (copies, not views) and normalized values are not stored, they are decoded when they are asked.
+
+    A dataset can give views over a time window (window()) or a subset of its sensors (select()). A view is a DataSet
+    sharing the arrays of its dataset (nothing is copied, validated or calculated when it is built), it is normalized
+    with its own bounds and gets its center of mass positions calculated only when they are first needed, the same way
+    as a dataset built from its frames and sensors.
 
 """
 
@@ -31,17 +57,53 @@ class DataSet:
     __sensor_set_min_norm: float
     __is_normalized: bool
 
-    __temporal_set: [float]
+    __temporal_set: np.ndarray
 
+    #   Shape is (number of sensors, 2)
+    __sensors_positions: np.ndarray
+    __sensors_centers: np.ndarray
+
+    #   Time between two frames if the sampling is uniform, None otherwise
+    __sampling_period: float | None
+
+    #   Shape is (number of samples, number of sensors), values are stored encoded by the storage and normalized values
+    #   are only stored with a full precision storage (None otherwise)
+    __storage: SensorsStorage
+    __sensors_values: np.ndarray
+    __sensors_normalized_values: np.ndarray | None
+
+    #   Positions are kept with sub-pixel precision, shape is (number of samples, 2), frames without any load have no
+    #   center of mass: they are flagged in the zero-load mask and their position is NaN
     __center_of_mass_positions_calculated: bool
-    __center_of_mass_positions: [Position]
+    __center_of_mass_positions: np.ndarray | None
+    __zero_load_frames: np.ndarray | None
+
+    #   Only used once frames have been appended, temporal column, raw rows and normalized rows
+    __temporal_buffer: GrowableBuffer | None
+    __values_buffer: GrowableBuffer | None
+    __normalized_buffer: GrowableBuffer | None
+    __c_o_m_buffer: GrowableBuffer | None
+    __zero_load_buffer: GrowableBuffer | None
+
+    #   Only built at the first statistics query
+    __statistics: BlockStatistics | None
+
+    #   Only built at the first summaries query
+    __pyramid: MinMaxPyramid | None
 
     __map_width: int
     __map_height: int
 
-    def __init__(self, temporal_set: [int], sensors_name: [str], sensors_positions: [Position],
-                 sensors_characteristics: [[int, int, int]], sensors_data: [[float]],
-                 map_width: int, map_height: int):
+    #   Views are normalized and calculated lazily, frames cannot be appended to them
+    __is_view: bool
+
+    def __init__(self, temporal_set: list[float] | np.ndarray, sensors_name: [str],
+                 sensors_positions: np.ndarray | list[Position],
+                 sensors_characteristics: [[int, int, int]], sensors_data: list[list[float]] | np.ndarray,
+                 map_width: int, map_height: int, progress: ImportProgress | None = None,
+                 storage_type: StorageType = StorageType.float64):
+
+        start_import_phase(progress, ImportPhase.validate)
 
         #   Data consistency check:
         #   1 - sensors_name, sensors_data and temporal_set must have at least one element
@@ -63,15 +125,14 @@ class DataSet:
                 "Data consistency error: Incompatibility between the number of sensors names, the number of sensors, the number of positions !")
 
         #   Verification of the point 3
-        if min(temporal_set) < 0:
+        if np.min(temporal_set) < 0:
             raise Exception(
                 "Data consistency error: Temporal set inconsistency, cannot have negative values in temporal set !")
 
         #   Verification of the point 4
-        tmp_value = temporal_set[0]
-        for i in range(1, len(temporal_set)):
-            if tmp_value > temporal_set[i]:
-                raise Exception("Data consistency error: Temporal set inconsistency, not chronological !")
+        #   Frames are mapped to times by binary search, so every time must follow the previous one
+        if np.any(np.diff(temporal_set) < 0):
+            raise Exception("Data consistency error: Temporal set inconsistency, not chronological !")
 
         #   Verification of the point 5 only for the first sensor
         if len(sensors_data[0]) < 1:
@@ -94,14 +155,32 @@ class DataSet:
                 last_length = last_length_tmp
 
         #   Verification of the point 6 for each sensor
-        for i in range(0, len(sensors_positions)):
-            if (0 > sensors_positions[i].x > map_width) or (0 > sensors_positions[i].y > map_height):
+        sensors_positions = get_positions_array(sensors_positions)
+
+        for i, (x, y) in enumerate(sensors_positions.tolist()):
+            if (0 > x > map_width) or (0 > y > map_height):
                 raise Exception(
                     "Data consistency error: The position of the sensor #{:d} is out of map bounds !".format(i + 1))
 
         #   End of the data consistency check:
 
-        #   Now, let's create all sensors
+        #   Now, let's create all sensors, each one over a column of the values of all sensors
+        sensors_values = np.ascontiguousarray(np.asarray(sensors_data, dtype=float).T)
+
+        sensors_min = sensors_values.min(axis=0)
+        sensors_max = sensors_values.max(axis=0)
+
+        self.__storage = SensorsStorage(storage_type, sensors_min, sensors_max)
+        self.__sensors_values = self.__storage.encode(sensors_values)
+        self.__sensors_normalized_values = None if self.__storage.is_reduced() else np.empty_like(sensors_values)
+
+        #   Full precision values are not kept with a reduced precision storage
+        del sensors_values
+
+        self.__sensors_positions = sensors_positions
+        self.__sensors_centers = get_sensor_center_position(sensors_positions,
+                                                            np.asarray(sensors_characteristics)[:len(sensors_positions)])
+
         self.__sensor_set = []
 
         for i in range(0, len(sensors_data)):
@@ -110,13 +189,14 @@ class DataSet:
                     "Data consistency error: Characteristics of the sensor #{:d} are invalid !".format(i + 1))
 
             self.__sensor_set.append(ForceSensor(sensors_name[i],
-                                                 sensors_positions[i],
-                                                 get_sensor_center_position(sensors_positions[i],
-                                                                            sensors_characteristics[i]),
+                                                 Position(*self.__sensors_positions[i].tolist()),
+                                                 Position(*self.__sensors_centers[i].tolist()),
                                                  sensors_characteristics[i][0],
                                                  sensors_characteristics[i][1],
                                                  sensors_characteristics[i][2],
-                                                 sensors_data[i]))
+                                                 self.__sensors_values[:, i],
+                                                 float(sensors_min[i]),
+                                                 float(sensors_max[i])))
 
         self.__sensor_set_min = min([i.data_min for i in self.__sensor_set])
         self.__sensor_set_max = max([i.data_max for i in self.__sensor_set])
@@ -124,76 +204,470 @@ class DataSet:
         self.__sensor_set_min_norm = 0
         self.__sensor_set_max_norm = 0
 
-        self.__temporal_set = temporal_set
+        self.__temporal_set = np.ascontiguousarray(temporal_set, dtype=float)
+        self.__detect_uniform_sampling(0)
         self.__is_normalized = False
         self.__map_width = map_width
         self.__map_height = map_height
 
+        self.__temporal_buffer = None
+        self.__values_buffer = None
+        self.__normalized_buffer = None
+        self.__c_o_m_buffer = None
+        self.__zero_load_buffer = None
+
+        self.__statistics = None
+        self.__pyramid = None
+
+        self.__is_view = False
+
+        self.__center_of_mass_positions_calculated = False
+        self.__center_of_mass_positions = None
+        self.__zero_load_frames = None
+
         #   Debug statement just to show values before normalization
         # for x in self.__sensor_set:
         #    print("{:s}:\t{:.4f}\t/\t{:.4f}".format(x.get_name(), x.get_max(), x.get_min()))
 
+        start_import_phase(progress, ImportPhase.normalize)
+
         if not self.normalize_sensors():
             raise Exception("Cannot normalize sensors data")
 
+        start_import_phase(progress, ImportPhase.center_of_mass)
+
         if not self.center_of_mass_position_calculation():
             raise Exception("Cannot calculate position of the center of mass")
 
-    #   Will normalize each sensors and return the success (True) or the failure (False) of the operation
-    def normalize_sensors(self) -> bool:
-        operation_success = True
+    #   Will build a dataset from already validated, normalized and computed data (e.g. loaded from a cache)
+    #   sensors_positions is a (number of sensors, 2) array,
+    #   sensors_values and sensors_normalized_values are (number of samples, number of sensors) arrays and
+    #   center_of_mass_positions is a (number of samples, 2) array (NaN for frames without load), they are used as they
+    #   are (e.g. memory-mapped arrays are never copied)
+    #   WARNING:    No data consistency check is done, data must come from a dataset previously built normally
+    @classmethod
+    def from_precomputed(cls, temporal_set: np.ndarray, sensors_name: [str],
+                         sensors_positions: np.ndarray | list[Position],
+                         sensors_characteristics: [[int, int, int]], sensors_values: np.ndarray,
+                         sensors_normalized_values: np.ndarray, center_of_mass_positions: np.ndarray,
+                         map_width: int, map_height: int,
+                         sensors_bounds: list[list[float]] | None = None) -> 'DataSet':
+        dataset = cls.__new__(cls)
+
+        dataset.__storage = SensorsStorage()
+        dataset.__sensors_values = sensors_values
+        dataset.__sensors_normalized_values = sensors_normalized_values
+
+        dataset.__sensors_positions = get_positions_array(sensors_positions)
+        dataset.__sensors_centers = get_sensor_center_position(dataset.__sensors_positions,
+                                                               np.asarray(sensors_characteristics))
+
+        dataset.__sensor_set = []
+
+        for i in range(0, sensors_values.shape[1]):
+            #   Sensors bounds [min, max, min normalized, max normalized] avoid a scan of each sensor data
+            sensor_bounds = sensors_bounds[i] if sensors_bounds is not None else [None, None, None, None]
+
+            sensor = ForceSensor(sensors_name[i],
+                                 Position(*dataset.__sensors_positions[i].tolist()),
+                                 Position(*dataset.__sensors_centers[i].tolist()),
+                                 sensors_characteristics[i][0],
+                                 sensors_characteristics[i][1],
+                                 sensors_characteristics[i][2],
+                                 sensors_values[:, i],
+                                 sensor_bounds[0],
+                                 sensor_bounds[1])
+
+            if not sensor.load_normalized_data(sensors_normalized_values[:, i], sensor_bounds[2], sensor_bounds[3]):
+                raise Exception("Cannot load normalized data of the sensor #{:d}".format(i + 1))
+
+            dataset.__sensor_set.append(sensor)
+
+        dataset.__sensor_set_min = min([i.data_min for i in dataset.__sensor_set])
+        dataset.__sensor_set_max = max([i.data_max for i in dataset.__sensor_set])
+        dataset.__sensor_set_min_norm = min([i.data_min_norm for i in dataset.__sensor_set])
+        dataset.__sensor_set_max_norm = max([i.data_max_norm for i in dataset.__sensor_set])
+
+        dataset.__temporal_set = temporal_set
+        dataset.__detect_uniform_sampling(0)
+        dataset.__is_normalized = True
+        dataset.__map_width = map_width
+        dataset.__map_height = map_height
+
+        dataset.__center_of_mass_positions_calculated = True
+        dataset.__center_of_mass_positions = center_of_mass_positions
+        dataset.__zero_load_frames = np.isnan(center_of_mass_positions[:, 0])
+
+        dataset.__temporal_buffer = None
+        dataset.__values_buffer = None
+        dataset.__normalized_buffer = None
+        dataset.__c_o_m_buffer = None
+        dataset.__zero_load_buffer = None
+
+        dataset.__statistics = None
+        dataset.__pyramid = None
+
+        dataset.__is_view = False
+
+        return dataset
+
+    #   Get a view over the frames whose time is in [start_time; end_time] (see the description of the class)
+    def window(self, start_time: float, end_time: float) -> 'DataSet':
+        first_frame, end_frame = self.get_frames_between(start_time, end_time)
+
+        if first_frame == end_frame:
+            raise Exception("DataSet: No frame found in the time window [{:g}; {:g}] !".format(start_time, end_time))
+
+        return self.__create_view(first_frame, end_frame, list(range(self.get_number_of_sensors())))
+
+    #   Get a view over the given sensors (see the description of the class), they keep the order of the dataset
+    #   Only sensors evenly spaced in the dataset (e.g. consecutive ones) share its values, values of other subsets
+    #   are copied (only the ones of the selected sensors)
+    def select(self, sensors_name: [str]) -> 'DataSet':
+        if len(sensors_name) == 0:
+            raise Exception("DataSet: At least one sensor must be selected !")
+
+        names = self.get_sensor_names()
+        known_names = set(names)
+
+        for name in sensors_name:
+            if name not in known_names:
+                raise Exception("DataSet: Cannot find the sensor {:s} !".format(name))
+
+        selected_names = set(sensors_name)
+
+        return self.__create_view(0, len(self.get_temporal_set()),
+                                  [i for i, name in enumerate(names) if name in selected_names])
+
+    #   Will build a view over the frames [first_frame; end_frame[ of the sensors whose indices are given (increasing)
+    def __create_view(self, first_frame: int, end_frame: int, sensors_indices: [int]) -> 'DataSet':
+        view = DataSet.__new__(DataSet)
+
+        #   Evenly spaced sensors are a slice of each row
+        steps = set(np.diff(sensors_indices).tolist())
+
+        if len(steps) <= 1:
+            columns = slice(sensors_indices[0], sensors_indices[-1] + 1, steps.pop() if steps else 1)
+        else:
+            columns = sensors_indices
+
+        #   Stored values are shared as they are, with the storage of the selected sensors
+        view.__storage = self.get_storage().select(columns)
+        view.__sensors_values = self.get_stored_values_matrix()[first_frame:end_frame, columns]
+        view.__sensors_normalized_values = None
+
+        view.__sensors_positions = self.get_positions_array()[columns]
+        view.__sensors_centers = self.get_centers_array()[columns]
+
+        names = self.get_sensor_names()
+        characteristics = self.get_sensors_characteristics()
+
+        #   Bounds of sensors are only known once the view is normalized
+        view.__sensor_set = [ForceSensor(names[index],
+                                         Position(*view.__sensors_positions[i].tolist()),
+                                         Position(*view.__sensors_centers[i].tolist()),
+                                         characteristics[index][0],
+                                         characteristics[index][1],
+                                         characteristics[index][2],
+                                         view.__sensors_values[:, i],
+                                         np.nan,
+                                         np.nan)
+                             for i, index in enumerate(sensors_indices)]
+
+        view.__sensor_set_min = np.nan
+        view.__sensor_set_max = np.nan
+        view.__sensor_set_min_norm = np.nan
+        view.__sensor_set_max_norm = np.nan
+
+        #   Frames of a uniformly sampled dataset are uniformly sampled too
+        view.__temporal_set = self.get_temporal_set()[first_frame:end_frame]
+        view.__sampling_period = self.get_sampling_period()
+        view.__is_normalized = False
+        view.__map_width = self.get_map_width()
+        view.__map_height = self.get_map_height()
+
+        view.__center_of_mass_positions_calculated = False
+        view.__center_of_mass_positions = None
+        view.__zero_load_frames = None
+
+        view.__temporal_buffer = None
+        view.__values_buffer = None
+        view.__normalized_buffer = None
+        view.__c_o_m_buffer = None
+        view.__zero_load_buffer = None
+
+        view.__statistics = None
+        view.__pyramid = None
+
+        view.__is_view = True
+
+        return view
+
+    #   In order to check if the dataset is a view over another one
+    def is_view(self) -> bool:
+        return self.__is_view
+
+    #   Will normalize a view the first time its bounds or its normalized values are needed
+    def __normalize_if_needed(self) -> None:
+        if not self.__is_view or self.__is_normalized:
+            return
+
+        #   Decoding is monotonic, bounds of stored values are the stored bounds
+        sensors_min = self.__storage.decode(self.__sensors_values.min(axis=0))
+        sensors_max = self.__storage.decode(self.__sensors_values.max(axis=0))
+
+        for i, sensor in enumerate(self.__sensor_set):
+            sensor.data_min = float(sensors_min[i])
+            sensor.data_max = float(sensors_max[i])
+
+        self.__sensor_set_min = float(sensors_min.min())
+        self.__sensor_set_max = float(sensors_max.max())
+
+        if not self.__storage.is_reduced():
+            self.__sensors_normalized_values = np.empty(self.__sensors_values.shape)
+
+        if not self.__normalize_frames(0):
+            raise Exception("Cannot normalize sensors data")
+
+    #   Will calculate center of mass positions of a view the first time they are needed
+    def __calculate_c_o_m_if_needed(self) -> None:
+        if not self.__is_view or self.__center_of_mass_positions_calculated:
+            return
+
+        self.__normalize_if_needed()
+        self.center_of_mass_position_calculation()
+
+    #   Will append new frames at the end of the dataset (e.g. rows appended to a file still being recorded)
+    #   sensors_data contains the new values of each sensor, as many as new temporal values
+    #   Only new frames are normalized and get their center of mass position calculated, except if the global
+    #   minimum or maximum has changed: every frame is then normalized and calculated again
+    #   With an int16 storage, existing frames are encoded again with wider ranges if new values are out of the ranges
+    #   of the storage (see SensorsStorage)
+    #   Return True if already existing frames have been modified, False otherwise
+    def append_frames(self, temporal_set: list[float] | np.ndarray, sensors_data: list[list[float]] | np.ndarray) -> bool:
+        if self.__is_view:
+            raise Exception("DataSet: Frames cannot be appended to a view !")
+
+        temporal_set = np.asarray(temporal_set, dtype=float)
+        sensors_data = np.asarray(sensors_data, dtype=float)
+
+        nb_of_frames = len(self.__temporal_set)
+        nb_of_new_frames = len(temporal_set)
+
+        if nb_of_new_frames == 0:
+            return False
+
+        #   Same data consistency check as for the initial frames (points 2 to 5)
+        if sensors_data.shape != (len(self.__sensor_set), nb_of_new_frames):
+            raise Exception(
+                "Data consistency error: New frames don't match the number of sensors or the number of temporal values !")
+
+        if np.min(temporal_set) < 0:
+            raise Exception(
+                "Data consistency error: Temporal set inconsistency, cannot have negative values in temporal set !")
+
+        #   New frames must follow the last frame and each other
+        if temporal_set[0] < self.__temporal_set[-1] or np.any(np.diff(temporal_set) < 0):
+            raise Exception("Data consistency error: Temporal set inconsistency, not chronological !")
+
+        #   Frames are moved into growable buffers at the first append so next appends are amortized
+        if self.__values_buffer is None:
+            capacity = 2 * (nb_of_frames + nb_of_new_frames)
+
+            self.__temporal_buffer = GrowableBuffer(1, capacity)
+            self.__temporal_buffer.append_columns(np.asarray(self.__temporal_set, dtype=float)[np.newaxis])
+
+            self.__values_buffer = GrowableBuffer(len(self.__sensor_set), capacity, dtype=self.__storage.get_dtype(),
+                                                  row_major=True)
+            self.__values_buffer.append(self.__sensors_values)
+
+            if self.__sensors_normalized_values is not None:
+                self.__normalized_buffer = GrowableBuffer(len(self.__sensor_set), capacity, row_major=True)
+                self.__normalized_buffer.append(self.__sensors_normalized_values)
+
+            self.__c_o_m_buffer = GrowableBuffer(2, capacity, row_major=True)
+            self.__c_o_m_buffer.append(self.__center_of_mass_positions)
+
+            self.__zero_load_buffer = GrowableBuffer(1, capacity, dtype=bool)
+            self.__zero_load_buffer.append_columns(self.__zero_load_frames[np.newaxis])
+
+        #   Bounds are updated from new values, not from stored ones (they may be encoded)
+        sensors_min = np.minimum([sensor.data_min for sensor in self.__sensor_set], sensors_data.min(axis=1))
+        sensors_max = np.maximum([sensor.data_max for sensor in self.__sensor_set], sensors_data.max(axis=1))
+
+        if not self.__storage.covers(sensors_min, sensors_max):
+            self.__encode_again(self.__storage.widen(sensors_min, sensors_max))
+
+        self.__temporal_buffer.append_columns(temporal_set[np.newaxis])
+        self.__values_buffer.append(self.__storage.encode(sensors_data.T))
 
-        normalized_values = (abs(self.__sensor_set_min), abs(self.__sensor_set_max) + abs(self.__sensor_set_min))
+        self.__temporal_set = self.__temporal_buffer.get_columns()[0]
+        self.__sensors_values = self.__values_buffer.get_rows()
 
-        #   Browse our entire sensor set
-        for sensor in self.__sensor_set:
-            operation_success = sensor.normalize_data(*normalized_values)
+        self.__detect_uniform_sampling(nb_of_frames)
 
-            #   Exit the loop if a sensor normalisation fails
-            if not operation_success:
-                break
+        for i, sensor in enumerate(self.__sensor_set):
+            sensor.extend_data(self.__sensors_values[:, i], 0)
+            sensor.data_min = float(sensors_min[i])
+            sensor.data_max = float(sensors_max[i])
+
+        #   Summaries of previous blocks are kept, even if previous frames have been encoded again
+        if self.__statistics is not None:
+            self.__statistics.extend(self.__storage.get_decoded_values(self.__sensors_values))
+
+        if self.__pyramid is not None:
+            self.__pyramid.extend(self.__storage.get_decoded_values(self.__sensors_values), self.__temporal_set)
+
+        previous_bounds = (self.__sensor_set_min, self.__sensor_set_max)
+        self.__sensor_set_min = min([sensor.data_min for sensor in self.__sensor_set])
+        self.__sensor_set_max = max([sensor.data_max for sensor in self.__sensor_set])
+        bounds_changed = previous_bounds != (self.__sensor_set_min, self.__sensor_set_max)
+
+        #   New rows are normalized in place once appended to the normalized buffer
+        if self.__normalized_buffer is not None:
+            self.__normalized_buffer.append_columns(sensors_data)
+            self.__sensors_normalized_values = self.__normalized_buffer.get_rows()
+
+        #   Normalized values of existing frames are only valid if bounds haven't changed, otherwise they are
+        #   normalized again in place
+        if not self.__normalize_frames(0 if bounds_changed else nb_of_frames):
+            raise Exception("Cannot normalize sensors data")
+
+        #   Same for center of mass positions, new rows are calculated in place once appended to their buffers
+        self.__c_o_m_buffer.append_columns(np.empty((2, nb_of_new_frames)))
+        self.__zero_load_buffer.append_columns(np.empty((1, nb_of_new_frames), dtype=bool))
+
+        self.__center_of_mass_positions = self.__c_o_m_buffer.get_rows()
+        self.__zero_load_frames = self.__zero_load_buffer.get_columns()[0]
+
+        self.__calculate_center_of_mass_positions(0 if bounds_changed else nb_of_frames)
+
+        return bounds_changed
+
+    #   Will encode every frame of the values buffer again with the given storage (by chunks of frames, so they are
+    #   never all decoded at once)
+    #   Frames are encoded into a new buffer: views share the previous one and keep decoding it with their storage
+    def __encode_again(self, storage: SensorsStorage) -> None:
+        stored_values = self.__values_buffer.get_rows()
+
+        values_buffer = GrowableBuffer(stored_values.shape[1], self.__values_buffer.get_capacity(),
+                                       dtype=storage.get_dtype(), row_major=True)
+
+        for first_frame in range(0, len(stored_values), STORAGE_DECODE_CHUNK):
+            values_buffer.append(storage.encode(self.__storage.decode(
+                stored_values[first_frame:first_frame + STORAGE_DECODE_CHUNK])))
+
+        self.__values_buffer = values_buffer
+        self.__sensors_values = values_buffer.get_rows()
+        self.__storage = storage
+
+    #   Get values used to normalize sensors data (value to add, value to divide by)
+    def __get_normalization_values(self) -> (float, float):
+        return abs(self.__sensor_set_min), abs(self.__sensor_set_max) + abs(self.__sensor_set_min)
+
+    #   Will normalize each sensors and return the success (True) or the failure (False) of the operation
+    def normalize_sensors(self) -> bool:
+        return self.__normalize_frames(0)
+
+    #   Will normalize, in place, the values of every sensor from the given frame to the last one
+    #   The whole (number of samples, number of sensors) array is normalized at once with the global offset and scale
+    #   Bounds of normalized values are updated from the normalized frames only (kept bounds of previous frames must
+    #   have been normalized with the same values)
+    #   Return the success (True) or the failure (False) of the operation
+    def __normalize_frames(self, first_frame: int) -> bool:
+        add_value, division_value = self.__get_normalization_values()
+
+        #   Normalized values which are not stored only need their bounds (normalization is linear)
+        if self.__sensors_normalized_values is None:
+            sensors_min = np.array([sensor.data_min for sensor in self.__sensor_set])
+            sensors_max = np.array([sensor.data_max for sensor in self.__sensor_set])
+
+            sensors_min_norm = (sensors_min + add_value) / division_value
+            sensors_max_norm = (sensors_max + add_value) / division_value
+        else:
+            frames = self.__sensors_normalized_values[first_frame:]
+            np.add(self.__sensors_values[first_frame:], add_value, out=frames)
+            np.divide(frames, division_value, out=frames)
+
+            sensors_min_norm = frames.min(axis=0)
+            sensors_max_norm = frames.max(axis=0)
+
+            if first_frame > 0:
+                sensors_min_norm = np.minimum(sensors_min_norm, self.get_sensors_min_normalized())
+                sensors_max_norm = np.maximum(sensors_max_norm, self.get_sensors_max_normalized())
+
+        #   If the operation have succeeded new min and max must be contained in [0; 1]
+        operation_success = bool(np.all(sensors_min_norm >= 0) and np.all(sensors_max_norm <= 1))
+
+        for i, sensor in enumerate(self.__sensor_set):
+            if self.__sensors_normalized_values is None:
+                sensor.data_min_norm = float(sensors_min_norm[i])
+                sensor.data_max_norm = float(sensors_max_norm[i])
+            else:
+                operation_success = sensor.load_normalized_data(self.__sensors_normalized_values[:, i],
+                                                                float(sensors_min_norm[i]),
+                                                                float(sensors_max_norm[i])) and operation_success
 
         if operation_success:
-            self.__sensor_set_min_norm = min([sensor.data_min_norm for sensor in self.__sensor_set])
-            self.__sensor_set_max_norm = max([sensor.data_max_norm for sensor in self.__sensor_set])
+            self.__sensor_set_min_norm = float(sensors_min_norm.min())
+            self.__sensor_set_max_norm = float(sensors_max_norm.max())
 
         #   Update normalisation status of the data set
         self.__is_normalized = operation_success
         return operation_success
 
     #   Will calculate center of mass positions regarding sensors positions and data
+    #   Frames without any load don't stop the calculation, they are flagged in the zero-load mask
     def center_of_mass_position_calculation(self) -> bool:
+        nb_of_frames = len(self.__temporal_set)
 
-        generated_center_of_mass_positions: [Position] = list()
+        if self.__center_of_mass_positions is None or len(self.__center_of_mass_positions) != nb_of_frames:
+            self.__center_of_mass_positions = np.empty((nb_of_frames, 2))
+            self.__zero_load_frames = np.empty(nb_of_frames, dtype=bool)
 
-        #   Browse each measurement and pick each data and position of the sensor
-        for i in range(len(self.__temporal_set)):
-            sensors_data_sum: float = 0
-            x: float = 0
-            y: float = 0
+        self.__calculate_center_of_mass_positions(0)
 
-            for sensor in self.__sensor_set:
+        #   Update status of positions calculation of the center of mass
+        self.__center_of_mass_positions_calculated = True
+        return True
 
-                sensor_data = sensor.get_data_point_normalized(i)
-                sensors_data_sum += sensor_data
+    #   Will calculate, in place, center of mass positions from the given frame to the last one
+    #   Each position is the mean of sensors centers weighted by the normalized values of the frame, all frames are
+    #   calculated at once with a matrix product (by chunks of frames if normalized values must be decoded)
+    def __calculate_center_of_mass_positions(self, first_frame: int) -> None:
+        nb_of_frames = len(self.__center_of_mass_positions)
+        chunk_size = max(1, nb_of_frames if self.__sensors_normalized_values is not None else STORAGE_DECODE_CHUNK)
 
-                x += sensor_data * sensor.get_center_position().x
-                y += sensor_data * sensor.get_center_position().y
+        centers = self.__sensors_centers.astype(float)
 
-            if sensors_data_sum == 0:
-                self.__center_of_mass_positions_calculated = False
-                return False
+        for start_frame in range(first_frame, nb_of_frames, chunk_size):
+            end_frame = min(start_frame + chunk_size, nb_of_frames)
 
-            generated_center_of_mass_positions.append(Position(int(x / sensors_data_sum),
-                                                               int(y / sensors_data_sum)))
+            frames = self.__get_normalized_frames(start_frame, end_frame)
+            positions = self.__center_of_mass_positions[start_frame:end_frame]
+            zero_load = self.__zero_load_frames[start_frame:end_frame]
 
-        #   Update status of positions calculation of the center of mass
-        self.__center_of_mass_positions_calculated = True
-        self.__center_of_mass_positions = generated_center_of_mass_positions
-        return True
+            sensors_data_sum = frames.sum(axis=1)
+
+            np.matmul(frames, centers, out=positions)
+            np.equal(sensors_data_sum, 0, out=zero_load)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                np.divide(positions, sensors_data_sum[:, np.newaxis], out=positions)
+
+            positions[zero_load] = np.nan
+
+    #   Get normalized values of the frames [first_frame; end_frame[, a view if they are stored, decoded otherwise
+    def __get_normalized_frames(self, first_frame: int, end_frame: int) -> np.ndarray:
+        if self.__sensors_normalized_values is not None:
+            return self.__sensors_normalized_values[first_frame:end_frame]
+
+        add_value, division_value = self.__get_normalization_values()
+        return (self.__storage.decode(self.__sensors_values[first_frame:end_frame]) + add_value) / division_value
 
     #   Get the sensor set
     def get_sensor_set(self) -> [ForceSensor]:
+        self.__normalize_if_needed()
         return self.__sensor_set
 
     #   Get the number of the sensors in this dataset
@@ -202,30 +676,101 @@ class DataSet:
 
     #   Get the global maximum normalized
     def get_sensor_set_max_norm(self) -> float:
+        self.__normalize_if_needed()
         return self.__sensor_set_max_norm
 
     #   Get the global minimum normalized
     def get_sensor_set_min_norm(self) -> float:
+        self.__normalize_if_needed()
         return self.__sensor_set_min_norm
 
     #   Get the global maximum non-normalized
     def get_sensor_set_max(self) -> float:
+        self.__normalize_if_needed()
         return self.__sensor_set_max
 
     #   Get the global minimum non-normalized
     def get_sensor_set_min(self) -> float:
+        self.__normalize_if_needed()
         return self.__sensor_set_min
 
     #   Get the temporal set
-    def get_temporal_set(self) -> [float]:
+    def get_temporal_set(self) -> np.ndarray:
         return self.__temporal_set
 
+    #   Get the number of frames dropped from the start of the dataset, frames are never dropped from a DataSet (see
+    #   RingBufferDataSet)
+    def get_nb_of_dropped_frames(self) -> int:
+        return 0
+
+    #   Will check if the frames from the given one are on the uniform grid of the previous ones
+    #   From the first frame, the period of the grid is estimated from the duration of the whole dataset
+    def __detect_uniform_sampling(self, first_frame: int) -> None:
+        temporal_set = self.__temporal_set
+        nb_of_frames = len(temporal_set)
+
+        if first_frame == 0:
+            duration = float(temporal_set[-1] - temporal_set[0])
+            self.__sampling_period = duration / (nb_of_frames - 1) if nb_of_frames > 1 and duration > 0 else None
+
+        if self.__sampling_period is None:
+            return
+
+        grid = temporal_set[0] + np.arange(first_frame, nb_of_frames) * self.__sampling_period
+
+        if np.any(np.abs(temporal_set[first_frame:] - grid) > UNIFORM_SAMPLING_TOLERANCE * self.__sampling_period):
+            self.__sampling_period = None
+
+    #   Get the time between two frames if the sampling is uniform, None otherwise
+    def get_sampling_period(self) -> float | None:
+        return self.__sampling_period
+
+    #   In order to check if frames are uniformly sampled
+    def is_uniformly_sampled(self) -> bool:
+        return self.__sampling_period is not None
+
+    #   Get the frame shown at the given time (in seconds): the last frame whose time is before or equal to it
+    #   Return -1 if the time is before the first frame
+    def get_frame_at(self, time: float) -> int:
+        temporal_set = self.__temporal_set
+        nb_of_frames = len(temporal_set)
+
+        if self.__sampling_period is None:
+            return int(np.searchsorted(temporal_set, time, side='right')) - 1
+
+        #   The frame is found on the grid, then moved to its real place (frames are only slightly away from the grid)
+        frame = int(np.clip(np.floor((time - temporal_set[0]) / self.__sampling_period), -1, nb_of_frames - 1))
+
+        while frame + 1 < nb_of_frames and temporal_set[frame + 1] <= time:
+            frame += 1
+
+        while frame >= 0 and temporal_set[frame] > time:
+            frame -= 1
+
+        return frame
+
+    #   Get the frames whose time is in [start_time; end_time] as a [first frame; end frame[ range (empty if there are
+    #   none), e.g. to query statistics or summaries of a time window
+    def get_frames_between(self, start_time: float, end_time: float) -> (int, int):
+        if self.__sampling_period is None:
+            first_frame = int(np.searchsorted(self.__temporal_set, start_time, side='left'))
+        else:
+            first_frame = self.get_frame_at(start_time)
+
+            #   The frame shown at the start time only belongs to the range if it starts exactly at this time
+            if first_frame < 0 or self.__temporal_set[first_frame] < start_time:
+                first_frame += 1
+
+        return first_frame, max(first_frame, self.get_frame_at(end_time) + 1)
+
     #   In order to check if the sensors have been normalized
     def is_normalized(self) -> bool:
+        self.__normalize_if_needed()
         return self.__is_normalized
 
     #   In order to check if center of mass positions have been normalized
     def is_ctr_of_mass_pos_calculated(self) -> bool:
+        self.__calculate_c_o_m_if_needed()
         return self.__center_of_mass_positions_calculated
 
     #   Get map width (in pixels)
@@ -244,46 +789,109 @@ class DataSet:
     def get_centers(self) -> [Position]:
         return [sensor.get_center_position() for sensor in self.__sensor_set]
 
+    #   Get positions of all sensors as a (number of sensors, 2) array
+    def get_positions_array(self) -> np.ndarray:
+        return self.__sensors_positions
+
+    #   Get center positions of all sensors as a (number of sensors, 2) array
+    def get_centers_array(self) -> np.ndarray:
+        return self.__sensors_centers
+
     #   Get an array filled with the name of each sensor
     def get_sensor_names(self) -> [str]:
         return [sensor.get_name() for sensor in self.__sensor_set]
 
     #   Get an array filled with the non-normalized maximum of each sensor
     def get_sensors_max(self) -> [float]:
+        self.__normalize_if_needed()
         return [sensor.get_max() for sensor in self.__sensor_set]
 
     #   Get an array filled with the non-normalized minimum of each sensor
     def get_sensors_min(self) -> [float]:
+        self.__normalize_if_needed()
         return [sensor.get_min() for sensor in self.__sensor_set]
 
     #   Get an array filled with the normalized maximum of each sensor
     def get_sensors_max_normalized(self) -> [float]:
+        self.__normalize_if_needed()
         return [sensor.get_max_normalized() for sensor in self.__sensor_set]
 
     #   Get an array filled with the normalized maximum of each sensor
     def get_sensors_min_normalized(self) -> [float]:
+        self.__normalize_if_needed()
         return [sensor.get_min_normalized() for sensor in self.__sensor_set]
 
     #   Get an array filled with non-normalized values of each sensor
     def get_sensors_values(self) -> [float]:
-        return [sensor.get_data() for sensor in self.__sensor_set]
+        return list(self.get_sensors_values_matrix().T)
 
     #   Get an array filled with normalized values of each sensor
     def get_sensors_normalized_values(self) -> [float]:
-        return [sensor.get_data_normalized() for sensor in self.__sensor_set]
+        return list(self.get_sensors_normalized_values_matrix().T)
+
+    #   Get non-normalized values of all sensors, shape is (number of samples, number of sensors)
+    #   Values are decoded (a copy) with a reduced precision storage
+    def get_sensors_values_matrix(self) -> np.ndarray:
+        return self.__storage.decode(self.__sensors_values)
+
+    #   Get normalized values of all sensors, shape is (number of samples, number of sensors)
+    #   Values are decoded (a copy) with a reduced precision storage
+    def get_sensors_normalized_values_matrix(self) -> np.ndarray:
+        self.__normalize_if_needed()
+        return self.__get_normalized_frames(0, len(self.__sensors_values))
+
+    #   Get the storage of values of sensors
+    def get_storage(self) -> SensorsStorage:
+        return self.__storage
+
+    #   Get values of all sensors as they are stored (encoded by the storage), shape is (number of samples, number of
+    #   sensors)
+    def get_stored_values_matrix(self) -> np.ndarray:
+        return self.__sensors_values
 
-    #   Get an array filled with non-normalized values of each sensor at a specific point
-    def get_sensors_values_at(self, index: int) -> [float]:
-        return [sensor.get_data_point(index) for sensor in self.__sensor_set]
+    #   Get the cache of statistics of non-normalized values over time windows (built at the first call)
+    #   Statistics of normalized values are the same once normalized, except the standard deviation which is only
+    #   divided by the scale of the normalization
+    def get_statistics(self) -> BlockStatistics:
+        if self.__statistics is None:
+            self.__statistics = BlockStatistics(self.__storage.get_decoded_values(self.__sensors_values))
 
-    #   Get an array filled with normalized values of each sensor at a specific point
-    def get_sensors_normalized_values_at(self, index: int) -> [float]:
-        return [sensor.get_data_point_normalized(index) for sensor in self.__sensor_set]
+        return self.__statistics
+
+    #   Get the min/max/mean summaries of non-normalized values at each decimation level (built at the first call)
+    def get_min_max_pyramid(self) -> MinMaxPyramid:
+        if self.__pyramid is None:
+            self.__pyramid = MinMaxPyramid(self.__storage.get_decoded_values(self.__sensors_values),
+                                           self.__temporal_set)
+
+        return self.__pyramid
+
+    #   Get an array filled with non-normalized values of each sensor at a specific point (a view, not a copy, except
+    #   with a reduced precision storage)
+    def get_sensors_values_at(self, index: int) -> np.ndarray:
+        return self.__storage.decode(self.__sensors_values[index])
+
+    #   Get an array filled with normalized values of each sensor at a specific point (a view, not a copy, except
+    #   with a reduced precision storage)
+    def get_sensors_normalized_values_at(self, index: int) -> np.ndarray:
+        self.__normalize_if_needed()
+
+        if self.__sensors_normalized_values is not None:
+            return self.__sensors_normalized_values[index]
+
+        add_value, division_value = self.__get_normalization_values()
+        return (self.__storage.decode(self.__sensors_values[index]) + add_value) / division_value
 
     #   Will return an array filled with all sensors characteristics [width, height, angle]
     def get_sensors_characteristics(self) -> [[int, int, int]]:
         return [sensor.get_characteristics() for sensor in self.__sensor_set]
 
-    #   Get an array of all center of mass positions
-    def get_c_o_m_positions(self) -> [Position]:
+    #   Get all center of mass positions, shape is (number of samples, 2) and positions are NaN for frames without load
+    def get_c_o_m_positions(self) -> np.ndarray:
+        self.__calculate_c_o_m_if_needed()
         return self.__center_of_mass_positions
+
+    #   Get the mask of frames without any load (and without center of mass)
+    def get_c_o_m_zero_load_mask(self) -> np.ndarray:
+        self.__calculate_c_o_m_if_needed()
+        return self.__zero_load_frames
@@ -0,0 +1,131 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining a persistent cache of imported datasets
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+import svg.path as svg
+
+#   Import of custom modules
+from dataset import DataSet
+
+"""
+
+    DataSetCache
+
+    In charge of saving and loading already imported datasets in binary files (.npz).
+    Each entry is keyed by a fingerprint of the source files (path, size, modification time and content hash)
+    so a modified or moved file will never be served from an outdated entry.
+
+"""
+
+
+class DataSetCache:
+    #   Version of the cache layout, must be incremented each time the stored arrays change
+    CACHE_VERSION = 3
+
+    __cache_directory: str
+
+    def __init__(self, cache_directory: str | None = None):
+        if cache_directory is None:
+            cache_directory = os.path.join(os.path.expanduser('~'), '.cache', 'soles_data_visualisation')
+
+        self.__cache_directory = cache_directory
+
+    #   Get the directory where cache entries are stored
+    def get_cache_directory(self) -> str:
+        return self.__cache_directory
+
+    #   Will compute the key of a cache entry from the import type and the source files
+    def get_key(self, import_type: str, file_paths: [str]) -> str:
+        fingerprint = hashlib.blake2b(digest_size=20)
+        fingerprint.update("{:s}:{:d}".format(import_type, self.CACHE_VERSION).encode())
+
+        for file_path in file_paths:
+            file_stat = os.stat(file_path)
+            fingerprint.update("{:s}:{:d}:{:d}".format(os.path.abspath(file_path),
+                                                       file_stat.st_size,
+                                                       file_stat.st_mtime_ns).encode())
+
+            #   Content hash, read by blocks to avoid loading the whole file
+            with open(file_path, 'rb') as file:
+                for block in iter(lambda: file.read(1 << 20), b''):
+                    fingerprint.update(block)
+
+        return fingerprint.hexdigest()
+
+    #   Get the path of the file of a cache entry
+    def get_entry_path(self, key: str) -> str:
+        return os.path.join(self.__cache_directory, key + ".npz")
+
+    #   Will save a dataset (and its background paths if any) into the cache
+    def save(self, key: str, dataset: DataSet, svg_bg_path: [svg.Path] = None) -> None:
+        os.makedirs(self.__cache_directory, exist_ok=True)
+
+        #   Write into a temporary file first so an interrupted save never leaves a corrupted entry
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.__cache_directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                np.savez(file,
+                         temporal_set=np.asarray(dataset.get_temporal_set(), dtype=float),
+                         sensors_name=np.array(dataset.get_sensor_names(), dtype=str),
+                         sensors_positions=np.asarray(dataset.get_positions_array(), dtype=int),
+                         sensors_characteristics=np.array(dataset.get_sensors_characteristics(), dtype=int),
+                         sensors_values=np.asarray(dataset.get_sensors_values_matrix(), dtype=float),
+                         sensors_normalized_values=np.asarray(dataset.get_sensors_normalized_values_matrix(),
+                                                              dtype=float),
+                         c_o_m_positions=np.asarray(dataset.get_c_o_m_positions(), dtype=float),
+                         map_size=np.array([dataset.get_map_width(), dataset.get_map_height()]),
+                         svg_bg_path=np.array([path.d() for path in svg_bg_path or []], dtype=str))
+
+            os.replace(tmp_path, self.get_entry_path(key))
+
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    #   Will load a dataset (and its background paths) from the cache
+    #   Will return None if there is no entry for the given key
+    def load(self, key: str) -> tuple[DataSet, list[svg.Path]] | None:
+        entry_path = self.get_entry_path(key)
+
+        if not os.path.isfile(entry_path):
+            return None
+
+        with np.load(entry_path, allow_pickle=False) as entry:
+            map_width, map_height = (int(x) for x in entry['map_size'])
+
+            dataset = DataSet.from_precomputed(entry['temporal_set'],
+                                               [str(name) for name in entry['sensors_name']],
+                                               entry['sensors_positions'],
+                                               entry['sensors_characteristics'].tolist(),
+                                               entry['sensors_values'],
+                                               entry['sensors_normalized_values'],
+                                               entry['c_o_m_positions'],
+                                               map_width,
+                                               map_height)
+
+            svg_bg_path = [svg.parse_path(str(path)) for path in entry['svg_bg_path']]
+
+        return dataset, svg_bg_path
+
+    #   Will remove every entry of the cache
+    def clear(self) -> None:
+        if not os.path.isdir(self.__cache_directory):
+            return
+
+        for file_name in os.listdir(self.__cache_directory):
+            if file_name.endswith(".npz"):
+                os.remove(os.path.join(self.__cache_directory, file_name))
@@ -9,13 +9,15 @@
 ------------------------------------------------------------------------------------------------------------------------
 """
 
+import numpy as np
+
 from position import Position
 
 
 class ForceSensor:
     name: str
-    data: [float]
-    data_normalized: [float]
+    data: list[float] | np.ndarray
+    data_normalized: np.ndarray | None
     data_max: float
     data_min: float
     data_max_norm: float
@@ -32,17 +34,25 @@ class ForceSensor:
         ForceSensor
 
         In charge of everything related to a force sensor and contains everything about it.
+        When the sensor belongs to a DataSet, data and data_normalized are views over its columns (not copies).
+        If the DataSet stores its values with a reduced precision, data is a view over the stored (encoded) values and
+        data_normalized is not filled, values must be read from the DataSet.
+        Sensors of a RingBufferDataSet don't have their normalized values filled either (they are computed by the
+        dataset when they are asked), normalized values must be read from the dataset.
 
     """
     def __init__(self, name: str,
                  position: Position, center_pos: Position,
                  width: int, height: int, angle: int,
-                 data: [float]):
+                 data: list[float] | np.ndarray,
+                 data_min: float | None = None, data_max: float | None = None):
         self.name = name
         self.data = data
-        self.data_normalized = list()
-        self.data_min = min(data)
-        self.data_max = max(data)
+        #   Not filled until the sensor is normalized
+        self.data_normalized = None
+        #   Bounds can be given to avoid a scan of the whole data (e.g. when data is memory-mapped)
+        self.data_min = float(np.min(data)) if data_min is None else data_min
+        self.data_max = float(np.max(data)) if data_max is None else data_max
         self.data_min_norm = 0
         self.data_max_norm = 0
         self.position = position
@@ -66,12 +76,21 @@ class ForceSensor:
     def get_data(self) -> [float]:
         return self.data
 
+    #   Normalized values are only filled if they are stored (see the description of the class)
     def get_data_normalized(self) -> [float]:
+        self.__check_normalized_data()
         return self.data_normalized
 
     def get_data_point_normalized(self, index: int) -> float:
+        self.__check_normalized_data()
         return self.data_normalized[index]
 
+    #   Will raise an exception if normalized values are not filled
+    def __check_normalized_data(self) -> None:
+        if self.data_normalized is None:
+            raise Exception("ForceSensor: Normalized values of {:s} are not stored by the sensor, they must be read "
+                            "from its dataset !".format(self.name))
+
     def get_data_point(self, index: int) -> float:
         return self.data[index]
 
@@ -93,26 +112,25 @@ class ForceSensor:
     def get_angle(self) -> int:
         return self.angle
 
-    #   Will normalize data by filling normalised data array
-    def normalize_data(self, add_value: float, division_value: float) -> bool:
-        #   Reset normalized data array
-        self.data_normalized = list()
-
-        #   Normalize each values
-        for i in range(0, len(self.data)):
-            norm_data = self.data[i]
-            norm_data += add_value
-            norm_data /= division_value
-            self.data_normalized.append(norm_data)
-
-        #   Update max and min for the sensor with new max and new min
-        self.data_max_norm = max(self.data_normalized)
-        self.data_min_norm = min(self.data_normalized)
-
-        #   Return the operation end status
-        #   If the operation have succeeded new min and max must be contained in [0; 1]
-        #   We also have to check if the arrays of original data and normalized data have the same size
-        return self.data_min_norm >= 0 and self.data_max_norm <= 1 and len(self.data) == len(self.data_normalized)
+    #   Will fill normalised data array with already normalized data (normalized by the dataset or loaded from a cache)
+    def load_normalized_data(self, data_normalized: np.ndarray,
+                             data_min_norm: float | None = None, data_max_norm: float | None = None) -> bool:
+        self.data_normalized = np.asarray(data_normalized, dtype=float)
+
+        #   Update max and min for the sensor with new max and new min (if they are not given)
+        self.data_max_norm = float(np.max(self.data_normalized)) if data_max_norm is None else data_max_norm
+        self.data_min_norm = float(np.min(self.data_normalized)) if data_min_norm is None else data_min_norm
+
+        return len(self.data) == len(self.data_normalized)
+
+    #   Will replace data by a longer version of it, only the nb_of_new_values last values are new
+    #   Min and max are updated from new values only
+    def extend_data(self, data: np.ndarray, nb_of_new_values: int) -> None:
+        self.data = data
+
+        if nb_of_new_values > 0:
+            self.data_min = min(self.data_min, float(np.min(data[-nb_of_new_values:])))
+            self.data_max = max(self.data_max, float(np.max(data[-nb_of_new_values:])))
 
     #   Will return characteristics as [width, height, angle]
     def get_characteristics(self) -> [int, int, int]:
@@ -13,10 +13,10 @@ from typing import IO
 
 import numpy as np
 from cv2 import GaussianBlur, BORDER_REPLICATE
+from matplotlib import pyplot as plt
 
-from views.sensors_graph_view import *
+from position import Position
 from utils import *
-import time
 
 __GAUSS_KERN_SIZE = 121
 __SIGMA = 16
@@ -118,7 +118,6 @@ def create_matrix_from_groups(centers: [Position],
 def gaussian_heatmap_filter(m: np.array,
                             kern_width: int, kern_height: int,
                             sigma: float, low_cut: float):
-    start_time = time.time()
     #   Apply gaussian filter of OpenCV to our matrix
     img = GaussianBlur(m,
                        (kern_width, kern_height),
@@ -129,8 +128,6 @@ def gaussian_heatmap_filter(m: np.array,
     #   Cut the low part that doesn't interest us
     img[img < low_cut] = 0
 
-    print(time.time() - start_time)
-
     return img
 
 
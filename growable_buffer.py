@@ -0,0 +1,97 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining a growable typed buffer used to store numerical columns while they are parsed
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import numpy as np
+
+"""
+
+    GrowableBuffer
+
+    In charge of storing numerical columns (one contiguous row per column) whose final length is unknown.
+    Rows are appended by blocks, the capacity grows geometrically so appends are amortized O(1).
+    If row_major is True, each row is contiguous instead (e.g. one frame of every sensor), columns are then strided.
+
+"""
+
+
+class GrowableBuffer:
+    __buffer: np.ndarray
+    __length: int
+    __growth_factor: float
+    __row_major: bool
+
+    def __init__(self, nb_of_columns: int, initial_capacity: int = 4096, dtype: type = float,
+                 growth_factor: float = 1.5, row_major: bool = False):
+        if nb_of_columns < 1:
+            raise Exception("GrowableBuffer: Must have at least one column !")
+
+        if growth_factor <= 1:
+            raise Exception("GrowableBuffer: Growth factor must be greater than one !")
+
+        self.__row_major = row_major
+
+        if row_major:
+            self.__buffer = np.empty((max(1, initial_capacity), nb_of_columns), dtype=dtype)
+        else:
+            self.__buffer = np.empty((nb_of_columns, max(1, initial_capacity)), dtype=dtype)
+
+        self.__length = 0
+        self.__growth_factor = growth_factor
+
+    #   Number of rows stored in the buffer
+    def __len__(self) -> int:
+        return self.__length
+
+    #   Get the buffer seen as (number of columns, capacity) whatever its layout
+    def __get_columns_buffer(self) -> np.ndarray:
+        return self.__buffer.T if self.__row_major else self.__buffer
+
+    #   Number of rows that can be stored before the next reallocation
+    def get_capacity(self) -> int:
+        return self.__get_columns_buffer().shape[1]
+
+    #   Will reallocate the buffer to be able to store at least the given number of rows
+    def reserve(self, capacity: int) -> None:
+        if capacity <= self.get_capacity():
+            return
+
+        if self.__row_major:
+            new_buffer = np.empty((capacity, self.__buffer.shape[1]), dtype=self.__buffer.dtype)
+            new_buffer[:self.__length] = self.__buffer[:self.__length]
+        else:
+            new_buffer = np.empty((self.__buffer.shape[0], capacity), dtype=self.__buffer.dtype)
+            new_buffer[:, :self.__length] = self.__buffer[:, :self.__length]
+
+        self.__buffer = new_buffer
+
+    #   Append a block of rows given as a (number of rows, number of columns) array
+    def append(self, rows: np.ndarray) -> None:
+        self.append_columns(rows.T)
+
+    #   Append a block of rows given column by column as a (number of columns, number of rows) array
+    def append_columns(self, columns: np.ndarray) -> None:
+        nb_of_rows = columns.shape[1]
+        needed_capacity = self.__length + nb_of_rows
+
+        if needed_capacity > self.get_capacity():
+            self.reserve(max(needed_capacity, int(self.get_capacity() * self.__growth_factor)))
+
+        self.__get_columns_buffer()[:, self.__length:needed_capacity] = columns
+        self.__length = needed_capacity
+
+    #   Get a view over the filled part of the buffer, shape is (number of columns, number of rows)
+    def get_columns(self) -> np.ndarray:
+        return self.__get_columns_buffer()[:, :self.__length]
+
+    #   Get a view over the filled part of the buffer, shape is (number of rows, number of columns)
+    def get_rows(self) -> np.ndarray:
+        return self.get_columns().T
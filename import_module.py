@@ -9,16 +9,476 @@
 
 #   Import of basic modules
 import csv
-from xml.dom import minidom
+import glob
+import io
+import itertools
+import multiprocessing
+import operator
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, wait
 from enum import Enum
+import numpy as np
 import svg.path as svg
 
 #   Import of custom modules
 from dataset import DataSet
-from position import Position
+from dataset_cache import DataSetCache
+from columnar_store import open_columnar
+from growable_buffer import GrowableBuffer
+from import_profiler import stop_memory_tracing
+from import_progress import ImportProgress, ImportPhase, ImportCancelled, start_import_phase
+from import_selection import ImportSelection
 from model import Model
-from utils import get_file, get_sensor_number, get_next_data_column_index, is_a_numerical_value, is_a_int_value, \
-    extract_numerical_value
+from resampling import Resampler, ResamplingSettings
+from ring_buffer_dataset import RingBufferDataSet, get_capacity_for_memory
+from sensors_storage import StorageType
+from svg_layout import SvgLayout, SvgLayoutRegistry, parse_svg_layout
+from utils import get_file, get_binary_file, get_file_size, get_compression, get_sensor_number, get_next_data_column_index, \
+    decode_numerical_columns, detect_decimal_separators, is_a_int_value
+
+#   Number of CSV rows decoded at once by the streaming reader
+CSV_CHUNK_SIZE = 16384
+
+#   Patterns of the data files listed in a directory for a batch import (plain or compressed CSV files)
+BATCH_FILE_PATTERNS = ["*.csv", "*.csv.gz", "*.csv.xz", "*.zip"]
+
+#   Minimum size (in bytes) of a CSV body to be decoded by multiple processes, smaller bodies are decoded serially
+PARALLEL_MIN_BODY_SIZE = 16 * 1024 * 1024
+
+#   Number of byte ranges given to each worker process (more ranges than workers limits the memory used per range)
+PARALLEL_RANGES_PER_WORKER = 4
+
+#   Time (in seconds) between two checks of the cancellation of an import while waiting for worker processes
+PARALLEL_CANCELLATION_CHECK_PERIOD = 0.1
+
+#   Size (in bytes) of the start of a CSV body decoded serially to detect decimal separators before a parallel decoding
+PARALLEL_SEPARATORS_DETECTION_SIZE = 1024 * 1024
+
+
+#   Will decode the numerical body of a CSV file (the temporal column followed by sensors columns) into a 2D array
+#   All cells are decoded at once with the given decimal separator of each column, columns whose separator is not
+#   known yet (None, or every column if no separators are given) get the one detected in these rows
+#   If column_indices is given, only these columns of the rows are decoded (other cells are never converted) and
+#   nb_of_columns must be their number
+#   The first non-numerical cell (row-wise) is reported with an exception
+#   Return the decoded array and the decimal separator of each column (None if it has no decimal value yet)
+def decode_numerical_body(csv_rows: [[str]], nb_of_columns: int,
+                          decimal_separators: list[str | None] | None = None,
+                          column_indices: list[int] | None = None) -> (np.ndarray, list[str | None] | None):
+    if column_indices is None:
+        #   Keep only the numerical part of each row, missing cells are considered as empty
+        body = np.array([row[:nb_of_columns] if len(row) >= nb_of_columns
+                         else row + [''] * (nb_of_columns - len(row)) for row in csv_rows], dtype=str)
+    else:
+        #   Keep only the selected cells of each row, missing cells are considered as empty
+        select_cells = operator.itemgetter(*column_indices)
+        min_row_length = max(column_indices) + 1
+        body = np.array([select_cells(row) if len(row) >= min_row_length
+                         else [row[i] if i < len(row) else '' for i in column_indices] for row in csv_rows],
+                        dtype=str).reshape(len(csv_rows), nb_of_columns)
+
+    if body.size == 0:
+        return np.empty((0, nb_of_columns), dtype=float), decimal_separators
+
+    if decimal_separators is None:
+        decimal_separators = detect_decimal_separators(body)
+    elif None in decimal_separators:
+        decimal_separators = [known_separator or detected_separator for known_separator, detected_separator
+                              in zip(decimal_separators, detect_decimal_separators(body))]
+
+    values, invalid_mask = decode_numerical_columns(body, [separator or '.' for separator in decimal_separators])
+
+    #   Report the first invalid cell with the same messages as the cell by cell analysis
+    if invalid_mask.any():
+        row, column = divmod(int(np.argmax(invalid_mask)), nb_of_columns)
+
+        if column_indices is not None:
+            column = column_indices[column]
+
+        if column == 0:
+            raise Exception(
+                "CSV LOADER: Error in time values, non numerical value found {:s}".format(
+                    csv_rows[row][0] if len(csv_rows[row]) > 0 else ''))
+
+        raise Exception(
+            "CSV LOADER: Error in values, non numerical value found for the sensor {:d}".format(column - 1))
+
+    return values, decimal_separators
+
+
+#   Will decode the numerical body of a CSV file from a CSV reader chunk by chunk without keeping raw rows
+#   Separator rows ("--" in the temporal column) are skipped if asked, size_hint (in characters) is used to pre-size
+#   the buffer
+#   The decimal separator (comma or point) of each column is detected once, in the first chunk containing decimal
+#   values in this column (unless separators are given, e.g. detected at the start of the file)
+#   Return a (number of columns, number of rows) array, one contiguous row per column
+#   If a progress is given, the cancellation of the import is checked before each chunk
+#   If a resampler is given, each decoded chunk is resampled before being stored (the resampler is flushed at the end)
+#   If column_indices is given, only these columns are decoded (the temporal column must be the first one)
+#   If a time window (in the unit of the temporal column) is given, the temporal column of each chunk is decoded first
+#   and only the rows inside the window are decoded, the reading stops at the first row after the window (temporal
+#   values are increasing)
+def stream_numerical_body(csv_reader, nb_of_columns: int, size_hint: int = 0,
+                          chunk_size: int = CSV_CHUNK_SIZE, skip_separators: bool = True,
+                          progress: ImportProgress | None = None,
+                          resampler: Resampler | None = None,
+                          column_indices: list[int] | None = None,
+                          time_window: tuple[float, float] | None = None,
+                          decimal_separators: list[str | None] | None = None) -> np.ndarray:
+    numerical_buffer: GrowableBuffer | None = None
+    chunk: [[str]] = []
+    window_ended = False
+
+    #   Decode a chunk of rows and append it to the buffer
+    def flush_chunk():
+        nonlocal numerical_buffer, decimal_separators, window_ended
+
+        if progress is not None:
+            progress.check_cancelled()
+
+        rows = chunk
+
+        #   Keep only the rows inside the time window
+        if time_window is not None:
+            temporal_values = decode_numerical_body(chunk, 1,
+                                                    None if decimal_separators is None else decimal_separators[:1],
+                                                    [0 if column_indices is None else column_indices[0]])[0][:, 0]
+            window_ended = bool(temporal_values[-1] > time_window[1])
+
+            rows_indices = np.flatnonzero((temporal_values >= time_window[0]) & (temporal_values <= time_window[1]))
+            rows = [chunk[i] for i in rows_indices.tolist()]
+
+        numerical_rows, decimal_separators = decode_numerical_body(rows, nb_of_columns, decimal_separators,
+                                                                   column_indices)
+        numerical_columns = numerical_rows.T if resampler is None else resampler.feed(numerical_rows.T)
+
+        #   The buffer is sized from the average length of the rows of the first chunk (and from the proportion of
+        #   rows kept by the resampler), the number of rows inside a time window cannot be known in advance
+        if numerical_buffer is None:
+            average_row_size = max(1, sum(len(cell) + 1 for cell_row in chunk for cell in cell_row) // len(chunk))
+            nb_of_rows = size_hint // average_row_size + 1 if time_window is None else 0
+
+            if resampler is not None:
+                nb_of_rows = nb_of_rows * (numerical_columns.shape[1] + 1) // len(chunk) + 1
+
+            numerical_buffer = GrowableBuffer(nb_of_columns, max(numerical_columns.shape[1], nb_of_rows))
+
+        numerical_buffer.append_columns(numerical_columns)
+        chunk.clear()
+
+    for row in csv_reader:
+        #   Skip separator rows
+        if skip_separators and len(row) > 0 and row[0] == "--":
+            continue
+
+        chunk.append(row)
+
+        if len(chunk) >= chunk_size:
+            flush_chunk()
+
+            if window_ended:
+                break
+
+    if len(chunk) > 0:
+        flush_chunk()
+
+    if numerical_buffer is None:
+        numerical_buffer = GrowableBuffer(nb_of_columns, 1)
+
+    if resampler is not None:
+        numerical_buffer.append_columns(resampler.flush())
+
+    return numerical_buffer.get_columns()
+
+
+#   Will split the [start; end[ byte range of a file into (at most) nb_of_ranges ranges, each one ending on a newline
+#   WARNING:    Quoted values containing newlines are not supported
+def split_at_newlines(file_path: str, start: int, end: int, nb_of_ranges: int) -> [(int, int)]:
+    boundaries = [start]
+
+    with open(file_path, 'rb') as file:
+        for i in range(1, nb_of_ranges):
+            #   Go to the end of the line containing the approximate boundary
+            file.seek(max(start + (end - start) * i // nb_of_ranges, boundaries[-1]))
+            file.readline()
+            boundary = file.tell()
+
+            if boundaries[-1] < boundary < end:
+                boundaries.append(boundary)
+
+    boundaries.append(end)
+
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+#   Will decode the numerical body contained in the [start; end[ byte range of a CSV file
+#   Used by worker processes, so every parameter must be picklable (csv_dialect is a dict of csv.reader parameters)
+#   Decimal separators are the ones detected at the start of the file, only columns without any are detected in the
+#   range itself
+#   column_indices and time_window select the decoded columns and rows (see stream_numerical_body)
+def decode_numerical_byte_range(file_path: str, start: int, end: int, nb_of_columns: int,
+                                csv_dialect: dict, encoding: str, skip_separators: bool,
+                                column_indices: list[int] | None = None,
+                                time_window: tuple[float, float] | None = None,
+                                decimal_separators: list[str | None] | None = None) -> np.ndarray:
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode(encoding)
+
+    return stream_numerical_body(csv.reader(io.StringIO(text, newline=''), **csv_dialect), nb_of_columns,
+                                 len(text), skip_separators=skip_separators, column_indices=column_indices,
+                                 time_window=time_window, decimal_separators=decimal_separators)
+
+
+#   Will detect the decimal separator of each decoded column from the start of the body of a CSV file (see
+#   PARALLEL_SEPARATORS_DETECTION_SIZE), so every byte range of a parallel decoding uses the same ones
+def detect_body_decimal_separators(file_path: str, body_start: int, nb_of_columns: int, csv_dialect: dict,
+                                   encoding: str, skip_separators: bool,
+                                   column_indices: list[int] | None = None) -> list[str | None] | None:
+    with open(file_path, 'rb') as file:
+        file.seek(body_start)
+        prefix = file.read(PARALLEL_SEPARATORS_DETECTION_SIZE)
+
+    #   Only complete rows are decoded
+    text = prefix[:prefix.rfind(b"\n") + 1].decode(encoding)
+    csv_rows = [row for row in csv.reader(io.StringIO(text, newline=''), **csv_dialect)
+                if not (skip_separators and len(row) > 0 and row[0] == "--")]
+
+    return decode_numerical_body(csv_rows, nb_of_columns, None, column_indices)[1]
+
+
+#   Get the context used to start worker processes
+#   Imports run in a thread of the graphical interface, so worker processes are never forked from this multithreaded
+#   process (a fork could copy locks held by other threads and deadlock)
+def get_process_context() -> multiprocessing.context.BaseContext:
+    return multiprocessing.get_context("forkserver" if "forkserver" in multiprocessing.get_all_start_methods()
+                                       else "spawn")
+
+
+#   Will wait for the result of a task given to worker processes
+#   If a progress is given, the cancellation of the import is checked while waiting
+def get_worker_result(future: Future, progress: ImportProgress | None = None):
+    if progress is not None:
+        while not future.done():
+            progress.check_cancelled()
+            wait([future], timeout=PARALLEL_CANCELLATION_CHECK_PERIOD)
+
+    return future.result()
+
+
+#   Will decode the numerical body of a CSV file (from the body_start byte to the end of the file) with a pool of
+#   processes, each one decoding byte ranges of the file. Partial results are concatenated in order
+#   column_indices and time_window select the decoded columns and rows (see stream_numerical_body)
+#   If a progress is given, the cancellation of the import is checked while ranges are decoded, ranges not decoded
+#   yet are then abandoned
+#   Return a (number of columns, number of rows) array, one contiguous row per column
+def decode_numerical_body_parallel(file_path: str, body_start: int, nb_of_columns: int, csv_dialect: dict,
+                                   nb_of_workers: int, encoding: str = "ISO-8859-1",
+                                   skip_separators: bool = True,
+                                   column_indices: list[int] | None = None,
+                                   time_window: tuple[float, float] | None = None,
+                                   progress: ImportProgress | None = None) -> np.ndarray:
+    byte_ranges = split_at_newlines(file_path, body_start, os.path.getsize(file_path),
+                                    nb_of_workers * PARALLEL_RANGES_PER_WORKER)
+
+    decimal_separators = detect_body_decimal_separators(file_path, body_start, nb_of_columns, csv_dialect, encoding,
+                                                        skip_separators, column_indices)
+
+    executor = ProcessPoolExecutor(max_workers=nb_of_workers, mp_context=get_process_context(),
+                                   initializer=stop_memory_tracing)
+
+    try:
+        futures = [executor.submit(decode_numerical_byte_range, file_path, start, end, nb_of_columns, csv_dialect,
+                                   encoding, skip_separators, column_indices, time_window, decimal_separators)
+                   for start, end in byte_ranges]
+
+        partial_bodies = [get_worker_result(future, progress) for future in futures]
+
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return np.concatenate(partial_bodies, axis=1)
+
+
+"""
+
+    CsvFollower
+
+    In charge of following a CSV file which is still being written: the file is kept open and only the complete rows
+    appended since the last read are decoded.
+
+"""
+
+
+class CsvFollower:
+    __file: io.BufferedReader
+    __csv_dialect: dict
+    __nb_of_columns: int
+    __encoding: str
+    __pending_bytes: bytes
+    __resampler: Resampler | None
+    __column_indices: list[int] | None
+    __time_window: tuple[float, float] | None
+
+    #   file must be opened in binary mode and positioned at the start of the rows to follow
+    #   csv_dialect is a dict of csv.reader parameters
+    #   If a resampler is given, it is kept from one read to another, so the last (incomplete) group of samples of a
+    #   read is only given by a next read
+    #   column_indices and time_window select the decoded columns and rows (see stream_numerical_body)
+    def __init__(self, file: io.BufferedReader, csv_dialect: dict, nb_of_columns: int,
+                 encoding: str = "ISO-8859-1", resampler: Resampler | None = None,
+                 column_indices: list[int] | None = None, time_window: tuple[float, float] | None = None):
+        self.__file = file
+        self.__csv_dialect = csv_dialect
+        self.__nb_of_columns = nb_of_columns
+        self.__encoding = encoding
+        self.__pending_bytes = b""
+        self.__resampler = resampler
+        self.__column_indices = column_indices
+        self.__time_window = time_window
+
+    #   Will decode the complete rows appended since the last read, an incomplete last row is kept for the next read
+    #   Return a (number of columns, number of rows) array, one contiguous row per column
+    def read_new_rows(self) -> np.ndarray:
+        self.__pending_bytes += self.__file.read()
+
+        last_newline = self.__pending_bytes.rfind(b"\n")
+
+        if last_newline < 0:
+            return np.empty((self.__nb_of_columns, 0), dtype=float)
+
+        text = self.__pending_bytes[:last_newline + 1].decode(self.__encoding)
+        self.__pending_bytes = self.__pending_bytes[last_newline + 1:]
+
+        numerical_columns = stream_numerical_body(csv.reader(io.StringIO(text, newline=''), **self.__csv_dialect),
+                                                  self.__nb_of_columns, len(text),
+                                                  column_indices=self.__column_indices,
+                                                  time_window=self.__time_window)
+
+        if self.__resampler is not None:
+            return self.__resampler.feed(numerical_columns)
+
+        return numerical_columns
+
+    #   Will close the followed file
+    def close(self) -> None:
+        self.__file.close()
+
+
+#   Will find the columns to decode for the sensors selected among the sensors of a CSV file (all of them if there is
+#   no selection), the temporal column is the first column of a CSV file and is always decoded
+#   Return the index of each selected sensor and the indices of the columns to decode (None to decode every column)
+def get_selected_columns(selection: ImportSelection | None, sensors_name: [str]) -> ([int], list[int] | None):
+    if selection is None or selection.get_sensors_name() is None:
+        return list(range(len(sensors_name))), None
+
+    sensors_indices = selection.get_sensors_indices(sensors_name)
+
+    return sensors_indices, [0] + [i + 1 for i in sensors_indices]
+
+
+#   Will list the CSV files of a batch import from a directory (every plain or compressed CSV file in it) or from a
+#   glob pattern
+#   Return paths sorted by name
+def list_batch_files(directory_or_pattern: str) -> [str]:
+    if os.path.isdir(directory_or_pattern):
+        file_paths = itertools.chain.from_iterable(glob.glob(os.path.join(directory_or_pattern, pattern))
+                                                   for pattern in BATCH_FILE_PATTERNS)
+    else:
+        file_paths = glob.glob(directory_or_pattern)
+
+    return sorted(file_path for file_path in file_paths if os.path.isfile(file_path))
+
+
+#   Will import the CSV file of a CSV+SVG pair whose SVG layout has already been parsed
+#   Used by worker processes of batch imports, so every parameter must be picklable
+#   If resampling settings are given, data is resampled while it is decoded
+#   If a selection is given, only the selected sensors and samples are decoded
+#   Values of sensors are stored with the given storage type (see SensorsStorage)
+#   Return the dataset, raise an exception on error
+def import_dataset_with_layout(file_path: str, layout: SvgLayout,
+                               resampling: ResamplingSettings | None = None,
+                               selection: ImportSelection | None = None,
+                               storage_type: StorageType = StorageType.float64) -> DataSet:
+    with get_file(file_path) as file:
+        first_line = file.readline()
+
+        #   Get CSV parameters of the CSV file, nobody can be asked for them in a batch
+        csv_parameters = csv.Sniffer().sniff(first_line)
+
+        csv_reader = csv.reader(itertools.chain((first_line,), file), delimiter=csv_parameters.delimiter,
+                                quotechar=csv_parameters.quotechar, quoting=csv_parameters.quoting)
+
+        #   Get sensors names and the number of sensors
+        csv_header = next(csv_reader)
+        nb_of_sensors = len(csv_header) - 1
+        sensors_name: [str] = csv_header[1:nb_of_sensors + 1]
+
+        if nb_of_sensors < 1:
+            raise Exception("CSV LOADER: Didn't find any sensors !")
+
+        sensors_indices, column_indices = get_selected_columns(selection, sensors_name)
+
+        #   Decode the numerical body, "--" separator rows are skipped
+        numerical_columns = stream_numerical_body(csv_reader, len(sensors_indices) + 1, get_file_size(file_path),
+                                                  resampler=None if resampling is None
+                                                  else resampling.create_resampler(),
+                                                  column_indices=column_indices,
+                                                  time_window=None if selection is None
+                                                  else selection.get_time_window())
+
+    if numerical_columns.shape[1] == 0 and selection is not None and selection.get_time_range() is not None:
+        raise Exception("CSV LOADER: No data found in the selected time range !")
+
+    #   Every sensor of the layout is matched with CSV data, even the ones which are not selected
+    sensors_position, sensors_characteristics = layout.get_sensors_situation(sensors_name)
+
+    return DataSet(numerical_columns[0],
+                   [sensors_name[i] for i in sensors_indices],
+                   sensors_position[sensors_indices],
+                   [sensors_characteristics[i] for i in sensors_indices],
+                   numerical_columns[1:],
+                   layout.get_map_width(),
+                   layout.get_map_height(),
+                   storage_type=storage_type)
+
+
+"""
+
+    BatchImportResult
+
+    In charge of storing the result of a batch import: the dataset of each imported CSV file, the error of each CSV
+    file that couldn't be imported and the background paths of the shared SVG file.
+
+"""
+
+
+class BatchImportResult:
+    __datasets: dict[str, DataSet]
+    __errors: dict[str, Exception]
+    __svg_bg_path: [svg.Path]
+
+    def __init__(self, datasets: dict[str, DataSet], errors: dict[str, Exception], svg_bg_path: [svg.Path]):
+        self.__datasets = datasets
+        self.__errors = errors
+        self.__svg_bg_path = svg_bg_path
+
+    #   Number of imported datasets
+    def __len__(self) -> int:
+        return len(self.__datasets)
+
+    #   Get imported datasets by path of their CSV file
+    def get_datasets(self) -> dict[str, DataSet]:
+        return self.__datasets
+
+    #   Get errors by path of the CSV file that couldn't be imported
+    def get_errors(self) -> dict[str, Exception]:
+        return self.__errors
+
+    #   Get background paths of the shared SVG file
+    def get_svg_bg_path(self) -> [svg.Path]:
+        return self.__svg_bg_path
+
 
 """
 
@@ -33,11 +493,179 @@ class DataImportModule:
     class ImportTypes(Enum):
         Full_File = 1
         Data_SVG_Files = 2
+        Columnar_File = 3
+        Followed_Data_SVG_Files = 4
+        Batch_Data_SVG_Files = 5
 
     __generated_model: Model
+    __cache: DataSetCache | None
+    __nb_of_workers: int
+    __follower: CsvFollower | None
+    __layout_registry: SvgLayoutRegistry | None
+    __resampling: ResamplingSettings | None
+    __selection: ImportSelection | None
+    __follow_memory_limit: int | None
+    __storage_type: StorageType
+
+    #   If a cache is given, already imported files will be loaded from it and new imports will be saved into it
+    #   With more than one worker, big CSV files are decoded by a pool of nb_of_workers processes
+    #   If a layout registry is given, SVG layouts are parsed only once and shared with other imports using it
+    #   If resampling settings are given, imported data is resampled while it is parsed
+    #   If a selection is given, only the selected sensors and samples are parsed and imported
+    #   If a follow memory limit (in bytes) is given, followed files only keep their last frames fitting in it (see
+    #   RingBufferDataSet)
+    #   Values of sensors of CSV imports are stored with the given storage type (see SensorsStorage), the cache is only
+    #   used with the full precision one (followed files with a follow memory limit and columnar files keep full precision)
+    def __init__(self, cache: DataSetCache | None = None, nb_of_workers: int = 1,
+                 layout_registry: SvgLayoutRegistry | None = None,
+                 resampling: ResamplingSettings | None = None,
+                 selection: ImportSelection | None = None,
+                 follow_memory_limit: int | None = None,
+                 storage_type: StorageType = StorageType.float64):
+        self.__cache = cache
+        self.__nb_of_workers = max(1, nb_of_workers)
+        self.__layout_registry = layout_registry
+        self.__resampling = resampling
+        self.__selection = selection
+        self.__follow_memory_limit = follow_memory_limit
+        self.__storage_type = storage_type
+        self.__follower = None
+
+    #   Will create the resampler of an import (None if imported data is not resampled)
+    #   time_scale is the duration (in seconds) of one unit of the temporal column
+    def __create_resampler(self, time_scale: float = 1) -> Resampler | None:
+        if self.__resampling is None:
+            return None
+
+        return self.__resampling.create_resampler(time_scale)
+
+    #   Will give the selected time range in the unit of the temporal column (None if every sample is imported)
+    def __get_time_window(self, time_scale: float = 1) -> tuple[float, float] | None:
+        if self.__selection is None:
+            return None
+
+        return self.__selection.get_time_window(time_scale)
+
+    #   Will check that the selected time range contains data once the numerical body has been decoded
+    def __check_selected_rows(self, numerical_columns: np.ndarray) -> None:
+        if numerical_columns.shape[1] == 0 and self.__get_time_window() is not None:
+            raise Exception("CSV LOADER: No data found in the selected time range !")
+
+    #   Will decode the numerical body of a CSV file
+    #   The body is decoded serially from the CSV reader, or, if the module has more than one worker and the body is
+    #   big enough, by a pool of processes directly from the file (the CSV reader is then left unused)
+    #   Compressed files are always decoded serially, while they are decompressed
+    #   body_start is the byte offset of the first row of the body in the file
+    #   Decoded data is resampled if the module has resampling settings (time_scale is the duration in seconds of one
+    #   unit of the temporal column)
+    #   Only the given columns are decoded (every column if None) and only the rows of the selected time range
+    def __decode_body(self, file_path: str, csv_reader, body_start: int, csv_parameters, nb_of_columns: int,
+                      skip_separators: bool, progress: ImportProgress | None, time_scale: float = 1,
+                      column_indices: list[int] | None = None) -> np.ndarray:
+        start_import_phase(progress, ImportPhase.parse)
+
+        body_size = get_file_size(file_path) - body_start
+        resampler = self.__create_resampler(time_scale)
+        time_window = self.__get_time_window(time_scale)
+
+        if self.__nb_of_workers > 1 and body_size >= PARALLEL_MIN_BODY_SIZE and get_compression(file_path) is None:
+            numerical_columns = decode_numerical_body_parallel(file_path, body_start, nb_of_columns,
+                                                               {"delimiter": csv_parameters.delimiter,
+                                                                "quotechar": csv_parameters.quotechar,
+                                                                "quoting": csv_parameters.quoting},
+                                                               self.__nb_of_workers,
+                                                               skip_separators=skip_separators,
+                                                               column_indices=column_indices,
+                                                               time_window=time_window,
+                                                               progress=progress)
+
+            #   Byte ranges are resampled once put together, groups of samples may overlap two ranges
+            if resampler is not None:
+                numerical_columns = np.concatenate((resampler.feed(numerical_columns), resampler.flush()), axis=1)
+
+            return numerical_columns
+
+        return stream_numerical_body(csv_reader, nb_of_columns, body_size, skip_separators=skip_separators,
+                                     progress=progress, resampler=resampler, column_indices=column_indices,
+                                     time_window=time_window)
+
+    #   Will try to load a dataset from the cache
+    #   Return the cache entry (or None if there is no entry) and the key used for it (or None if there is no cache)
+    def __load_from_cache(self, import_type: 'DataImportModule.ImportTypes', file_paths: [str]):
+        #   Cached datasets are stored with full precision
+        if self.__cache is None or self.__storage_type != StorageType.float64:
+            return None, None
+
+        try:
+            #   Data resampled with different settings must not share the same entry
+            import_type_name = import_type.name
+
+            if self.__resampling is not None:
+                import_type_name += ":" + self.__resampling.get_key()
 
-    def __init__(self):
-        pass
+            if self.__selection is not None:
+                import_type_name += ":" + self.__selection.get_key()
+
+            cache_key = self.__cache.get_key(import_type_name, file_paths)
+            return self.__cache.load(cache_key), cache_key
+
+        except Exception as e:
+            print("An error occurred during the loading of the dataset from the cache")
+            print("\tException: {0}".format(e))
+            return None, None
+
+    #   Will save a dataset into the cache, a failure is not fatal for the import
+    def __save_into_cache(self, cache_key: str | None, dataset: DataSet, svg_bg_path: [svg.Path] = None) -> None:
+        if self.__cache is None or cache_key is None:
+            return
+
+        try:
+            self.__cache.save(cache_key, dataset, svg_bg_path)
+
+        except Exception as e:
+            print("An error occurred during the saving of the dataset into the cache")
+            print("\tException: {0}".format(e))
+
+    #   Get the layout described by a SVG file, from the layout registry if the module has one
+    #   The SVG file may be compressed, or be a zip archive containing it (and the CSV file)
+    def __get_svg_layout(self, svg_file_path: str) -> SvgLayout:
+        if self.__layout_registry is not None:
+            return self.__layout_registry.get_layout(svg_file_path)
+
+        with get_binary_file(svg_file_path, ".svg") as file:
+            return parse_svg_layout(file.read())
+
+    #   Will match the layout of a CSV+SVG import with the data of the CSV file and initialise the model
+    #   sensors_data only holds the data of the sensors whose indices (in sensors_name) are given
+    #   If a memory limit (in bytes) is given, the dataset only keeps the last frames fitting in it (see
+    #   RingBufferDataSet)
+    #   Return the model and the background paths, raise an exception on error
+    def __build_model_with_layout(self, layout: SvgLayout, temporal_set: np.ndarray, sensors_name: [str],
+                                  sensors_indices: [int], sensors_data: np.ndarray, on_no_bg_path_found: 'function',
+                                  progress: ImportProgress | None, memory_limit: int | None = None):
+        #   Every sensor of the layout is matched with CSV data, even the ones which are not selected
+        sensors_position, sensors_characteristics = layout.get_sensors_situation(sensors_name)
+
+        dataset_arguments = (temporal_set,
+                             [sensors_name[i] for i in sensors_indices],
+                             sensors_position[sensors_indices],
+                             [sensors_characteristics[i] for i in sensors_indices],
+                             sensors_data,
+                             layout.get_map_width(),
+                             layout.get_map_height(),
+                             progress)
+
+        #   Initialise a dataset
+        if memory_limit is None:
+            self.__generated_model = Model(DataSet(*dataset_arguments, storage_type=self.__storage_type), self)
+        else:
+            capacity = get_capacity_for_memory(memory_limit, len(sensors_indices))
+            self.__generated_model = Model(RingBufferDataSet(capacity, *dataset_arguments), self)
+
+        if not layout.is_bg_path_complete():
+            on_no_bg_path_found()
+
+        return self.__generated_model, list(layout.get_bg_path())
 
     """
 
@@ -47,18 +675,28 @@ class DataImportModule:
     #   Full file data (data + positions)
     def get_model_ff(self, file_path: str,
                      on_delimiters_error: 'function',
-                     on_error: 'function') -> Model | None:
+                     on_error: 'function',
+                     progress: ImportProgress | None = None) -> Model | None:
         try:
-            #   file is used to extract data
-            #   file_tmp is used to get the first line and the file is closed immediately after
+            start_import_phase(progress, ImportPhase.read)
+
+            #   Skip the whole analysis if the file has already been imported
+            cache_entry, cache_key = self.__load_from_cache(self.ImportTypes.Full_File, [file_path])
+
+            if cache_entry is not None:
+                self.__generated_model = Model(cache_entry[0], self)
+                return self.__generated_model
+
+            #   file is opened only once, the first line is used to sniff the CSV structure and then
+            #   given back to the CSV reader with the rest of the file
             file = get_file(file_path)
-            file_tmp = get_file(file_path)
 
-            if not (file.readable() or file_tmp.readable()):
+            if not file.readable():
                 raise Exception("Selected file isn't readable !")
 
-            first_line = file_tmp.readline()
-            file_tmp.close()
+            start_import_phase(progress, ImportPhase.sniff)
+
+            first_line = file.readline()
 
             #   Get CSV parameters of the selected CSV file
             csv_parameters = csv.Sniffer().sniff(first_line)
@@ -69,11 +707,12 @@ class DataImportModule:
                 answered_delimiter = on_delimiters_error()
                 csv_parameters = csv.Sniffer().sniff(first_line, answered_delimiter)
 
-            #   Parse the CSV into an iterator
-            csv_reader = csv.reader(file, delimiter=csv_parameters.delimiter,
+            #   Parse the CSV into an iterator, rows are consumed as they are read
+            csv_reader = csv.reader(itertools.chain((first_line,), file), delimiter=csv_parameters.delimiter,
                                     quotechar=csv_parameters.quotechar, quoting=csv_parameters.quoting)
-            #   Unpack interator content
-            csv_data = [*csv_reader]
+
+            #   Only the header and the first rows (the ones holding map and sensors situation data) are kept
+            csv_data = [next(csv_reader)]
 
             #   Get sensors names and the number of sensors
             nb_of_sensors = get_sensor_number(csv_data[0])
@@ -88,51 +727,54 @@ class DataImportModule:
             if situation_data_index == -1:
                 raise Exception("CSV LOADER: Didn't find any sensors situation data !")
 
-            #   Initialise sensor arrays
-            sensors_data = [[] for _ in range(nb_of_sensors)]
-            temporal_set: [float] = []
-            sensors_position: [Position] = []
-
-            for row in csv_data[1::]:
-                #   Get temporal value
-                if is_a_numerical_value(row[0]):
-                    temporal_set.append(float(row[0].replace(',', '.')) * 0.001)
-                else:
-                    raise Exception(
-                        "CSV LOADER: Error in time values, non numerical value found {:s}".format(row[0]))
-
-                #   Get sensors data
-                for i in range(nb_of_sensors):
-                    if is_a_numerical_value(row[i + 1]):
-                        reformatted_value = row[i + 1].replace(',', '.')
-                        sensors_data[i].append(float(reformatted_value))
-                    else:
-                        raise Exception(
-                            "CSV LOADER: Error in values, non numerical value found for the sensor {:d}".format(i))
+            csv_data += itertools.islice(csv_reader, 3 + 3 * nb_of_sensors)
+
+            sensors_indices, column_indices = get_selected_columns(self.__selection, sensors_name)
+
+            #   Decode the whole numerical body (temporal column + selected sensors columns)
+            numerical_columns = self.__decode_body(file_path,
+                                                   itertools.chain(csv_data[1::], csv_reader),
+                                                   len(first_line.encode(file.encoding)),
+                                                   csv_parameters,
+                                                   len(sensors_indices) + 1,
+                                                   False,
+                                                   progress,
+                                                   0.001,
+                                                   column_indices)
+            file.close()
+
+            self.__check_selected_rows(numerical_columns)
+
+            #   Temporal values are given in milliseconds
+            temporal_set: np.ndarray = numerical_columns[0] * 0.001
+            sensors_data: np.ndarray = numerical_columns[1:]
+
+            #   Decode the whole sensors situation column at once (map size first, then x and y of each sensor)
+            situation_values, situation_invalid = decode_numerical_columns(
+                [row[situation_data_index] if len(row) > situation_data_index else '' for row in csv_data[1:]])
 
             #   Get map size data
-            if is_a_numerical_value(csv_data[1][situation_data_index]) and is_a_numerical_value(csv_data[2][situation_data_index]):
-                map_height = int(csv_data[1][situation_data_index])
-                map_width = int(csv_data[2][situation_data_index])
-            else:
+            if situation_invalid[0] or situation_invalid[1]:
                 raise Exception(
                     "CSV LOADER: Error in values, non numerical values found in map size")
 
-            #   Get sensors situation data
-            for i in range(nb_of_sensors):
-                y_axis = 5 + 3 * i
+            map_height = int(situation_values[0])
+            map_width = int(situation_values[1])
+
+            #   Get sensors situation data, each sensor uses 3 rows (x, y and an empty row)
+            positions_invalid = situation_invalid[4::3][:nb_of_sensors] | situation_invalid[5::3][:nb_of_sensors]
 
-                if is_a_numerical_value(csv_data[y_axis][situation_data_index]) and is_a_numerical_value(
-                        csv_data[y_axis + 1][situation_data_index]):
-                    sensors_position.append(Position(int(csv_data[y_axis][situation_data_index]),
-                                                     int(csv_data[y_axis + 1][situation_data_index])))
-                else:
-                    raise ValueError(
-                        "CSV LOADER: Error in values, non numerical values found in position {0}".format(i))
+            if len(positions_invalid) < nb_of_sensors or positions_invalid.any():
+                raise ValueError(
+                    "CSV LOADER: Error in values, non numerical values found in position {0}".format(
+                        int(np.argmax(positions_invalid)) if positions_invalid.any() else len(positions_invalid)))
+
+            sensors_position = np.column_stack((situation_values[4::3][:nb_of_sensors],
+                                                situation_values[5::3][:nb_of_sensors])).astype(int)
 
             sensors_size_data_index = get_next_data_column_index(situation_data_index, csv_data[5]) + 1
 
-            #   Get sensors size data
+            #   Get sensors size data, they must be integer values (e.g. "12.0" is not)
             if is_a_int_value(csv_data[5][sensors_size_data_index]) and is_a_int_value(csv_data[6][sensors_size_data_index]):
                 sensors_height = int(csv_data[5][sensors_size_data_index])
                 sensors_width = int(csv_data[6][sensors_size_data_index])
@@ -140,13 +782,21 @@ class DataImportModule:
                 raise Exception(
                     "CSV LOADER: Error in values, non integer values found in sensors size")
 
-            #   Initialise a dataset
-            self.__generated_model = Model(DataSet(temporal_set, sensors_name, sensors_position,
-                                                   [[sensors_width, sensors_height, 0] for _ in range(nb_of_sensors)],
-                                                   sensors_data, map_width, map_height), self)
+            #   Initialise a dataset with the selected sensors
+            self.__generated_model = Model(DataSet(temporal_set,
+                                                   [sensors_name[i] for i in sensors_indices],
+                                                   sensors_position[sensors_indices],
+                                                   [[sensors_width, sensors_height, 0] for _ in sensors_indices],
+                                                   sensors_data, map_width, map_height, progress,
+                                                   self.__storage_type), self)
+
+            self.__save_into_cache(cache_key, self.__generated_model.get_dataset())
 
             return self.__generated_model
 
+        except ImportCancelled:
+            raise
+
         except Exception as e:
             print("An error occurred during the analysis of the given CSV file")
             print("\tException: {0}".format(e))
@@ -166,25 +816,37 @@ class DataImportModule:
                       on_delimiters_error: 'function',
                       on_position_error: 'function',
                       on_no_bg_path_found: 'function',
-                      on_error: 'function'):
+                      on_error: 'function',
+                      progress: ImportProgress | None = None):
         try:
+            start_import_phase(progress, ImportPhase.read)
+
+            #   Skip the whole analysis if both files have already been imported together
+            cache_entry, cache_key = self.__load_from_cache(self.ImportTypes.Data_SVG_Files,
+                                                            [file_path, svg_file_path])
+
+            if cache_entry is not None:
+                self.__generated_model = Model(cache_entry[0], self)
+                return self.__generated_model, cache_entry[1]
+
             #   Try to open each provided files to fail immediately if a file cannot be opened or if is unreadable
 
-            #   file is used to extract data
-            #   file_tmp is used to get the first line and the file is closed immediately after use
-            #   file_svg = get_file(svg_file_path)
+            #   file is opened only once, the first line is used to sniff the CSV structure and then
+            #   given back to the CSV reader with the rest of the file
             file = get_file(file_path)
-            file_tmp = get_file(file_path)
-            file_svg = get_file(svg_file_path)
+            file_svg = get_binary_file(svg_file_path, ".svg")
 
-            if not (file.readable() or file_tmp.readable()):
+            if not file.readable():
                 raise Exception("Selected CSV file isn't readable !")
 
             if not (file_svg.readable()):
                 raise Exception("Selected SVG file isn't readable !")
 
-            first_line = file_tmp.readline()
-            file_tmp.close()
+            file_svg.close()
+
+            start_import_phase(progress, ImportPhase.sniff)
+
+            first_line = file.readline()
 
             #   Get CSV parameters of the selected CSV file
             csv_parameters = csv.Sniffer().sniff(first_line)
@@ -195,42 +857,38 @@ class DataImportModule:
                 answered_delimiter = on_delimiters_error()
                 csv_parameters = csv.Sniffer().sniff(first_line, answered_delimiter)
 
-            #   Parse the CSV into an iterator
-            csv_reader = csv.reader(file, delimiter=csv_parameters.delimiter,
+            #   Parse the CSV into an iterator, rows are consumed as they are read
+            csv_reader = csv.reader(itertools.chain((first_line,), file), delimiter=csv_parameters.delimiter,
                                     quotechar=csv_parameters.quotechar, quoting=csv_parameters.quoting)
-            #   Unpack interator content
-            csv_data = [*csv_reader]
 
             #   Get sensors names and the number of sensors
-            nb_of_sensors = len(csv_data[0]) - 1
-            sensors_name: [str] = csv_data[0][1:nb_of_sensors + 1]
+            csv_header = next(csv_reader)
+            nb_of_sensors = len(csv_header) - 1
+            sensors_name: [str] = csv_header[1:nb_of_sensors + 1]
 
             if nb_of_sensors < 1:
                 raise Exception("CSV LOADER: Didn't find any sensors !")
 
-            #   Initialise sensor arrays
-            sensors_data = [[] for _ in range(nb_of_sensors)]
-            temporal_set: [float] = []
-
-            for row in csv_data[1::]:
-                if row[0] != "--":
-                    #   Get temporal value
-                    if is_a_numerical_value(row[0]):
-                        temporal_set.append(float(row[0].replace(',', '.')))
-                    else:
-                        raise Exception(
-                            "CSV LOADER: Error in time values, non numerical value found {:s}".format(row[0]))
-
-                    #   Get sensors values
-                    for i in range(nb_of_sensors):
-                        if is_a_int_value(row[i + 1]):
-                            sensors_data[i].append(float(row[i + 1]))
-
-                        elif is_a_numerical_value(row[i + 1]):
-                            sensors_data[i].append(float(row[i + 1].replace(',', '.')))
-                        else:
-                            raise Exception(
-                                "CSV LOADER: Error in values, non numerical value found for the sensor {:d}".format(i))
+            sensors_indices, column_indices = get_selected_columns(self.__selection, sensors_name)
+
+            #   Decode the numerical body, "--" separator rows are skipped
+            numerical_columns = self.__decode_body(file_path,
+                                                   csv_reader,
+                                                   len(first_line.encode(file.encoding)),
+                                                   csv_parameters,
+                                                   len(sensors_indices) + 1,
+                                                   True,
+                                                   progress,
+                                                   column_indices=column_indices)
+            file.close()
+
+            self.__check_selected_rows(numerical_columns)
+
+            temporal_set: np.ndarray = numerical_columns[0]
+            sensors_data: np.ndarray = numerical_columns[1:]
+
+        except ImportCancelled:
+            raise
 
         except Exception as e:
             print("An error occurred during the analysis of the given CSV file")
@@ -242,77 +900,307 @@ class DataImportModule:
 
         try:
             #   Now, we will analyse SVG file
-            svg_xml = minidom.parse(file_svg).getElementsByTagName("svg")[0]
+            svg_bg_path = self.__build_model_with_layout(self.__get_svg_layout(svg_file_path), temporal_set,
+                                                         sensors_name, sensors_indices, sensors_data,
+                                                         on_no_bg_path_found,
+                                                         progress)[1]
 
-            #   Extract map width and height from svg
-            map_width = extract_numerical_value(svg_xml.attributes["width"].value)
-            map_height = extract_numerical_value(svg_xml.attributes["height"].value)
+            self.__save_into_cache(cache_key, self.__generated_model.get_dataset(), svg_bg_path)
 
-            if map_width is None or map_height is None:
-                raise Exception("SVG LOADER: Error in map width or height value")
+            return self.__generated_model, svg_bg_path
 
-            sensors_characteristics = [[] for _ in range(nb_of_sensors)]
-            sensors_position: [Position | None] = [None for _ in range(nb_of_sensors)]
+        except ImportCancelled:
+            raise
 
-            #   Extract sensors positions and dimensions from svg
-            rect_xml = svg_xml.getElementsByTagName("rect")
+        except Exception as e:
+            print("An error occurred during the analysis of the given SVG file")
+            print("\tException: {0}".format(e))
 
-            for rect in rect_xml:
-                index = sensors_name.index(rect.attributes["id"].value)
+            on_position_error(e)
+            #   raise e
+            #   This will indicate an error during the deparsing
+            return None
 
-                #   The analysed sensor from the SVG didn't match with CSV data
-                if index == -1:
-                    Exception("SVG LOADER: Error cannot match the sensor {:s} with CSV data".format(rect.attributes["id"].value))
+    """
 
-                #   Check for any duplication
-                if len(sensors_characteristics[index]) > 0 or sensors_position[index] is None:
-                    Exception("SVG LOADER: Error in duplication found for the sensor {:s} in SVG".format(rect.attributes["id"].value))
+            THIRD IMPORTATION TYPE (COLUMNAR FILE)
 
-                #   Extract sensors_characteristics
-                if 'transform' in rect.attributes:
-                    sensors_characteristics[index] = [int(extract_numerical_value(rect.attributes["width"].value)),
-                                                      int(extract_numerical_value(rect.attributes["height"].value)),
-                                                      int(extract_numerical_value(rect.attributes["transform"].value))]
-                else:
-                    sensors_characteristics[index] = [int(extract_numerical_value(rect.attributes["width"].value)),
-                                                      int(extract_numerical_value(rect.attributes["height"].value)),
-                                                      0]
+    """
+    #   Columnar file import, data is memory-mapped and nothing is recomputed
+    #   Will return the model, the y-axis inversion setting and the background paths stored in the file
+    def get_model_columnar(self, file_path: str, on_error: 'function', progress: ImportProgress | None = None):
+        try:
+            start_import_phase(progress, ImportPhase.read)
 
-                if sensors_characteristics[index][0] <= 0 or sensors_characteristics[index][1] <= 0:
-                    Exception("SVG LOADER: Error in height and width found for the sensor {:s} in SVG".format(rect.attributes["id"].value))
+            dataset, y_axis_inversion, svg_bg_path = open_columnar(file_path)
+            self.__generated_model = Model(dataset, self)
 
-                sensors_position[index] = Position(int(extract_numerical_value(rect.attributes["x"].value)),
-                                                   int(extract_numerical_value(rect.attributes["y"].value)))
+            return self.__generated_model, y_axis_inversion, svg_bg_path
 
-            #   Initialise a dataset
-            self.__generated_model = Model(DataSet(temporal_set,
-                                                   sensors_name,
-                                                   sensors_position,
-                                                   sensors_characteristics,
-                                                   sensors_data,
-                                                   map_width,
-                                                   map_height), self)
+        except ImportCancelled:
+            raise
 
-            svg_bg_xml = svg_xml.getElementsByTagName("path")
-            svg_bg_path = list()
+        except Exception as e:
+            print("An error occurred during the analysis of the given columnar file")
+            print("\tException: {0}".format(e))
 
-            if len(svg_bg_xml) > 0:
-                try:
-                    for svg_bg in svg_bg_xml:
-                        if svg_bg.attributes['id'].value == "BG_PATH":
-                            svg_bg_path.append(svg.parse_path(svg_bg.attributes['d'].value))
+            on_error(e)
+            #   This will indicate an error during the deparsing
+            return None
 
-                except KeyError as e:
-                    on_no_bg_path_found()
+    """
 
-            return self.__generated_model, svg_bg_path
+            FOURTH IMPORTATION TYPE (CSV+SVG, CSV FILE STILL BEING WRITTEN)
+
+    """
+    #   Data + SVG files import where the CSV file is kept open after the import to follow rows appended to it
+    #   (e.g. during a recording), poll_followed_file() will then extend the dataset with them
+    #   Only complete rows are imported and the cache is never used since the CSV file keeps changing
+    def follow_dsf(self,
+                   file_path: str,
+                   svg_file_path: str,
+                   on_delimiters_error: 'function',
+                   on_position_error: 'function',
+                   on_no_bg_path_found: 'function',
+                   on_error: 'function',
+                   progress: ImportProgress | None = None):
+        self.stop_following()
+
+        file = None
+
+        try:
+            start_import_phase(progress, ImportPhase.read)
+
+            #   Rows appended to a compressed file cannot be read as they are written
+            if get_compression(file_path) is not None:
+                raise Exception("CSV LOADER: A compressed CSV file cannot be followed !")
+
+            #   The CSV file is read in binary mode to be able to keep incomplete rows for the next read
+            file = open(file_path, 'rb')
+            file_svg = get_binary_file(svg_file_path, ".svg")
+
+            if not file.readable():
+                raise Exception("Selected CSV file isn't readable !")
+
+            if not (file_svg.readable()):
+                raise Exception("Selected SVG file isn't readable !")
+
+            file_svg.close()
+
+            start_import_phase(progress, ImportPhase.sniff)
+
+            first_line = file.readline()
 
+            if not first_line.endswith(b"\n"):
+                raise Exception("CSV LOADER: The header of the CSV file isn't complete yet !")
+
+            first_line = first_line.decode("ISO-8859-1")
+
+            #   Get CSV parameters of the selected CSV file
+            csv_parameters = csv.Sniffer().sniff(first_line)
+
+            #   The CSV sniffer couldn't detect CSV structure
+            #   Ask user to provide delimiters manually
+            if csv_parameters is None:
+                answered_delimiter = on_delimiters_error()
+                csv_parameters = csv.Sniffer().sniff(first_line, answered_delimiter)
+
+            csv_dialect = {"delimiter": csv_parameters.delimiter,
+                           "quotechar": csv_parameters.quotechar,
+                           "quoting": csv_parameters.quoting}
+
+            #   Get sensors names and the number of sensors
+            csv_header = next(csv.reader(io.StringIO(first_line, newline=''), **csv_dialect))
+            nb_of_sensors = len(csv_header) - 1
+            sensors_name: [str] = csv_header[1:nb_of_sensors + 1]
+
+            if nb_of_sensors < 1:
+                raise Exception("CSV LOADER: Didn't find any sensors !")
+
+            start_import_phase(progress, ImportPhase.parse)
+
+            #   Decode rows already written, "--" separator rows are skipped
+            sensors_indices, column_indices = get_selected_columns(self.__selection, sensors_name)
+
+            follower = CsvFollower(file, csv_dialect, len(sensors_indices) + 1, resampler=self.__create_resampler(),
+                                   column_indices=column_indices, time_window=self.__get_time_window())
+            numerical_columns = follower.read_new_rows()
+
+            if numerical_columns.shape[1] < 1:
+                raise Exception("CSV LOADER: No complete row of data has been written yet !")
+
+            temporal_set: np.ndarray = numerical_columns[0]
+            sensors_data: np.ndarray = numerical_columns[1:]
+
+        except ImportCancelled:
+            if file is not None:
+                file.close()
+            raise
 
         except Exception as e:
+            if file is not None:
+                file.close()
+
+            print("An error occurred during the analysis of the given CSV file")
+            print("\tException: {0}".format(e))
+
+            on_error(e)
+            return None
+
+        try:
+            model_and_bg_path = self.__build_model_with_layout(self.__get_svg_layout(svg_file_path), temporal_set,
+                                                               sensors_name, sensors_indices, sensors_data,
+                                                               on_no_bg_path_found,
+                                                               progress, self.__follow_memory_limit)
+            self.__follower = follower
+
+            return model_and_bg_path
+
+        except ImportCancelled:
+            follower.close()
+            raise
+
+        except Exception as e:
+            follower.close()
+
             print("An error occurred during the analysis of the given SVG file")
             print("\tException: {0}".format(e))
 
             on_position_error(e)
-            #   raise e
             #   This will indicate an error during the deparsing
             return None
+
+    #   Will extend the dataset of the followed model with the complete rows appended to the CSV file since the last
+    #   poll, the number of steps of the model must be updated (Model.update_steps_number()) once everything
+    #   depending on the new frames is ready
+    #   Return the number of new frames and if already existing frames have been modified (see DataSet.append_frames)
+    def poll_followed_file(self) -> (int, bool):
+        if self.__follower is None:
+            raise Exception("No CSV file is followed !")
+
+        numerical_columns = self.__follower.read_new_rows()
+
+        if numerical_columns.shape[1] == 0:
+            return 0, False
+
+        frames_modified = self.__generated_model.get_dataset().append_frames(numerical_columns[0],
+                                                                             numerical_columns[1:])
+
+        return numerical_columns.shape[1], frames_modified
+
+    #   In order to check if a CSV file is followed
+    def is_following(self) -> bool:
+        return self.__follower is not None
+
+    #   Will stop following the CSV file (if any) and close it
+    def stop_following(self) -> None:
+        if self.__follower is not None:
+            self.__follower.close()
+            self.__follower = None
+
+    """
+
+            BATCH IMPORTATION TYPE (MANY CSV FILES SHARING ONE SVG FILE)
+
+    """
+    #   Will import many CSV files sharing the same SVG file, the SVG layout is parsed only once and CSV files are
+    #   imported by a pool of processes if the module has more than one worker
+    #   Errors are reported per file and never stop the batch: on_file_done is called after each file with its path,
+    #   the number of files done, the total number of files and the exception raised (None on success)
+    #   Will return the result of the batch or None if the SVG file cannot be used
+    def get_datasets_batch(self,
+                           file_paths: [str],
+                           svg_file_path: str,
+                           on_position_error: 'function',
+                           on_file_done: 'function' = None,
+                           progress: ImportProgress | None = None) -> BatchImportResult | None:
+        try:
+            start_import_phase(progress, ImportPhase.read)
+
+            layout = self.__get_svg_layout(svg_file_path)
+
+        except ImportCancelled:
+            raise
+
+        except Exception as e:
+            print("An error occurred during the analysis of the given SVG file")
+            print("\tException: {0}".format(e))
+
+            on_position_error(e)
+            return None
+
+        start_import_phase(progress, ImportPhase.parse)
+
+        datasets: dict[str, DataSet] = {}
+        errors: dict[str, Exception] = {}
+        cache_keys: dict[str, str | None] = {}
+        nb_of_files_done = 0
+
+        #   Will record the result of the import of a file
+        def on_result(file_path: str, dataset: DataSet | None, error: Exception | None):
+            nonlocal nb_of_files_done
+
+            if error is None:
+                datasets[file_path] = dataset
+            else:
+                print("An error occurred during the analysis of the CSV file {:s}".format(file_path))
+                print("\tException: {0}".format(error))
+                errors[file_path] = error
+
+            nb_of_files_done += 1
+
+            if on_file_done is not None:
+                on_file_done(file_path, nb_of_files_done, len(file_paths), error)
+
+        #   Files already imported with the same SVG file are loaded from the cache
+        files_to_import = []
+
+        for file_path in file_paths:
+            cache_entry, cache_keys[file_path] = self.__load_from_cache(self.ImportTypes.Data_SVG_Files,
+                                                                        [file_path, svg_file_path])
+
+            if cache_entry is not None:
+                on_result(file_path, cache_entry[0], None)
+            else:
+                files_to_import.append(file_path)
+
+        executor = None
+
+        try:
+            if self.__nb_of_workers > 1 and len(files_to_import) > 1:
+                executor = ProcessPoolExecutor(max_workers=min(self.__nb_of_workers, len(files_to_import)),
+                                               mp_context=get_process_context(), initializer=stop_memory_tracing)
+                futures = [executor.submit(import_dataset_with_layout, file_path, layout, self.__resampling,
+                                           self.__selection, self.__storage_type)
+                           for file_path in files_to_import]
+            else:
+                futures = None
+
+            for i, file_path in enumerate(files_to_import):
+                if progress is not None:
+                    progress.check_cancelled()
+
+                try:
+                    dataset = get_worker_result(futures[i], progress) if futures is not None else \
+                        import_dataset_with_layout(file_path, layout, self.__resampling, self.__selection,
+                                                   self.__storage_type)
+
+                except ImportCancelled:
+                    raise
+
+                except Exception as e:
+                    on_result(file_path, None, e)
+                    continue
+
+                self.__save_into_cache(cache_keys[file_path], dataset, layout.get_bg_path())
+                on_result(file_path, dataset, None)
+
+        finally:
+            #   Files not imported yet are abandoned on cancellation
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        #   Datasets and errors are given in the order of the given files
+        return BatchImportResult({file_path: datasets[file_path] for file_path in file_paths if file_path in datasets},
+                                 {file_path: errors[file_path] for file_path in file_paths if file_path in errors},
+                                 list(layout.get_bg_path()))
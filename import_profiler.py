@@ -0,0 +1,139 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the profiling of the phases of an import
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import json
+import os
+import time
+import tracemalloc
+
+#   Import of custom modules
+from import_progress import ImportPhase
+
+"""
+
+    ImportProfiler
+
+    In charge of measuring each phase of an import: wall time, CPU time of the thread running the import, CPU time of
+    the worker processes (only known once they have ended) and peak of the memory allocated during the phase.
+    Phases are measured from their start to the start of the next one (or to stop()), they must be started and
+    stopped by the same thread.
+    WARNING:    Memory is traced with tracemalloc, which slows allocations down, so profiling is only meant to be
+                enabled when needed.
+
+"""
+
+
+class ImportProfiler:
+    __records: list[dict]
+    __current_phase: ImportPhase | None
+    __wall_start: float
+    __cpu_start: float
+    __children_cpu_start: float
+    __trace_memory: bool
+    __tracemalloc_started: bool
+
+    #   If trace_memory is False, the peak of allocated memory isn't measured (and doesn't slow the import down)
+    def __init__(self, trace_memory: bool = True):
+        self.__records = []
+        self.__current_phase = None
+        self.__wall_start = 0
+        self.__cpu_start = 0
+        self.__children_cpu_start = 0
+        self.__trace_memory = trace_memory
+        self.__tracemalloc_started = False
+
+    #   CPU time of the worker processes already ended
+    @staticmethod
+    def __get_children_cpu_time() -> float:
+        times = os.times()
+        return times.children_user + times.children_system
+
+    #   Will end the measure of the phase in progress (if any) and start the measure of the given phase
+    def start_phase(self, phase: ImportPhase) -> None:
+        self.__end_phase()
+
+        if self.__trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.__tracemalloc_started = True
+
+            tracemalloc.reset_peak()
+
+        self.__current_phase = phase
+        self.__children_cpu_start = self.__get_children_cpu_time()
+        self.__cpu_start = time.thread_time()
+        self.__wall_start = time.perf_counter()
+
+    #   Will end the measure of the phase in progress, the import is over
+    def stop(self) -> None:
+        self.__end_phase()
+
+        if self.__tracemalloc_started:
+            tracemalloc.stop()
+            self.__tracemalloc_started = False
+
+    #   Will record the measures of the phase in progress
+    def __end_phase(self) -> None:
+        if self.__current_phase is None:
+            return
+
+        wall_time = time.perf_counter() - self.__wall_start
+        cpu_time = time.thread_time() - self.__cpu_start
+        children_cpu_time = self.__get_children_cpu_time() - self.__children_cpu_start
+
+        self.__records.append({"phase": self.__current_phase.name,
+                               "label": self.__current_phase.value[1],
+                               "wall_time": wall_time,
+                               "cpu_time": cpu_time,
+                               "children_cpu_time": children_cpu_time,
+                               "peak_memory": tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing()
+                               else None})
+
+        self.__current_phase = None
+
+    #   Get the measures of each ended phase, in the order they happened
+    #   Times are given in seconds and the peak of memory in bytes (None if memory isn't traced)
+    def get_records(self) -> list[dict]:
+        return list(self.__records)
+
+    #   Get the total wall time of ended phases (in seconds)
+    def get_total_wall_time(self) -> float:
+        return sum(record["wall_time"] for record in self.__records)
+
+    #   Get the total CPU time of ended phases (in seconds), worker processes included
+    def get_total_cpu_time(self) -> float:
+        return sum(record["cpu_time"] + record["children_cpu_time"] for record in self.__records)
+
+    #   Get the highest peak of memory of ended phases (in bytes), None if memory isn't traced
+    def get_peak_memory(self) -> int | None:
+        peaks = [record["peak_memory"] for record in self.__records if record["peak_memory"] is not None]
+        return max(peaks) if len(peaks) > 0 else None
+
+    #   Will describe the measures as a JSON document, information about the import (e.g. file paths) can be added
+    def to_json(self, **import_information) -> str:
+        return json.dumps({"import": import_information,
+                           "phases": self.__records,
+                           "total_wall_time": self.get_total_wall_time(),
+                           "total_cpu_time": self.get_total_cpu_time(),
+                           "peak_memory": self.get_peak_memory()}, indent=4)
+
+    #   Will save the measures into a JSON file
+    def save_json(self, file_path: str, **import_information) -> None:
+        with open(file_path, 'w') as file:
+            file.write(self.to_json(**import_information))
+
+
+#   Used as initializer of worker processes: processes forked during a profiled import inherit the tracing of memory,
+#   which would only slow them down since their memory isn't measured
+def stop_memory_tracing() -> None:
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
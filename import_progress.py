@@ -0,0 +1,120 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the progress tracking of an import
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import threading
+from enum import Enum
+
+#   In order to avoid Circular Import problems
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from import_profiler import ImportProfiler
+
+"""
+
+    ImportPhase
+
+    Just act like an enumeration of all phases of an import, in the order they happen.
+
+"""
+
+
+class ImportPhase(Enum):
+    read = [0, "Reading files"]
+    sniff = [1, "Detecting CSV settings"]
+    parse = [2, "Parsing data"]
+    validate = [3, "Validating data"]
+    normalize = [4, "Normalizing data"]
+    center_of_mass = [5, "Computing center of mass"]
+    caches = [6, "Building caches"]
+
+
+"""
+
+    ImportCancelled
+
+    Raised in the import when the user asked for its cancellation.
+
+"""
+
+
+class ImportCancelled(Exception):
+    def __init__(self):
+        super().__init__("Import cancelled by the user")
+
+
+"""
+
+    ImportProgress
+
+    In charge of reporting the current phase of an import and of carrying cancellation requests.
+    It is shared between the thread running the import and the thread asking for the cancellation.
+    If a profiler is given, each phase is measured by it (see ImportProfiler).
+
+"""
+
+
+class ImportProgress:
+    __on_phase: 'function'
+    __cancel_event: threading.Event
+    __current_phase: ImportPhase | None
+    __profiler: 'ImportProfiler | None'
+
+    #   on_phase will be called with the new phase each time a phase starts (from the thread running the import)
+    def __init__(self, on_phase: 'function' = None, profiler: 'ImportProfiler | None' = None):
+        self.__on_phase = on_phase
+        self.__cancel_event = threading.Event()
+        self.__current_phase = None
+        self.__profiler = profiler
+
+    #   Will be called by the import at the start of each phase
+    def start_phase(self, phase: ImportPhase) -> None:
+        self.check_cancelled()
+
+        self.__current_phase = phase
+
+        if self.__profiler is not None:
+            self.__profiler.start_phase(phase)
+
+        if self.__on_phase is not None:
+            self.__on_phase(phase)
+
+    #   Will be called by the import once it is over (whatever its result), the last phase is then ended
+    def finish(self) -> None:
+        if self.__profiler is not None:
+            self.__profiler.stop()
+
+    #   Get the phase in progress
+    def get_current_phase(self) -> ImportPhase | None:
+        return self.__current_phase
+
+    #   Get the profiler measuring the phases (None if the import isn't profiled)
+    def get_profiler(self) -> 'ImportProfiler | None':
+        return self.__profiler
+
+    #   Ask for the cancellation of the import, it will stop at the next check
+    def cancel(self) -> None:
+        self.__cancel_event.set()
+
+    #   In order to check if the cancellation has been asked
+    def is_cancelled(self) -> bool:
+        return self.__cancel_event.is_set()
+
+    #   Will raise ImportCancelled if the cancellation has been asked
+    def check_cancelled(self) -> None:
+        if self.__cancel_event.is_set():
+            raise ImportCancelled()
+
+
+#   Will start a phase only if there is a progress to report to
+def start_import_phase(progress: ImportProgress | None, phase: ImportPhase) -> None:
+    if progress is not None:
+        progress.start_phase(phase)
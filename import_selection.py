@@ -0,0 +1,75 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the selection of the data to import (a subset of sensors and a time range)
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+"""
+
+    ImportSelection
+
+    In charge of describing which part of a recording must be imported: only the sensors whose names are given (all
+    of them if None) and only the samples whose time (in seconds) is in the [start; end] range (all of them if None).
+    Sensors keep the order of the CSV file, whatever the order of the given names.
+
+"""
+
+
+class ImportSelection:
+    __sensors_name: list[str] | None
+    __time_range: tuple[float, float] | None
+
+    def __init__(self, sensors_name: list[str] | None = None, time_range: tuple[float, float] | None = None):
+        if sensors_name is not None and len(sensors_name) == 0:
+            raise Exception("Selection: At least one sensor must be selected !")
+
+        if time_range is not None and time_range[0] > time_range[1]:
+            raise Exception("Selection: The start of the time range must be before its end !")
+
+        self.__sensors_name = None if sensors_name is None else list(dict.fromkeys(sensors_name))
+        self.__time_range = None if time_range is None else (float(time_range[0]), float(time_range[1]))
+
+    def get_sensors_name(self) -> list[str] | None:
+        return self.__sensors_name
+
+    def get_time_range(self) -> tuple[float, float] | None:
+        return self.__time_range
+
+    #   Will describe the selection, used to tell apart cache entries of the same files imported with other selections
+    def get_key(self) -> str:
+        sensors_key = "*" if self.__sensors_name is None else ",".join(self.__sensors_name)
+        time_key = "*" if self.__time_range is None else "{:g}-{:g}".format(*self.__time_range)
+
+        return "{:s}[{:s}]".format(sensors_key, time_key)
+
+    #   Will find the selected sensors among all sensors of a CSV file
+    #   Return the index of each selected sensor in sensors_name, raise an exception if a sensor cannot be found
+    def get_sensors_indices(self, sensors_name: [str]) -> [int]:
+        if self.__sensors_name is None:
+            return list(range(len(sensors_name)))
+
+        known_names = set(sensors_name)
+
+        for name in self.__sensors_name:
+            if name not in known_names:
+                raise Exception("CSV LOADER: Error cannot find the selected sensor {:s} in CSV data".format(name))
+
+        selected_names = set(self.__sensors_name)
+
+        return [i for i, name in enumerate(sensors_name) if name in selected_names]
+
+    #   Will give the time range in the unit of a temporal column
+    #   time_scale is the duration (in seconds) of one unit of the temporal column (e.g. 0.001 for milliseconds)
+    def get_time_window(self, time_scale: float = 1) -> tuple[float, float] | None:
+        if self.__time_range is None:
+            return None
+
+        start, end = self.__time_range[0] / time_scale, self.__time_range[1] / time_scale
+
+        #   Bounds are slightly widened so the rounding of the division never excludes a bound itself
+        return start - 1e-9 * max(1.0, abs(start)), end + 1e-9 * max(1.0, abs(end))
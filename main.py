@@ -3,7 +3,8 @@
 ------------------------------------------------------------------------------------------------------------------------
     Program allowing the visualization of the data coming from the sensors in the soles
 
-    The main is just used to launch the program
+    The main is just used to launch the program, with arguments the command-line interface is used instead of the
+    graphical one (see cli.py or run "main.py --help")
 
     MIT Licence
 
@@ -12,10 +13,18 @@
 ------------------------------------------------------------------------------------------------------------------------
 """
 
-#   Custom modules and classes
-from controller import Controller
+#   Import of basic modules
+import sys
 
 #   Just here to launch application
 if __name__ == '__main__':
+    #   The command-line interface doesn't need any display, so the graphical interface isn't even imported
+    if len(sys.argv) > 1:
+        from cli import main
+        sys.exit(main(sys.argv[1:]))
+
+    #   Custom modules and classes
+    from controller import Controller
+
     main_controller = Controller()
     main_controller.launch()
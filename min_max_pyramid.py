@@ -0,0 +1,174 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the multi-resolution summaries of sensors values over the temporal axis
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import numpy as np
+
+#   First stored level (groups of 2 ** PYRAMID_BASE_LEVEL samples), lower levels are cheaper to compute from samples
+#   when they are asked (they are only chosen for ranges of a few pixel widths of samples) than to store
+PYRAMID_BASE_LEVEL = 4
+
+"""
+
+    MinMaxPyramid
+
+    In charge of summarizing sensors values at power-of-two decimation levels: at level k, samples are cut into groups
+    of 2 ** k consecutive samples, each group being summarized by its minimum, its maximum and its mean (per sensor)
+    and dated at the time of its first sample. Level 0 is made of samples themselves.
+
+    Levels from PYRAMID_BASE_LEVEL are stored (each one being reduced from the one below), up to the level holding a
+    single group. They take 3 / 2 ** (PYRAMID_BASE_LEVEL - 1) of the memory of the values.
+
+    A view showing a time range on a given number of pixels asks for the level giving between one and two groups
+    per pixel, so drawing it costs a time proportional to the number of pixels, not to the number of samples.
+
+"""
+
+
+class MinMaxPyramid:
+    #   Shape is (number of samples, number of sensors)
+    __values: np.ndarray
+    __temporal_set: np.ndarray
+
+    #   Stored levels from PYRAMID_BASE_LEVEL, each one with a shape of (number of groups, number of sensors)
+    __levels_min: [np.ndarray]
+    __levels_max: [np.ndarray]
+    __levels_sum: [np.ndarray]
+
+    def __init__(self, values: np.ndarray, temporal_set: np.ndarray):
+        self.__values = values
+        self.__temporal_set = np.asarray(temporal_set, dtype=float)
+
+        self.__levels_min = []
+        self.__levels_max = []
+        self.__levels_sum = []
+
+        self.__compute_levels(0)
+
+    #   Will update the pyramid with longer versions of the values and of the temporal set (e.g. frames appended to
+    #   the dataset), only groups holding new samples are computed again
+    def extend(self, values: np.ndarray, temporal_set: np.ndarray) -> None:
+        first_new_sample = len(self.__values)
+
+        self.__values = values
+        self.__temporal_set = np.asarray(temporal_set, dtype=float)
+
+        self.__compute_levels(first_new_sample)
+
+    #   Get the highest level, the one holding a single group
+    def get_max_level(self) -> int:
+        return max(0, int(len(self.__values) - 1).bit_length())
+
+    #   Will compute stored levels from the group holding the given sample to the last group
+    def __compute_levels(self, first_sample: int) -> None:
+        nb_of_samples = len(self.__values)
+        max_level = self.get_max_level()
+
+        for level in range(PYRAMID_BASE_LEVEL, max(PYRAMID_BASE_LEVEL, max_level) + 1):
+            index = level - PYRAMID_BASE_LEVEL
+
+            #   A new level is computed from its first group
+            first_group = first_sample >> level if index < len(self.__levels_min) else 0
+
+            if level == PYRAMID_BASE_LEVEL:
+                #   Base level is reduced from samples
+                group_size = 1 << level
+                samples = np.asarray(self.__values[first_group * group_size:], dtype=float)
+                starts = np.arange(0, len(samples), group_size)
+
+                new_min = np.minimum.reduceat(samples, starts, axis=0)
+                new_max = np.maximum.reduceat(samples, starts, axis=0)
+                new_sum = np.add.reduceat(samples, starts, axis=0)
+            else:
+                #   Other levels are reduced by pairs of groups of the level below
+                below = index - 1
+                starts = np.arange(0, len(self.__levels_min[below]) - 2 * first_group, 2)
+
+                new_min = np.minimum.reduceat(self.__levels_min[below][2 * first_group:], starts, axis=0)
+                new_max = np.maximum.reduceat(self.__levels_max[below][2 * first_group:], starts, axis=0)
+                new_sum = np.add.reduceat(self.__levels_sum[below][2 * first_group:], starts, axis=0)
+
+            if index < len(self.__levels_min):
+                self.__levels_min[index] = np.concatenate((self.__levels_min[index][:first_group], new_min))
+                self.__levels_max[index] = np.concatenate((self.__levels_max[index][:first_group], new_max))
+                self.__levels_sum[index] = np.concatenate((self.__levels_sum[index][:first_group], new_sum))
+            else:
+                self.__levels_min.append(new_min)
+                self.__levels_max.append(new_max)
+                self.__levels_sum.append(new_sum)
+
+            if nb_of_samples <= 1 << level:
+                break
+
+    #   Will find the level to use to show the frames [start; end[ on the given number of pixels
+    #   The level gives at least one group per pixel (and less than two), unless samples themselves are not enough
+    def get_level_for(self, first_frame: int, end_frame: int, pixel_width: int) -> int:
+        nb_of_frames = max(1, end_frame - first_frame)
+        level = max(0, (nb_of_frames // max(1, pixel_width)).bit_length() - 1)
+
+        return min(level, self.get_max_level())
+
+    #   Get the summaries of the groups of the given level holding the frames [start; end[
+    #   Return the time of each group and the minimum, the maximum and the mean of each sensor in each group (as
+    #   (number of groups, number of sensors) arrays)
+    def get_level(self, level: int, first_frame: int, end_frame: int) -> (np.ndarray, np.ndarray, np.ndarray,
+                                                                         np.ndarray):
+        if not 0 <= first_frame < end_frame <= len(self.__values):
+            raise Exception("MinMaxPyramid: Invalid frames [{:d}; {:d}[ for {:d} samples !"
+                            .format(first_frame, end_frame, len(self.__values)))
+
+        if not 0 <= level <= self.get_max_level():
+            raise Exception("MinMaxPyramid: Level {:d} doesn't exist !".format(level))
+
+        group_size = 1 << level
+        first_group = first_frame >> level
+        end_group = -(-end_frame // group_size)
+
+        times = self.__temporal_set[first_group * group_size:end_frame:group_size]
+
+        #   Samples are their own summary
+        if level == 0:
+            samples = np.asarray(self.__values[first_frame:end_frame], dtype=float)
+            return times, samples, samples, samples
+
+        #   Every group holds group_size samples, except the last group of the data
+        group_sizes = np.minimum(group_size, len(self.__values) - np.arange(first_group, end_group) * group_size)
+
+        if level < PYRAMID_BASE_LEVEL:
+            samples = np.asarray(self.__values[first_group * group_size:end_group * group_size], dtype=float)
+            starts = np.arange(0, len(samples), group_size)
+
+            return times, \
+                np.minimum.reduceat(samples, starts, axis=0), \
+                np.maximum.reduceat(samples, starts, axis=0), \
+                np.add.reduceat(samples, starts, axis=0) / group_sizes[:, np.newaxis]
+
+        index = level - PYRAMID_BASE_LEVEL
+
+        return times, \
+            self.__levels_min[index][first_group:end_group], \
+            self.__levels_max[index][first_group:end_group], \
+            self.__levels_sum[index][first_group:end_group] / group_sizes[:, np.newaxis]
+
+    #   Get the summaries to use to show the time range [start_time; end_time] on the given number of pixels
+    #   Return the same as get_level(), the frames of the range are found in the temporal set (with the frames just
+    #   before and after it, so a line drawn from the summaries reaches both ends of the range)
+    def get_summary(self, start_time: float, end_time: float, pixel_width: int) -> (np.ndarray, np.ndarray,
+                                                                                     np.ndarray, np.ndarray):
+        first_frame = max(0, int(np.searchsorted(self.__temporal_set, start_time, side='right')) - 1)
+        end_frame = min(len(self.__temporal_set),
+                        int(np.searchsorted(self.__temporal_set, end_time, side='left')) + 1)
+
+        #   The range always holds at least one frame
+        first_frame = min(first_frame, len(self.__temporal_set) - 1)
+        end_frame = max(end_frame, first_frame + 1)
+
+        return self.get_level(self.get_level_for(first_frame, end_frame, pixel_width), first_frame, end_frame)
@@ -75,6 +75,13 @@ class Model:
     def get_steps_number(self) -> int:
         return self.__step_number
 
+    #   Will take into account frames appended to the dataset since the creation of the model
+    #   If frames have been dropped from the start of the dataset (see RingBufferDataSet), the current step is moved
+    #   back so it stays on the same frame (or on the first one if its frame has been dropped)
+    def update_steps_number(self, nb_of_dropped_steps: int = 0) -> None:
+        self.__current_step = max(0, self.__current_step - nb_of_dropped_steps)
+        self.__step_number = len(self.__dataset.get_temporal_set())
+
     #   Get the number of the current steps
     def get_current_step_number(self) -> int:
         return self.__current_step
@@ -85,8 +92,7 @@ class Model:
 
     #   Get an array of the data of all sensors at the current step
     def get_current_step_data(self) -> [float]:
-        sensor_set = self.__dataset.get_sensor_set()
-        return [sensor.get_data_point_normalized(self.__current_step) for sensor in sensor_set]
+        return self.__dataset.get_sensors_normalized_values_at(self.__current_step)
 
     #   Allow jumping directly to a specified step
     def jump_to_step(self, new_step: int) -> bool:
@@ -96,6 +102,14 @@ class Model:
         else:
             return False
 
+    #   Get the time (in seconds) of the current step
+    def get_current_time(self) -> float:
+        return float(self.__dataset.get_temporal_set()[self.__current_step])
+
+    #   Allow jumping directly to the step shown at a specified time (in seconds)
+    def jump_to_time(self, new_time: float) -> bool:
+        return self.jump_to_step(min(max(0, self.__dataset.get_frame_at(new_time)), self.__step_number - 1))
+
     #   To know if there is any other steps after
     def end_has_been_reached(self) -> bool:
         return (not self.__is_reverse_enabled) and self.__current_step >= self.__step_number - 1
@@ -110,6 +124,9 @@ class Model:
     #   Calculate time delta between next and current step
     def __get_delta_time_next(self) -> int:
         if not self.end_has_been_reached():
+            if self.__dataset.is_uniformly_sampled():
+                return self.__dataset.get_sampling_period()
+
             temporal_set = self.__dataset.get_temporal_set()
             return temporal_set[self.__current_step + 1] - temporal_set[self.__current_step]
         else:
@@ -118,6 +135,9 @@ class Model:
     #   Calculate time delta between current and previous step
     def __get_delta_time_prv(self) -> int:
         if not self.start_has_been_reached():
+            if self.__dataset.is_uniformly_sampled():
+                return self.__dataset.get_sampling_period()
+
             temporal_set = self.__dataset.get_temporal_set()
             return temporal_set[self.__current_step] - temporal_set[self.__current_step - 1]
         else:
@@ -152,6 +172,25 @@ class Model:
     def get_time_next(self):
         return self.get_delta_time_next() * self.get_play_speed_factor()
 
+    #   Will pass directly to the step to show once the given time (in seconds) has been spent since the current step
+    #   was shown, depending on the play direction and the play speed (e.g. to skip steps when drawing took longer
+    #   than the time between two steps), at least one step is passed
+    def skip_time(self, elapsed_time: float) -> bool:
+        if self.__is_paused or self.bound_reach():
+            return False
+
+        step_time = self.get_current_time()
+        played_time = elapsed_time / self.get_play_speed_factor()
+
+        if self.__is_reverse_enabled:
+            self.__current_step = min(self.__current_step - 1,
+                                      max(0, self.__dataset.get_frame_at(step_time - played_time)))
+        else:
+            self.__current_step = max(self.__current_step + 1,
+                                      min(self.__step_number - 1, self.__dataset.get_frame_at(step_time + played_time)))
+
+        return True
+
     #   Just pass to the next or previous step depending on the play direction
     def next_step(self) -> int:
         #   Pause
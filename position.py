@@ -9,10 +9,25 @@
 ------------------------------------------------------------------------------------------------------------------------
 """
 
+#   Import of basic modules
+import numpy as np
+
+"""
+
+    Position
+
+    Just a point of the map, slotted to stay as light as possible.
+    Geometry (positions of sensors, centers, center of mass trajectory) is kept in (number of points, 2) arrays,
+    Position is only used where a single point is expected by older call sites.
+
+"""
+
 
 class Position:
-    x = int
-    y = int
+    __slots__ = ("x", "y")
+
+    x: int
+    y: int
 
     def __init__(self, x: int, y: int):
         self.x = x
@@ -20,3 +35,16 @@ class Position:
 
     def to_string(self) -> str:
         return "x = {0}\ty = {1}".format(self.x, self.y)
+
+
+#   Will give positions (Position objects or [x, y] pairs) as a (number of positions, 2) array
+def get_positions_array(positions: list[Position] | np.ndarray, dtype: type = int) -> np.ndarray:
+    if isinstance(positions, np.ndarray):
+        return positions.reshape(-1, 2).astype(dtype, copy=False)
+
+    return np.array([[p.x, p.y] if isinstance(p, Position) else p for p in positions], dtype=dtype).reshape(-1, 2)
+
+
+#   Will give a (number of positions, 2) array as Position objects
+def get_positions_list(positions: np.ndarray) -> [Position]:
+    return [Position(x, y) for x, y in np.asarray(positions).tolist()]
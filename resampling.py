@@ -0,0 +1,276 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the resampling of imported data to a lower sample rate
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import math
+from enum import Enum
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+#   Number of samples used to estimate the source sample rate (before building the anti-aliasing filter)
+RATE_ESTIMATION_SIZE = 256
+
+"""
+
+    ResamplingMethod
+
+    Just act like an enumeration of all methods used to reduce the samples of a group into one sample.
+        - mean:         mean value of each sensor over the group
+        - max:          maximum value of each sensor over the group
+        - anti_aliased: data is low-pass filtered (windowed sinc) then the first sample of the group is kept
+
+"""
+
+
+class ResamplingMethod(Enum):
+    mean = [0, "Mean"]
+    max = [1, "Max"]
+    anti_aliased = [2, "Anti-aliased"]
+
+
+"""
+
+    ResamplingSettings
+
+    In charge of describing how imported data must be resampled, either to a target sample rate (in Hz) or by a
+    decimation factor (one sample for each group of decimation_factor samples).
+
+"""
+
+
+class ResamplingSettings:
+    __method: ResamplingMethod
+    __target_rate: float | None
+    __decimation_factor: int | None
+
+    def __init__(self, method: ResamplingMethod = ResamplingMethod.mean,
+                 target_rate: float | None = None, decimation_factor: int | None = None):
+        if (target_rate is None) == (decimation_factor is None):
+            raise Exception("Resampling: Either a target rate or a decimation factor must be given !")
+
+        if target_rate is not None and target_rate <= 0:
+            raise Exception("Resampling: Target rate must be positive and non null !")
+
+        if decimation_factor is not None and decimation_factor < 1:
+            raise Exception("Resampling: Decimation factor must be at least 1 !")
+
+        self.__method = method
+        self.__target_rate = target_rate
+        self.__decimation_factor = decimation_factor
+
+    def get_method(self) -> ResamplingMethod:
+        return self.__method
+
+    def get_target_rate(self) -> float | None:
+        return self.__target_rate
+
+    def get_decimation_factor(self) -> int | None:
+        return self.__decimation_factor
+
+    #   Will describe the settings, used to tell apart cache entries of the same files resampled differently
+    def get_key(self) -> str:
+        if self.__target_rate is not None:
+            return "{:s}@{:g}Hz".format(self.__method.name, self.__target_rate)
+
+        return "{:s}/{:d}".format(self.__method.name, self.__decimation_factor)
+
+    #   Will create a resampler applying these settings
+    #   time_scale is the duration (in seconds) of one unit of the temporal column (e.g. 0.001 for milliseconds)
+    def create_resampler(self, time_scale: float = 1) -> 'Resampler':
+        return Resampler(self, time_scale)
+
+
+"""
+
+    Resampler
+
+    In charge of resampling numerical columns (the temporal column followed by sensors columns) given block by block
+    while they are parsed, so the full rate data never has to be stored.
+    Samples are grouped by time slot of 1 / target rate (the first sample of the data starts the first slot) or by
+    decimation_factor consecutive samples. Each group gives one sample, dated at the start of its time slot (or at
+    the time of its first sample with a decimation factor). Empty time slots give nothing.
+
+    The last group of a block may be continued by the next block, it is only given once complete (or by flush()).
+
+"""
+
+
+class Resampler:
+    __settings: ResamplingSettings
+    __time_scale: float
+    __nb_of_columns: int
+
+    #   Grouping state
+    __origin: float | None
+    __nb_of_samples_seen: int
+    __pending: np.ndarray | None
+
+    #   Low-pass filter state (only used by the anti-aliased method)
+    __kernel: np.ndarray | None
+    __filter_context: np.ndarray | None
+    __filter_waiting: np.ndarray | None
+
+    def __init__(self, settings: ResamplingSettings, time_scale: float = 1):
+        self.__settings = settings
+        self.__time_scale = time_scale
+        self.__nb_of_columns = 0
+
+        self.__origin = None
+        self.__nb_of_samples_seen = 0
+        self.__pending = None
+
+        self.__kernel = None
+        self.__filter_context = None
+        self.__filter_waiting = None
+
+    #   Will resample a block of samples given as a (number of columns, number of samples) array
+    #   Return the complete resampled samples as a (number of columns, number of resampled samples) array
+    def feed(self, columns: np.ndarray) -> np.ndarray:
+        columns = np.asarray(columns, dtype=float)
+        self.__nb_of_columns = columns.shape[0]
+
+        if self.__settings.get_method() == ResamplingMethod.anti_aliased:
+            columns = self.__filter(columns, False)
+
+        return self.__reduce(columns, False)
+
+    #   Will give the last resampled samples once every block has been given
+    def flush(self) -> np.ndarray:
+        columns = None
+
+        if self.__settings.get_method() == ResamplingMethod.anti_aliased:
+            columns = self.__filter(None, True)
+
+        return self.__reduce(columns, True)
+
+    #   Will build the low-pass filter kernel from the ratio between the source rate and the target rate
+    def __build_kernel(self, temporal_set: np.ndarray) -> np.ndarray:
+        if self.__settings.get_decimation_factor() is not None:
+            ratio = float(self.__settings.get_decimation_factor())
+        else:
+            #   The source rate is estimated from the median time between two samples
+            time_steps = np.diff(temporal_set) * self.__time_scale
+            time_steps = time_steps[time_steps > 0]
+            ratio = 1 / (float(np.median(time_steps)) * self.__settings.get_target_rate()) if len(time_steps) > 0 else 1
+
+        #   Nothing to filter if the data is not decimated
+        if ratio <= 1:
+            return np.ones(1)
+
+        half_length = math.ceil(2 * ratio)
+        cutoff = 0.5 / ratio
+
+        kernel = 2 * cutoff * np.sinc(2 * cutoff * np.arange(-half_length, half_length + 1)) * \
+            np.hamming(2 * half_length + 1)
+
+        return kernel / kernel.sum()
+
+    #   Will low-pass filter sensors columns, each filtered sample needs half the length of the kernel of samples
+    #   before and after it, so the last ones are kept waiting until the next block (or until the end)
+    def __filter(self, columns: np.ndarray | None, final: bool) -> np.ndarray | None:
+        if columns is not None:
+            if self.__filter_waiting is None:
+                self.__filter_waiting = columns
+            else:
+                self.__filter_waiting = np.concatenate((self.__filter_waiting, columns), axis=1)
+
+        waiting = self.__filter_waiting
+
+        if waiting is None or waiting.shape[1] == 0:
+            return None
+
+        #   The source rate is always estimated from the same first samples whatever the size of blocks
+        if self.__kernel is None:
+            if waiting.shape[1] < RATE_ESTIMATION_SIZE and not final:
+                return None
+
+            self.__kernel = self.__build_kernel(waiting[0, :RATE_ESTIMATION_SIZE])
+
+            #   The start of the data is extended with its first sample
+            self.__filter_context = np.repeat(waiting[1:, :1], len(self.__kernel) // 2, axis=1)
+
+        half_length = len(self.__kernel) // 2
+
+        signal = np.concatenate((self.__filter_context, waiting[1:]), axis=1)
+
+        #   The end of the data is extended with its last sample
+        if final:
+            signal = np.concatenate((signal, np.repeat(signal[:, -1:], half_length, axis=1)), axis=1)
+
+        nb_of_filtered = signal.shape[1] - 2 * half_length
+
+        if nb_of_filtered <= 0:
+            return None
+
+        filtered = sliding_window_view(signal, len(self.__kernel), axis=1) @ self.__kernel[::-1]
+
+        #   Context of the next filtered samples is made of the samples just before them
+        self.__filter_context = signal[:, nb_of_filtered:nb_of_filtered + half_length]
+        self.__filter_waiting = waiting[:, nb_of_filtered:]
+
+        return np.concatenate((waiting[:1, :nb_of_filtered], filtered), axis=0)
+
+    #   Will reduce each complete group of samples into one sample
+    def __reduce(self, columns: np.ndarray | None, final: bool) -> np.ndarray:
+        if self.__pending is not None and self.__pending.shape[1] > 0:
+            columns = self.__pending if columns is None else np.concatenate((self.__pending, columns), axis=1)
+
+        if columns is None or columns.shape[1] == 0:
+            self.__pending = None
+            return np.empty((self.__nb_of_columns, 0), dtype=float)
+
+        temporal_set = columns[0]
+        nb_of_pending = 0 if self.__pending is None else self.__pending.shape[1]
+
+        #   Label each sample with its group
+        if self.__settings.get_target_rate() is not None:
+            if self.__origin is None:
+                self.__origin = float(temporal_set[0])
+
+            slot_duration = 1 / (self.__settings.get_target_rate() * self.__time_scale)
+            labels = np.floor((temporal_set - self.__origin) / slot_duration + 1e-9).astype(np.int64)
+        else:
+            first_index = self.__nb_of_samples_seen - nb_of_pending
+            labels = (first_index + np.arange(columns.shape[1])) // self.__settings.get_decimation_factor()
+
+        self.__nb_of_samples_seen += columns.shape[1] - nb_of_pending
+
+        group_starts = np.flatnonzero(np.concatenate(([True], labels[1:] != labels[:-1])))
+
+        #   The last group may be continued by the next block
+        if not final:
+            self.__pending = columns[:, group_starts[-1]:]
+            columns = columns[:, :group_starts[-1]]
+            labels = labels[:group_starts[-1]]
+            group_starts = group_starts[:-1]
+        else:
+            self.__pending = None
+
+        if len(group_starts) == 0:
+            return np.empty((columns.shape[0], 0), dtype=float)
+
+        sensors_data = columns[1:]
+
+        if self.__settings.get_method() == ResamplingMethod.mean:
+            group_sizes = np.diff(np.append(group_starts, columns.shape[1]))
+            resampled_data = np.add.reduceat(sensors_data, group_starts, axis=1) / group_sizes
+        elif self.__settings.get_method() == ResamplingMethod.max:
+            resampled_data = np.maximum.reduceat(sensors_data, group_starts, axis=1)
+        else:
+            resampled_data = sensors_data[:, group_starts]
+
+        if self.__settings.get_target_rate() is not None:
+            resampled_time = self.__origin + labels[group_starts] * slot_duration
+        else:
+            resampled_time = columns[0, group_starts]
+
+        return np.concatenate((resampled_time[np.newaxis], resampled_data), axis=0)
@@ -0,0 +1,110 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining a fixed capacity typed buffer keeping only the last rows appended to it
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import numpy as np
+
+"""
+
+    RingBuffer
+
+    In charge of storing the last rows (one contiguous row per frame, e.g. one frame of every sensor) of a stream whose
+    length is unknown, in a memory that never grows: once the capacity is reached, each appended row replaces the
+    oldest one.
+    Every row is written twice, at its place in the ring and at the same place plus the capacity, so the retained
+    rows are always a contiguous view of the buffer, from the oldest to the newest, whatever the place of the oldest.
+    Appending a row costs O(1), as getting the view.
+
+"""
+
+
+class RingBuffer:
+    #   Shape is (2 * capacity, number of columns)
+    __buffer: np.ndarray
+    __capacity: int
+    __start: int
+    __length: int
+
+    def __init__(self, nb_of_columns: int, capacity: int, dtype: type = float):
+        if nb_of_columns < 1:
+            raise Exception("RingBuffer: Must have at least one column !")
+
+        if capacity < 1:
+            raise Exception("RingBuffer: Capacity must be at least one row !")
+
+        self.__buffer = np.empty((2 * capacity, nb_of_columns), dtype=dtype)
+        self.__capacity = capacity
+        self.__start = 0
+        self.__length = 0
+
+    #   Number of rows retained in the buffer
+    def __len__(self) -> int:
+        return self.__length
+
+    #   Maximum number of rows retained in the buffer
+    def get_capacity(self) -> int:
+        return self.__capacity
+
+    #   Append a block of rows given as a (number of rows, number of columns) array
+    #   Return the number of oldest rows dropped to make room for them
+    def append(self, rows: np.ndarray) -> int:
+        nb_of_rows = len(rows)
+
+        #   Only the last rows of a block longer than the buffer can be retained
+        if nb_of_rows > self.__capacity:
+            nb_of_dropped_rows = self.__length + nb_of_rows - self.__capacity
+
+            self.__start = 0
+            self.__length = 0
+
+            self.__write(rows[-self.__capacity:])
+            self.__length = self.__capacity
+            return nb_of_dropped_rows
+
+        self.__write(rows)
+
+        nb_of_dropped_rows = max(0, self.__length + nb_of_rows - self.__capacity)
+
+        self.__start = (self.__start + nb_of_dropped_rows) % self.__capacity
+        self.__length += nb_of_rows - nb_of_dropped_rows
+
+        return nb_of_dropped_rows
+
+    #   Will write rows after the last retained row (twice, see the description of the class)
+    def __write(self, rows: np.ndarray) -> None:
+        indices = (self.__start + self.__length + np.arange(len(rows))) % self.__capacity
+
+        self.__buffer[indices] = rows
+        self.__buffer[indices + self.__capacity] = rows
+
+    #   Will replace every retained row by the given ones, given as a (number of rows, number of columns) array
+    def overwrite(self, rows: np.ndarray) -> None:
+        if len(rows) != self.__length:
+            raise Exception("RingBuffer: {:d} rows cannot replace {:d} rows !".format(len(rows), self.__length))
+
+        indices = (self.__start + np.arange(self.__length)) % self.__capacity
+
+        self.__buffer[indices] = rows
+        self.__buffer[indices + self.__capacity] = rows
+
+    #   Append a block of rows given column by column as a (number of columns, number of rows) array
+    #   Return the number of oldest rows dropped to make room for them
+    def append_columns(self, columns: np.ndarray) -> int:
+        return self.append(columns.T)
+
+    #   Get a view over the retained rows, from the oldest to the newest, shape is (number of rows, number of columns)
+    #   WARNING:    The view is only valid until the next append, appended rows overwrite the oldest ones
+    def get_rows(self) -> np.ndarray:
+        return self.__buffer[self.__start:self.__start + self.__length]
+
+    #   Get a view over the retained rows, shape is (number of columns, number of rows)
+    def get_columns(self) -> np.ndarray:
+        return self.get_rows().T
@@ -0,0 +1,329 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining a dataset keeping only the last frames of a recording, for sessions lasting longer than the memory
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import numpy as np
+
+#   Custom modules and classes
+from block_statistics import BlockStatistics
+from dataset import DataSet
+from import_progress import ImportProgress
+from min_max_pyramid import MinMaxPyramid
+from position import Position
+from ring_buffer import RingBuffer
+
+#   Number of bytes held for each retained frame by the ring buffers of a dataset, besides the values of its sensors
+#   (time, weighted sums, center of mass position and zero-load flag), every row being written twice
+RING_FRAME_BYTES = 2 * (8 + 3 * 8 + 2 * 8 + 1)
+
+"""
+
+    RingBufferDataSet
+
+    A DataSet retaining only its last frames (at most capacity frames), so its memory stays the same however long
+    frames are appended to it (e.g. a data file followed for a whole day). Appending a frame drops the oldest one
+    once the capacity is reached, frames indices always go from the oldest retained frame (0) to the newest one.
+
+    Frames are held in ring buffers, appending a frame costs O(1):
+        -   Sensors are normalized with the minimum and the maximum of every frame appended since the creation of the
+            dataset (running bounds, they never shrink when frames are dropped), normalized values are only computed
+            when they are asked
+        -   Each frame keeps the sums of its values weighted by sensors centers and the sum of its values, the center
+            of mass is computed from them for new frames only, and for every retained frame (without any matrix
+            product) if the running bounds change
+        -   Statistics and summaries are built over a copy of the retained frames when they are asked
+
+    Arrays given by getters are views over the ring buffers, only valid until the next append.
+    Times are always mapped to frames by binary search.
+
+"""
+
+
+class RingBufferDataSet(DataSet):
+    __capacity: int
+    __nb_of_dropped_frames: int
+
+    #   Shape is (number of retained frames, number of columns)
+    __temporal_ring: RingBuffer
+    __values_ring: RingBuffer
+    #   Columns are [sum of values * x of centers, sum of values * y of centers, sum of values]
+    __weighted_sums_ring: RingBuffer
+    __c_o_m_ring: RingBuffer
+    __zero_load_ring: RingBuffer
+
+    #   Built from the retained frames when they are asked, dropped at the next append
+    __statistics: BlockStatistics | None
+    __pyramid: MinMaxPyramid | None
+
+    def __init__(self, capacity: int, temporal_set: list[float] | np.ndarray, sensors_name: [str],
+                 sensors_positions: np.ndarray | list[Position],
+                 sensors_characteristics: [[int, int, int]], sensors_data: list[list[float]] | np.ndarray,
+                 map_width: int, map_height: int, progress: ImportProgress | None = None):
+        if capacity < 1:
+            raise Exception("Data consistency error: A ring buffer dataset must be able to retain at least one frame !")
+
+        #   Only the last frames are retained
+        nb_of_dropped_frames = max(0, len(temporal_set) - capacity)
+
+        if any(len(values) != len(temporal_set) for values in sensors_data):
+            raise Exception(
+                "Data consistency error: Sensors data don't match the number of temporal values !")
+
+        temporal_set = np.asarray(temporal_set, dtype=float)[nb_of_dropped_frames:]
+        sensors_data = np.array([np.asarray(values, dtype=float)[nb_of_dropped_frames:] for values in sensors_data])
+
+        #   The dataset is only built from the first retained frame (sensors, geometry and bounds), every retained
+        #   frame is then held by the ring buffers only
+        super().__init__(temporal_set[:1], sensors_name, sensors_positions, sensors_characteristics,
+                         sensors_data[:, :1], map_width, map_height, progress)
+
+        self.__check_frames(temporal_set, sensors_data)
+
+        nb_of_sensors = self.get_number_of_sensors()
+
+        self.__capacity = capacity
+        self.__nb_of_dropped_frames = nb_of_dropped_frames
+
+        self.__temporal_ring = RingBuffer(1, capacity)
+        self.__values_ring = RingBuffer(nb_of_sensors, capacity)
+        self.__weighted_sums_ring = RingBuffer(3, capacity)
+        self.__c_o_m_ring = RingBuffer(2, capacity)
+        self.__zero_load_ring = RingBuffer(1, capacity, dtype=bool)
+
+        self.__statistics = None
+        self.__pyramid = None
+
+        self.__append_to_rings(temporal_set, sensors_data.T)
+
+    #   Will append new frames at the end of the dataset, the oldest frames are dropped once the capacity is reached
+    #   (frames of a block longer than the capacity which would be dropped at once are ignored)
+    #   Only new frames get their center of mass position calculated, except if the running minimum or maximum has
+    #   changed: every retained frame is then calculated again
+    #   Return True if already retained frames have been modified, False otherwise (dropped frames are counted by
+    #   get_nb_of_dropped_frames())
+    def append_frames(self, temporal_set: list[float] | np.ndarray, sensors_data: list[list[float]] | np.ndarray) -> bool:
+        temporal_set = np.asarray(temporal_set, dtype=float)
+        sensors_data = np.asarray(sensors_data, dtype=float)
+
+        nb_of_new_frames = len(temporal_set)
+
+        if nb_of_new_frames == 0:
+            return False
+
+        self.__check_frames(temporal_set, sensors_data)
+
+        #   New frames must follow the last frame
+        if temporal_set[0] < self.get_temporal_set()[-1]:
+            raise Exception("Data consistency error: Temporal set inconsistency, not chronological !")
+
+        if nb_of_new_frames > self.__capacity:
+            self.__nb_of_dropped_frames += nb_of_new_frames - self.__capacity
+            temporal_set = temporal_set[-self.__capacity:]
+            sensors_data = sensors_data[:, -self.__capacity:]
+
+        previous_bounds = (self.get_sensor_set_min(), self.get_sensor_set_max())
+        self.__append_to_rings(temporal_set, sensors_data.T)
+        bounds_changed = previous_bounds != (self.get_sensor_set_min(), self.get_sensor_set_max())
+
+        #   Positions of retained frames are only valid if bounds haven't changed
+        if bounds_changed:
+            c_o_m_positions, zero_load_frames = self.__calculate_center_of_mass_positions(
+                self.__weighted_sums_ring.get_rows())
+
+            self.__c_o_m_ring.overwrite(c_o_m_positions)
+            self.__zero_load_ring.overwrite(zero_load_frames[:, np.newaxis])
+
+        return bounds_changed
+
+    #   Will check frames given as a temporal set and (number of sensors, number of frames) values, the same way as
+    #   DataSet
+    def __check_frames(self, temporal_set: np.ndarray, sensors_data: np.ndarray) -> None:
+        if sensors_data.shape != (self.get_number_of_sensors(), len(temporal_set)):
+            raise Exception(
+                "Data consistency error: New frames don't match the number of sensors or the number of temporal values !")
+
+        if np.min(temporal_set) < 0:
+            raise Exception(
+                "Data consistency error: Temporal set inconsistency, cannot have negative values in temporal set !")
+
+        if np.any(np.diff(temporal_set) < 0):
+            raise Exception("Data consistency error: Temporal set inconsistency, not chronological !")
+
+    #   Will append frames, given as (number of frames, number of sensors) values, to every ring buffer
+    #   Sensors data and running bounds are updated, as the number of dropped frames
+    def __append_to_rings(self, temporal_set: np.ndarray, sensors_values: np.ndarray) -> None:
+        nb_of_new_frames = len(temporal_set)
+
+        self.__nb_of_dropped_frames += self.__temporal_ring.append(np.asarray(temporal_set)[:, np.newaxis])
+        self.__values_ring.append(sensors_values)
+
+        values = self.__values_ring.get_rows()
+
+        for i, sensor in enumerate(self.get_sensor_set()):
+            sensor.extend_data(values[:, i], nb_of_new_frames)
+
+        weighted_sums = np.empty((nb_of_new_frames, 3))
+        np.matmul(sensors_values, self.get_centers_array().astype(float), out=weighted_sums[:, :2])
+        np.sum(sensors_values, axis=1, out=weighted_sums[:, 2])
+
+        self.__weighted_sums_ring.append(weighted_sums)
+
+        c_o_m_positions, zero_load_frames = self.__calculate_center_of_mass_positions(weighted_sums)
+
+        self.__c_o_m_ring.append(c_o_m_positions)
+        self.__zero_load_ring.append(zero_load_frames[:, np.newaxis])
+
+        self.__statistics = None
+        self.__pyramid = None
+
+    #   Will calculate center of mass positions of frames from their weighted sums
+    #   As every sensor is normalized the same way (v + add) / div, the division cancels out and the position is
+    #   (weighted sums + add * sums of centers) / (sum of values + add * number of sensors)
+    #   Return positions (NaN for frames without any load) and the zero-load mask
+    def __calculate_center_of_mass_positions(self, weighted_sums: np.ndarray) -> (np.ndarray, np.ndarray):
+        add_value, _ = self.__get_normalization_values()
+        centers = self.get_centers_array().astype(float)
+
+        loads = weighted_sums[:, 2] + add_value * len(centers)
+        zero_load_frames = loads == 0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c_o_m_positions = (weighted_sums[:, :2] + add_value * centers.sum(axis=0)) / loads[:, np.newaxis]
+
+        c_o_m_positions[zero_load_frames] = np.nan
+
+        return c_o_m_positions, zero_load_frames
+
+    #   Get values used to normalize sensors data (value to add, value to divide by), the same way as DataSet
+    def __get_normalization_values(self) -> (float, float):
+        return abs(self.get_sensor_set_min()), abs(self.get_sensor_set_max()) + abs(self.get_sensor_set_min())
+
+    #   Sensors are normalized when their values are asked
+    def normalize_sensors(self) -> bool:
+        return True
+
+    #   Center of mass positions are calculated when frames are appended
+    def center_of_mass_position_calculation(self) -> bool:
+        return True
+
+    def is_normalized(self) -> bool:
+        return True
+
+    def is_ctr_of_mass_pos_calculated(self) -> bool:
+        return True
+
+    #   Get the maximum number of retained frames
+    def get_capacity(self) -> int:
+        return self.__capacity
+
+    #   Get the number of frames dropped since the creation of the dataset
+    def get_nb_of_dropped_frames(self) -> int:
+        return self.__nb_of_dropped_frames
+
+    #   Get the running maximum of every sensor
+    def get_sensor_set_max(self) -> float:
+        return max(self.get_sensors_max())
+
+    #   Get the running minimum of every sensor
+    def get_sensor_set_min(self) -> float:
+        return min(self.get_sensors_min())
+
+    def get_sensor_set_max_norm(self) -> float:
+        return max(self.get_sensors_max_normalized())
+
+    def get_sensor_set_min_norm(self) -> float:
+        return min(self.get_sensors_min_normalized())
+
+    #   Get the normalized running maximum of each sensor
+    def get_sensors_max_normalized(self) -> [float]:
+        add_value, division_value = self.__get_normalization_values()
+        return [(sensor_max + add_value) / division_value for sensor_max in self.get_sensors_max()]
+
+    #   Get the normalized running minimum of each sensor
+    def get_sensors_min_normalized(self) -> [float]:
+        add_value, division_value = self.__get_normalization_values()
+        return [(sensor_min + add_value) / division_value for sensor_min in self.get_sensors_min()]
+
+    #   Get the temporal set of retained frames
+    def get_temporal_set(self) -> np.ndarray:
+        return self.__temporal_ring.get_columns()[0]
+
+    def get_sampling_period(self) -> float | None:
+        return None
+
+    def is_uniformly_sampled(self) -> bool:
+        return False
+
+    #   Get the frame shown at the given time (in seconds): the last frame whose time is before or equal to it
+    #   Return -1 if the time is before the first retained frame
+    def get_frame_at(self, time: float) -> int:
+        return int(np.searchsorted(self.get_temporal_set(), time, side='right')) - 1
+
+    #   Get the retained frames whose time is in [start_time; end_time] as a [first frame; end frame[ range
+    def get_frames_between(self, start_time: float, end_time: float) -> (int, int):
+        first_frame = int(np.searchsorted(self.get_temporal_set(), start_time, side='left'))
+
+        return first_frame, max(first_frame, self.get_frame_at(end_time) + 1)
+
+    #   Get normalized values of retained frames, sensor by sensor (computed, not views)
+    def get_sensors_normalized_values(self) -> [np.ndarray]:
+        return list(self.get_sensors_normalized_values_matrix().T)
+
+    #   Get non-normalized values of retained frames, shape is (number of frames, number of sensors)
+    def get_sensors_values_matrix(self) -> np.ndarray:
+        return self.__values_ring.get_rows()
+
+    #   Get values of retained frames as they are stored, retained frames are always stored with a full precision
+    def get_stored_values_matrix(self) -> np.ndarray:
+        return self.__values_ring.get_rows()
+
+    #   Get normalized values of retained frames, shape is (number of frames, number of sensors) (computed, not a view)
+    def get_sensors_normalized_values_matrix(self) -> np.ndarray:
+        add_value, division_value = self.__get_normalization_values()
+        return (self.__values_ring.get_rows() + add_value) / division_value
+
+    #   Get the cache of statistics of non-normalized values of retained frames (built at the first call after an
+    #   append)
+    def get_statistics(self) -> BlockStatistics:
+        if self.__statistics is None:
+            self.__statistics = BlockStatistics(self.__values_ring.get_rows().copy())
+
+        return self.__statistics
+
+    #   Get the min/max/mean summaries of retained frames (built at the first call after an append)
+    def get_min_max_pyramid(self) -> MinMaxPyramid:
+        if self.__pyramid is None:
+            self.__pyramid = MinMaxPyramid(self.__values_ring.get_rows().copy(), self.get_temporal_set().copy())
+
+        return self.__pyramid
+
+    #   Get an array filled with non-normalized values of each sensor at a specific retained frame (a view)
+    def get_sensors_values_at(self, index: int) -> np.ndarray:
+        return self.__values_ring.get_rows()[index]
+
+    #   Get an array filled with normalized values of each sensor at a specific retained frame (computed, not a view)
+    def get_sensors_normalized_values_at(self, index: int) -> np.ndarray:
+        add_value, division_value = self.__get_normalization_values()
+        return (self.__values_ring.get_rows()[index] + add_value) / division_value
+
+    #   Get center of mass positions of retained frames, shape is (number of frames, 2), NaN for frames without load
+    def get_c_o_m_positions(self) -> np.ndarray:
+        return self.__c_o_m_ring.get_rows()
+
+    #   Get the mask of retained frames without any load (and without center of mass)
+    def get_c_o_m_zero_load_mask(self) -> np.ndarray:
+        return self.__zero_load_ring.get_columns()[0]
+
+
+#   Get the capacity (in frames) of a ring buffer dataset of the given number of sensors whose ring buffers fit in the
+#   given memory (in bytes), a dataset retains at least one frame
+def get_capacity_for_memory(memory_limit: int, nb_of_sensors: int) -> int:
+    return max(1, int(memory_limit) // (RING_FRAME_BYTES + 2 * 8 * nb_of_sensors))
@@ -0,0 +1,198 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining how values of sensors are stored in memory (full or reduced precision)
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+from enum import Enum
+
+import numpy as np
+
+#   Largest code of the int16 storage, codes are in [-INT16_STORAGE_MAX_CODE; INT16_STORAGE_MAX_CODE]
+INT16_STORAGE_MAX_CODE = 32767
+
+#   Part of the range of a sensor added to the side(s) of it exceeded by new values when values must be encoded again
+#   in int16, so the next new values are likely to fit in it
+INT16_STORAGE_RANGE_MARGIN = 0.125
+
+#   Number of frames decoded at once when whole matrices are processed (e.g. center of mass positions)
+STORAGE_DECODE_CHUNK = 65536
+
+
+class StorageType(Enum):
+    float64 = [0, "64-bit float"]
+    float32 = [1, "32-bit float"]
+    int16 = [2, "16-bit integer"]
+
+
+"""
+
+    SensorsStorage
+
+    In charge of encoding values of sensors, given as (number of frames, number of sensors) arrays, into the type they
+    are stored with and of decoding them back to 64-bit floats (shape is kept, a single frame can be given too).
+
+    Precision of each type:
+        -   float64 keeps values as they are (8 bytes per value)
+        -   float32 keeps about 7 significant digits, the error of a value is at most its magnitude * 2 ** -24
+            (4 bytes per value)
+        -   int16 maps the range [min; max] of each sensor onto 65535 evenly spaced codes (value = min + scale *
+            (code + 32767)), the error of a value is at most scale / 2 = (max - min) / 131068, e.g. less than 1 / 32 of
+            a step for values of a 12-bit ADC (2 bytes per value), and the minimum (e.g. 0 without any load) is exact
+            If values must be encoded again with a wider range (see widen()), the errors of both encodings add up
+
+    Datasets with a reduced precision storage (float32 or int16) don't store normalized values, they are decoded from
+    the stored values when they are asked (normalization is linear).
+
+"""
+
+
+class SensorsStorage:
+    __storage_type: StorageType
+
+    #   Only used by the int16 storage, one for each sensor
+    __scale: np.ndarray | None
+    __minimum: np.ndarray | None
+
+    #   sensors_min and sensors_max are the range of each sensor, only needed by the int16 storage
+    def __init__(self, storage_type: StorageType = StorageType.float64,
+                 sensors_min: np.ndarray | None = None, sensors_max: np.ndarray | None = None):
+        self.__storage_type = storage_type
+        self.__scale = None
+        self.__minimum = None
+
+        if storage_type == StorageType.int16:
+            if sensors_min is None or sensors_max is None:
+                raise Exception("SensorsStorage: The range of each sensor is needed by the int16 storage !")
+
+            sensors_min = np.asarray(sensors_min, dtype=float)
+            sensors_max = np.asarray(sensors_max, dtype=float)
+
+            #   A constant sensor still needs a non-zero scale
+            self.__scale = np.where(sensors_max > sensors_min,
+                                    (sensors_max - sensors_min) / (2 * INT16_STORAGE_MAX_CODE), 1)
+            self.__minimum = sensors_min
+
+    def get_storage_type(self) -> StorageType:
+        return self.__storage_type
+
+    #   Get the type of stored values
+    def get_dtype(self) -> type:
+        if self.__storage_type == StorageType.float32:
+            return np.float32
+
+        if self.__storage_type == StorageType.int16:
+            return np.int16
+
+        return np.float64
+
+    #   In order to check if stored values are decoded (float32 or int16), otherwise they are the values themselves
+    def is_reduced(self) -> bool:
+        return self.__storage_type != StorageType.float64
+
+    #   Get the largest error on each sensor (given its range) between a value and its decoded stored value
+    def get_max_error(self, sensors_min: np.ndarray, sensors_max: np.ndarray) -> np.ndarray:
+        magnitude = np.maximum(np.abs(sensors_min), np.abs(sensors_max))
+
+        if self.__storage_type == StorageType.float32:
+            return magnitude * 2.0 ** -24
+
+        if self.__storage_type == StorageType.int16:
+            return self.__scale / 2
+
+        return np.zeros_like(magnitude, dtype=float)
+
+    #   Will encode values into the stored type
+    def encode(self, values: np.ndarray) -> np.ndarray:
+        if self.__storage_type == StorageType.int16:
+            codes = np.rint((np.asarray(values, dtype=float) - self.__minimum) / self.__scale) - INT16_STORAGE_MAX_CODE
+            return np.clip(codes, -INT16_STORAGE_MAX_CODE, INT16_STORAGE_MAX_CODE, out=codes).astype(np.int16)
+
+        return np.asarray(values, dtype=self.get_dtype())
+
+    #   Will decode stored values into 64-bit floats (float64 stored values are given as they are, not copied)
+    def decode(self, stored_values: np.ndarray) -> np.ndarray:
+        if self.__storage_type == StorageType.int16:
+            return (np.asarray(stored_values, dtype=float) + INT16_STORAGE_MAX_CODE) * self.__scale + self.__minimum
+
+        return np.asarray(stored_values, dtype=float)
+
+    #   In order to check if values in the given ranges can be encoded without being clipped
+    def covers(self, sensors_min: np.ndarray, sensors_max: np.ndarray) -> bool:
+        if self.__storage_type != StorageType.int16:
+            return True
+
+        return bool(np.all(sensors_min >= self.__minimum) and
+                    np.all(sensors_max <= self.__get_maximum()))
+
+    #   Get the largest value of each sensor which can be encoded (int16 storage only)
+    def __get_maximum(self) -> np.ndarray:
+        return self.__minimum + 2 * INT16_STORAGE_MAX_CODE * self.__scale
+
+    #   Get a storage able to encode values in the given ranges (which must contain the current ones), with a margin
+    #   on the exceeded sides only (see INT16_STORAGE_RANGE_MARGIN), so a minimum which is not exceeded stays exact
+    def widen(self, sensors_min: np.ndarray, sensors_max: np.ndarray) -> 'SensorsStorage':
+        if self.__storage_type != StorageType.int16:
+            return self
+
+        sensors_min = np.asarray(sensors_min, dtype=float)
+        sensors_max = np.asarray(sensors_max, dtype=float)
+        margin = INT16_STORAGE_RANGE_MARGIN * (sensors_max - sensors_min)
+
+        return SensorsStorage(self.__storage_type,
+                              np.where(sensors_min < self.__minimum, sensors_min - margin, self.__minimum),
+                              np.where(sensors_max > self.__get_maximum(), sensors_max + margin, self.__get_maximum()))
+
+    #   Get the storage of the given sensors only (a slice or a list of indices)
+    def select(self, columns: slice | list[int]) -> 'SensorsStorage':
+        if self.__storage_type != StorageType.int16:
+            return self
+
+        storage = SensorsStorage.__new__(SensorsStorage)
+        storage.__storage_type = self.__storage_type
+        storage.__scale = self.__scale[columns]
+        storage.__minimum = self.__minimum[columns]
+
+        return storage
+
+    #   Get stored values seen as decoded values by the code only reading them by blocks of frames (e.g. statistics)
+    def get_decoded_values(self, stored_values: np.ndarray) -> 'np.ndarray | DecodedValues':
+        if not self.is_reduced():
+            return stored_values
+
+        return DecodedValues(stored_values, self)
+
+
+"""
+
+    DecodedValues
+
+    Stored values seen as a (number of frames, number of sensors) array of decoded values: any frame or slice of
+    frames is decoded when it is read, so nothing is decoded in advance.
+
+"""
+
+
+class DecodedValues:
+    __stored_values: np.ndarray
+    __storage: SensorsStorage
+
+    def __init__(self, stored_values: np.ndarray, storage: SensorsStorage):
+        self.__stored_values = stored_values
+        self.__storage = storage
+
+    def __len__(self) -> int:
+        return len(self.__stored_values)
+
+    @property
+    def shape(self) -> tuple:
+        return self.__stored_values.shape
+
+    def __getitem__(self, key) -> np.ndarray:
+        return self.__storage.decode(self.__stored_values[key])
@@ -0,0 +1,224 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the sensors layout described by a SVG file and a registry of already parsed layouts
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+import hashlib
+import io
+import threading
+from xml.etree import ElementTree
+
+import numpy as np
+import svg.path as svg
+
+#   Import of custom modules
+from utils import extract_numerical_value, get_binary_file
+
+"""
+
+    SvgLayout
+
+    In charge of storing everything a SVG file describes about a sole: the map size, the situation of each sensor
+    (rect elements, matched with CSV data by their id) and the background paths (path elements with "BG_PATH" as id).
+
+"""
+
+
+class SvgLayout:
+    __map_width: int | float
+    __map_height: int | float
+    __sensors: dict[str, tuple[int, int, int, int, int]]
+    __bg_path: [svg.Path]
+    __bg_path_complete: bool
+
+    #   sensors associates the id of each sensor to its situation (x, y, width, height, angle)
+    #   bg_path_complete is False if a path without id stopped the search of background paths
+    def __init__(self, map_width: int | float, map_height: int | float,
+                 sensors: dict[str, tuple[int, int, int, int, int]],
+                 bg_path: [svg.Path], bg_path_complete: bool = True):
+        self.__map_width = map_width
+        self.__map_height = map_height
+        self.__sensors = sensors
+        self.__bg_path = bg_path
+        self.__bg_path_complete = bg_path_complete
+
+    #   Get map width
+    def get_map_width(self) -> int | float:
+        return self.__map_width
+
+    #   Get map height
+    def get_map_height(self) -> int | float:
+        return self.__map_height
+
+    #   Get the ids of all sensors described in the layout
+    def get_sensor_names(self) -> [str]:
+        return list(self.__sensors.keys())
+
+    #   Get background paths
+    def get_bg_path(self) -> [svg.Path]:
+        return self.__bg_path
+
+    #   In order to check if every path has been checked when looking for background paths
+    def is_bg_path_complete(self) -> bool:
+        return self.__bg_path_complete
+
+    #   Will match the sensors of the layout with the given sensors names (e.g. from a CSV header)
+    #   Return the positions (as a (number of sensors, 2) array) and the characteristics [width, height, angle] of each
+    #   sensor, in the order of the names
+    def get_sensors_situation(self, sensors_name: [str]) -> (np.ndarray, [[int, int, int]]):
+        #   Every sensor of the layout must match with CSV data
+        known_names = set(sensors_name)
+
+        for sensor_id in self.__sensors:
+            if sensor_id not in known_names:
+                raise Exception("SVG LOADER: Error cannot match the sensor {:s} with CSV data".format(sensor_id))
+
+        sensors_position: [[int, int]] = []
+        sensors_characteristics: [[int, int, int]] = []
+
+        for name in sensors_name:
+            situation = self.__sensors.get(name)
+
+            if situation is None:
+                raise Exception("SVG LOADER: Error cannot find the sensor {:s} in SVG".format(name))
+
+            sensors_position.append([situation[0], situation[1]])
+            sensors_characteristics.append([situation[2], situation[3], situation[4]])
+
+        return np.array(sensors_position, dtype=int).reshape(-1, 2), sensors_characteristics
+
+
+#   Used to remove the namespace of an ElementTree tag ("{http://www.w3.org/2000/svg}rect" -> "rect")
+def __get_local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+#   Will parse the layout described by the content of a SVG file
+#   The document is read as a stream of elements, nothing is kept except what the layout needs
+def parse_svg_layout(svg_content: bytes) -> SvgLayout:
+    map_width = None
+    map_height = None
+    sensors: dict[str, tuple[int, int, int, int, int]] = {}
+    bg_path: [svg.Path] = []
+    bg_path_complete = True
+    root = None
+
+    for event, element in ElementTree.iterparse(io.BytesIO(svg_content), events=('start', 'end')):
+        if event == 'end':
+            #   Elements are not needed anymore once they have been analysed
+            if element is not root:
+                element.clear()
+            continue
+
+        tag = __get_local_name(element.tag)
+
+        if root is None:
+            root = element
+
+            if tag != "svg":
+                raise Exception("SVG LOADER: Not a SVG file")
+
+            #   Extract map width and height from svg
+            map_width = extract_numerical_value(element.get("width", ""))
+            map_height = extract_numerical_value(element.get("height", ""))
+
+            if map_width is None or map_height is None:
+                raise Exception("SVG LOADER: Error in map width or height value")
+
+        #   Extract sensors positions and dimensions from svg
+        elif tag == "rect":
+            sensor_id = element.get("id")
+
+            if sensor_id is None:
+                raise Exception("SVG LOADER: Error a sensor without id has been found in SVG")
+
+            #   Check for any duplication
+            if sensor_id in sensors:
+                raise Exception("SVG LOADER: Error in duplication found for the sensor {:s} in SVG".format(sensor_id))
+
+            width = int(extract_numerical_value(element.get("width", "")))
+            height = int(extract_numerical_value(element.get("height", "")))
+
+            if width <= 0 or height <= 0:
+                raise Exception(
+                    "SVG LOADER: Error in height and width found for the sensor {:s} in SVG".format(sensor_id))
+
+            angle = int(extract_numerical_value(element.get("transform"))) if "transform" in element.attrib else 0
+
+            sensors[sensor_id] = (int(extract_numerical_value(element.get("x", ""))),
+                                  int(extract_numerical_value(element.get("y", ""))),
+                                  width, height, angle)
+
+        #   A path without id stops the search of background paths
+        elif tag == "path" and bg_path_complete:
+            path_id = element.get("id")
+
+            if path_id is None:
+                bg_path_complete = False
+
+            elif path_id == "BG_PATH":
+                bg_path.append(svg.parse_path(element.get("d", "")))
+
+    if root is None:
+        raise Exception("SVG LOADER: Empty SVG file")
+
+    return SvgLayout(map_width, map_height, sensors, bg_path, bg_path_complete)
+
+
+"""
+
+    SvgLayoutRegistry
+
+    In charge of keeping already parsed layouts, keyed by the hash of the content of their SVG file, so a layout
+    shared by many imports is only parsed once. It can be used from multiple threads.
+
+"""
+
+
+class SvgLayoutRegistry:
+    __layouts: dict[str, SvgLayout]
+    __lock: threading.Lock
+
+    def __init__(self):
+        self.__layouts = {}
+        self.__lock = threading.Lock()
+
+    #   Number of layouts in the registry
+    def __len__(self) -> int:
+        return len(self.__layouts)
+
+    #   Will compute the key of a layout from the content of its SVG file
+    @staticmethod
+    def get_key(svg_content: bytes) -> str:
+        return hashlib.blake2b(svg_content, digest_size=20).hexdigest()
+
+    #   Get the layout described by a SVG file, it is parsed only if no file with the same content has been parsed yet
+    #   The SVG file may be compressed, or be a zip archive containing it
+    def get_layout(self, svg_file_path: str) -> SvgLayout:
+        with get_binary_file(svg_file_path, ".svg") as file:
+            svg_content = file.read()
+
+        key = self.get_key(svg_content)
+
+        with self.__lock:
+            layout = self.__layouts.get(key)
+
+        if layout is None:
+            layout = parse_svg_layout(svg_content)
+
+            with self.__lock:
+                layout = self.__layouts.setdefault(key, layout)
+
+        return layout
+
+    #   Will remove every layout of the registry
+    def clear(self) -> None:
+        with self.__lock:
+            self.__layouts.clear()
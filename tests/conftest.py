@@ -0,0 +1,15 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the configuration of tests, modules of the software are imported from the root of the repository
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
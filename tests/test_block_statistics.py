@@ -0,0 +1,130 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining tests of the cache of statistics of sensors over windows of frames
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+
+from block_statistics import BlockStatistics
+
+BLOCK_SIZE = 64
+NB_OF_SAMPLES = 5000
+NB_OF_SENSORS = 3
+
+
+#   Will give values with a different offset and scale for each sensor, shape is (number of samples, number of sensors)
+def get_values(nb_of_samples: int = NB_OF_SAMPLES, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+
+    return rng.normal(size=(nb_of_samples, NB_OF_SENSORS)) * [1, 50, 1e-3] + [0, 4000, -7]
+
+
+#   Will give random windows and the windows on the edges of blocks (empty windows excluded)
+def get_windows(nb_of_samples: int, seed: int = 1) -> [(int, int)]:
+    rng = np.random.default_rng(seed)
+    windows = [tuple(sorted(rng.choice(nb_of_samples + 1, 2, replace=False))) for _ in range(200)]
+
+    windows += [(0, nb_of_samples), (0, 1), (nb_of_samples - 1, nb_of_samples), (3, 10),
+                (BLOCK_SIZE, 2 * BLOCK_SIZE), (BLOCK_SIZE - 1, 2 * BLOCK_SIZE + 1), (BLOCK_SIZE + 1, 2 * BLOCK_SIZE - 1),
+                (0, BLOCK_SIZE * (nb_of_samples // BLOCK_SIZE)), (BLOCK_SIZE * (nb_of_samples // BLOCK_SIZE) - 1,
+                                                                  nb_of_samples)]
+
+    return [(int(start), int(end)) for start, end in windows if 0 <= start < end <= nb_of_samples]
+
+
+#   Will check min, max, mean and standard deviations of every window against numpy
+def check_windows(statistics: BlockStatistics, values: np.ndarray) -> None:
+    for start, end in get_windows(len(values)):
+        window = values[start:end]
+
+        assert np.array_equal(statistics.get_min(start, end), window.min(axis=0))
+        assert np.array_equal(statistics.get_max(start, end), window.max(axis=0))
+        assert np.allclose(statistics.get_mean(start, end), window.mean(axis=0), rtol=1e-12, atol=1e-12)
+        assert np.allclose(statistics.get_std(start, end), window.std(axis=0), rtol=1e-9, atol=1e-12)
+
+        #   No sample is left for the sample standard deviation of a single frame
+        if end - start > 1:
+            assert np.allclose(statistics.get_std(start, end, 1), window.std(axis=0, ddof=1), rtol=1e-9, atol=1e-12)
+        else:
+            assert np.all(np.isnan(statistics.get_std(start, end, 1)))
+
+
+@pytest.mark.parametrize("block_size", [1, 7, BLOCK_SIZE, 10000])
+def test_windows_match_numpy(block_size: int):
+    values = get_values()
+
+    check_windows(BlockStatistics(values, block_size), values)
+
+
+def test_extended_values_match_numpy():
+    values = get_values()
+    statistics = BlockStatistics(values[:100], BLOCK_SIZE)
+
+    #   Extensions end in the middle of blocks, on the edge of a block and after several blocks
+    for nb_of_samples in [101, 128, 129, 1000, NB_OF_SAMPLES]:
+        statistics.extend(values[:nb_of_samples])
+
+        assert statistics.get_nb_of_samples() == nb_of_samples
+        check_windows(statistics, values[:nb_of_samples])
+
+
+def test_percentiles():
+    values = get_values()
+    statistics = BlockStatistics(values, BLOCK_SIZE, 1024)
+    bin_widths = (values.max(axis=0) - values.min(axis=0)) / 1024
+
+    for start, end in get_windows(NB_OF_SAMPLES)[:50]:
+        for percentile in [0, 10, 50, 99, 100]:
+            estimation = statistics.get_percentile(percentile, start, end)
+            window = values[start:end]
+
+            #   Precise to one bin width around the samples holding the percentile, never out of the window bounds
+            lower = np.percentile(window, percentile, axis=0, method="lower") - bin_widths
+            upper = np.percentile(window, percentile, axis=0, method="higher") + bin_widths
+
+            assert np.all((lower <= estimation) & (estimation <= upper))
+            assert np.all((window.min(axis=0) <= estimation) & (estimation <= window.max(axis=0)))
+
+    #   Windows without any whole block are answered exactly
+    assert np.array_equal(statistics.get_percentile(50, 3, 40), np.percentile(values[3:40], 50, axis=0))
+
+
+def test_histograms_follow_extensions():
+    values = get_values()
+    statistics = BlockStatistics(values[:1000], BLOCK_SIZE, 1024)
+    statistics.get_percentile(50, 0, 1000)
+
+    #   New values out of the range of histograms make them built again
+    extended_values = np.concatenate((values, [[100, 0, 0]]))
+    statistics.extend(extended_values)
+
+    bin_width = (extended_values[:, 0].max() - extended_values[:, 0].min()) / 1024
+    median = statistics.get_percentile(50, 0, len(extended_values))
+
+    assert abs(median[0] - np.median(extended_values[:, 0])) <= 2 * bin_width
+
+
+@pytest.mark.parametrize("start, end", [(0, 0), (10, 5), (-1, 10), (0, NB_OF_SAMPLES + 1)])
+def test_invalid_windows(start: int, end: int):
+    statistics = BlockStatistics(get_values(), BLOCK_SIZE)
+
+    with pytest.raises(Exception, match="Invalid window"):
+        statistics.get_mean(start, end)
+
+
+def test_invalid_settings():
+    with pytest.raises(Exception):
+        BlockStatistics(get_values(), 0)
+
+    with pytest.raises(Exception):
+        BlockStatistics(get_values(), BLOCK_SIZE, 0)
+
+    with pytest.raises(Exception):
+        BlockStatistics(get_values(), BLOCK_SIZE).get_percentile(101, 0, 10)
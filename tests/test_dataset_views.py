@@ -0,0 +1,149 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining tests of views over a time window or a subset of the sensors of a dataset
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+
+from dataset import DataSet
+from sensors_storage import StorageType
+
+NB_OF_FRAMES = 1000
+SENSORS_NAME = ["S0", "S1", "S2", "S3", "S4"]
+SENSORS_POSITIONS = [[10 + 40 * i, 50 + 60 * i] for i in range(len(SENSORS_NAME))]
+SENSORS_CHARACTERISTICS = [[20, 30, 0]] * len(SENSORS_NAME)
+
+
+#   Will give frames sampled every 10 ms, with a different range for each sensor
+def get_frames() -> (np.ndarray, np.ndarray):
+    rng = np.random.default_rng(0)
+
+    return np.arange(NB_OF_FRAMES) * 0.01, rng.random((len(SENSORS_NAME), NB_OF_FRAMES)) * \
+        np.array([10, 100, 1000, 50, 5])[:, np.newaxis]
+
+
+#   Will build a dataset of the given sensors from the given frames
+def build_dataset(temporal_set: np.ndarray, sensors_data: np.ndarray, sensors_indices: list[int] | None = None,
+                  storage_type: StorageType = StorageType.float64) -> DataSet:
+    indices = list(range(len(SENSORS_NAME))) if sensors_indices is None else sensors_indices
+
+    return DataSet(temporal_set, [SENSORS_NAME[i] for i in indices], [SENSORS_POSITIONS[i] for i in indices],
+                   [SENSORS_CHARACTERISTICS[i] for i in indices], sensors_data[indices], 300, 600,
+                   storage_type=storage_type)
+
+
+#   Will check a view against a dataset built from its frames and sensors: a view is normalized with its own bounds
+def check_view(view: DataSet, reference: DataSet) -> None:
+    assert view.is_view() and not reference.is_view()
+    assert view.get_sensor_names() == reference.get_sensor_names()
+
+    assert np.array_equal(view.get_temporal_set(), reference.get_temporal_set())
+    assert np.array_equal(view.get_sensors_values_matrix(), reference.get_sensors_values_matrix())
+    assert np.array_equal(view.get_positions_array(), reference.get_positions_array())
+    assert view.get_sensors_min() == reference.get_sensors_min()
+    assert view.get_sensors_max() == reference.get_sensors_max()
+    assert np.allclose(view.get_sensors_normalized_values_matrix(), reference.get_sensors_normalized_values_matrix(),
+                       rtol=0, atol=1e-12)
+    assert np.allclose(view.get_c_o_m_positions(), reference.get_c_o_m_positions(), rtol=0, atol=1e-9)
+    assert np.array_equal(view.get_c_o_m_zero_load_mask(), reference.get_c_o_m_zero_load_mask())
+
+
+@pytest.mark.parametrize("start_time, end_time", [(0, 9.99), (2.005, 4.5), (3, 3), (-5, 0.5), (9.5, 100)])
+def test_window_shares_frames(start_time: float, end_time: float):
+    temporal_set, sensors_data = get_frames()
+    dataset = build_dataset(temporal_set, sensors_data)
+    view = dataset.window(start_time, end_time)
+
+    assert np.shares_memory(view.get_stored_values_matrix(), dataset.get_stored_values_matrix())
+    assert np.shares_memory(view.get_temporal_set(), dataset.get_temporal_set())
+
+    frames = (temporal_set >= start_time - 1e-9) & (temporal_set <= end_time + 1e-9)
+    check_view(view, build_dataset(temporal_set[frames], sensors_data[:, frames]))
+
+    #   Frames of a uniformly sampled dataset stay uniformly sampled
+    assert view.is_uniformly_sampled()
+    assert view.get_frame_at(start_time) == dataset.get_frame_at(start_time) - dataset.get_frame_at(
+        view.get_temporal_set()[0])
+
+
+@pytest.mark.parametrize("sensors_name, sensors_indices, shared", [(["S1", "S2", "S3"], [1, 2, 3], True),
+                                                                   (["S4", "S0", "S2"], [0, 2, 4], True),
+                                                                   (["S3"], [3], True),
+                                                                   (["S0", "S1", "S4"], [0, 1, 4], False)])
+def test_select_shares_evenly_spaced_sensors(sensors_name: [str], sensors_indices: [int], shared: bool):
+    temporal_set, sensors_data = get_frames()
+    dataset = build_dataset(temporal_set, sensors_data)
+    view = dataset.select(sensors_name)
+
+    #   Selected sensors keep the order of the dataset
+    assert np.shares_memory(view.get_stored_values_matrix(), dataset.get_stored_values_matrix()) == shared
+    check_view(view, build_dataset(temporal_set, sensors_data, sensors_indices))
+
+
+def test_views_of_views():
+    temporal_set, sensors_data = get_frames()
+    dataset = build_dataset(temporal_set, sensors_data)
+    view = dataset.window(1, 5).select(["S0", "S2", "S4"]).window(2, 3)
+
+    assert np.shares_memory(view.get_stored_values_matrix(), dataset.get_stored_values_matrix())
+
+    frames = (temporal_set >= 2 - 1e-9) & (temporal_set <= 3 + 1e-9)
+    check_view(view, build_dataset(temporal_set[frames], sensors_data[:, frames], [0, 2, 4]))
+
+
+def test_views_keep_the_dataset_unchanged():
+    temporal_set, sensors_data = get_frames()
+    dataset = build_dataset(temporal_set, sensors_data)
+    normalized_values = dataset.get_sensors_normalized_values_matrix().copy()
+    c_o_m_positions = dataset.get_c_o_m_positions().copy()
+
+    view = dataset.select(["S0", "S4"]).window(0, 1)
+    view.get_sensors_normalized_values_matrix()
+    view.get_c_o_m_positions()
+
+    #   A view is normalized with its own bounds, not the ones of its dataset
+    assert view.get_sensor_set_max() < dataset.get_sensor_set_max()
+    assert np.array_equal(dataset.get_sensors_normalized_values_matrix(), normalized_values)
+    assert np.array_equal(dataset.get_c_o_m_positions(), c_o_m_positions, equal_nan=True)
+    assert dataset.get_sensor_set()[0].get_max() == sensors_data[0].max()
+
+
+def test_views_of_reduced_precision_datasets():
+    temporal_set, sensors_data = get_frames()
+    dataset = build_dataset(temporal_set, sensors_data, storage_type=StorageType.int16)
+    view = dataset.window(1, 5).select(["S1", "S3"])
+
+    #   Stored values are shared as they are and decoded with the storage of the selected sensors
+    assert view.get_stored_values_matrix().dtype == np.int16
+    assert np.shares_memory(view.get_stored_values_matrix(), dataset.get_stored_values_matrix())
+
+    first_frame, end_frame = dataset.get_frames_between(1, 5)
+    assert np.array_equal(view.get_sensors_values_matrix(),
+                          dataset.get_sensors_values_matrix()[first_frame:end_frame, [1, 3]])
+
+
+def test_invalid_views():
+    temporal_set, sensors_data = get_frames()
+    dataset = build_dataset(temporal_set, sensors_data)
+
+    with pytest.raises(Exception, match="No frame found"):
+        dataset.window(20, 30)
+
+    with pytest.raises(Exception, match="No frame found"):
+        dataset.window(1.005, 1.009)
+
+    with pytest.raises(Exception, match="Cannot find the sensor S9"):
+        dataset.select(["S0", "S9"])
+
+    with pytest.raises(Exception, match="At least one sensor"):
+        dataset.select([])
+
+    with pytest.raises(Exception, match="cannot be appended to a view"):
+        dataset.window(0, 1).append_frames([10], [[1]] * len(SENSORS_NAME))
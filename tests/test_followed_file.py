@@ -0,0 +1,162 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining tests of the import of rows appended to a CSV file while it is followed
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import gzip
+
+import numpy as np
+import pytest
+
+from dataset import DataSet
+from import_module import CsvFollower, DataImportModule
+
+SVG_LAYOUT = """<svg xmlns="http://www.w3.org/2000/svg" width="300px" height="600px">
+<rect id="S0" x="10" y="50" width="20" height="30"/>
+<rect id="S1" x="60" y="110" width="20" height="30"/>
+<rect id="S2" x="110" y="170" width="20" height="30"/>
+<path id="BG_PATH" d="M 10 10 L 100 10 L 100 500 Z"/>
+</svg>
+"""
+
+
+#   Will give the CSV rows of the given frames (time in seconds, then the value of each sensor)
+def get_rows(first_frame: int, end_frame: int) -> str:
+    rng = np.random.default_rng(first_frame)
+
+    return "".join("{:.2f},{:.3f},{:.3f},{:.3f}\n".format(i * 0.01, *(rng.random(3) * 100))
+                   for i in range(first_frame, end_frame))
+
+
+#   Will build a dataset from frames given as CSV rows, the same way as an import of the whole file
+def build_dataset(csv_rows: str) -> DataSet:
+    values = np.array([[float(cell) for cell in row.split(",")] for row in csv_rows.splitlines()]).T
+
+    return DataSet(values[0], ["S0", "S1", "S2"], [[10, 50], [60, 110], [110, 170]], [[20, 30, 0]] * 3, values[1:],
+                   300, 600)
+
+
+@pytest.fixture
+def files(tmp_path) -> (str, str):
+    svg_file_path = tmp_path / "layout.svg"
+    svg_file_path.write_text(SVG_LAYOUT)
+
+    return str(tmp_path / "followed.csv"), str(svg_file_path)
+
+
+def test_partial_rows_are_read_once_complete(tmp_path):
+    file_path = tmp_path / "rows.csv"
+    file_path.write_bytes(b"0;1.5;2\n10;3")
+
+    with open(file_path, 'rb') as file:
+        follower = CsvFollower(file, {"delimiter": ";"}, 3)
+
+        assert np.array_equal(follower.read_new_rows(), [[0], [1.5], [2]])
+
+        #   Nothing new is complete yet
+        assert follower.read_new_rows().shape == (3, 0)
+
+        with open(file_path, 'ab') as writer:
+            writer.write(b".25;4\n20;5;")
+
+        assert np.array_equal(follower.read_new_rows(), [[10], [3.25], [4]])
+
+        with open(file_path, 'ab') as writer:
+            writer.write(b"6\n30;7;8\n")
+
+        assert np.array_equal(follower.read_new_rows(), [[20, 30], [5, 7], [6, 8]])
+
+
+def test_polled_frames_match_a_whole_import(files):
+    csv_file_path, svg_file_path = files
+    errors = []
+
+    with open(csv_file_path, 'w') as file:
+        file.write("time,S0,S1,S2\n" + get_rows(0, 300))
+
+    import_module = DataImportModule()
+    model, _ = import_module.follow_dsf(csv_file_path, svg_file_path, lambda: ",", errors.append, lambda: None,
+                                        errors.append)
+
+    try:
+        all_rows = get_rows(0, 300)
+
+        #   Blocks end in the middle of a row, which is only imported by the next poll
+        for first_frame, end_frame in [(300, 450), (450, 451), (451, 900)]:
+            new_rows = get_rows(first_frame, end_frame)
+            all_rows += new_rows
+
+            with open(csv_file_path, 'a') as file:
+                file.write(new_rows[:-3])
+
+            import_module.poll_followed_file()
+
+            with open(csv_file_path, 'a') as file:
+                file.write(new_rows[-3:])
+
+        nb_of_new_frames, _ = import_module.poll_followed_file()
+        assert nb_of_new_frames > 0
+        assert import_module.poll_followed_file() == (0, False)
+
+    finally:
+        import_module.stop_following()
+
+    assert errors == []
+    assert not import_module.is_following()
+
+    dataset = model.get_dataset()
+    reference = build_dataset(all_rows)
+
+    assert np.array_equal(dataset.get_temporal_set(), reference.get_temporal_set())
+    assert np.array_equal(dataset.get_sensors_values_matrix(), reference.get_sensors_values_matrix())
+    assert np.allclose(dataset.get_sensors_normalized_values_matrix(),
+                       reference.get_sensors_normalized_values_matrix(), rtol=0, atol=1e-12)
+    assert np.allclose(dataset.get_c_o_m_positions(), reference.get_c_o_m_positions(), rtol=0, atol=1e-9)
+
+
+def test_appended_frames_out_of_bounds_modify_frames():
+    dataset = build_dataset(get_rows(0, 100))
+    normalized_frame = dataset.get_sensors_normalized_values_at(10).copy()
+
+    assert not dataset.append_frames([1.0, 1.01], [[50, 50], [50, 50], [50, 50]])
+    assert np.array_equal(dataset.get_sensors_normalized_values_at(10), normalized_frame)
+
+    #   A new maximum changes the normalization of every frame
+    assert dataset.append_frames([1.02], [[500], [50], [50]])
+    assert dataset.get_sensor_set_max() == 500
+    assert np.all(dataset.get_sensors_normalized_values_at(10) < normalized_frame)
+
+    reference = build_dataset(get_rows(0, 100) + "1.00,50,50,50\n1.01,50,50,50\n1.02,500,50,50\n")
+    assert np.allclose(dataset.get_c_o_m_positions(), reference.get_c_o_m_positions(), rtol=0, atol=1e-9)
+
+
+def test_appended_frames_must_be_chronological():
+    dataset = build_dataset(get_rows(0, 100))
+
+    with pytest.raises(Exception, match="not chronological"):
+        dataset.append_frames([0.5], [[1], [1], [1]])
+
+    with pytest.raises(Exception, match="not chronological"):
+        dataset.append_frames([1.2, 1.1], [[1, 1], [1, 1], [1, 1]])
+
+    #   A frame can have the same time as the last one
+    dataset.append_frames([0.99], [[1], [1], [1]])
+    assert len(dataset.get_temporal_set()) == 101
+
+
+def test_compressed_files_cannot_be_followed(tmp_path, files):
+    _, svg_file_path = files
+    errors = []
+
+    csv_file_path = tmp_path / "followed.csv.gz"
+    csv_file_path.write_bytes(gzip.compress(("time,S0,S1,S2\n" + get_rows(0, 10)).encode()))
+
+    assert DataImportModule().follow_dsf(str(csv_file_path), svg_file_path, lambda: ",", errors.append,
+                                         lambda: None, errors.append) is None
+    assert "compressed" in str(errors[0])
@@ -0,0 +1,132 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining tests of the lookup of frames shown at a given time or held by a time range
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+
+from dataset import UNIFORM_SAMPLING_TOLERANCE, DataSet
+
+NB_OF_FRAMES = 2000
+PERIOD = 0.01
+
+
+#   Will build a dataset of two sensors from the given temporal set
+def build_dataset(temporal_set: np.ndarray) -> DataSet:
+    values = np.vstack((np.arange(len(temporal_set)), np.arange(len(temporal_set))[::-1] + 1)).astype(float)
+
+    return DataSet(temporal_set, ["S0", "S1"], [[10, 50], [60, 110]], [[20, 30, 0]] * 2, values, 300, 600)
+
+
+#   Will give temporal sets on a 10 ms grid starting at 1.5 s, with some jitter (as a fraction of the period)
+def get_temporal_set(jitter: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    temporal_set = 1.5 + np.arange(NB_OF_FRAMES) * PERIOD + rng.uniform(-jitter, jitter, NB_OF_FRAMES) * PERIOD
+
+    #   The first and last frames stay on the grid so the estimated period is exactly the one of the grid
+    temporal_set[0], temporal_set[-1] = 1.5, 1.5 + (NB_OF_FRAMES - 1) * PERIOD
+
+    return np.maximum.accumulate(temporal_set)
+
+
+#   Will give times before, after, on and between frames of a temporal set
+def get_query_times(temporal_set: np.ndarray) -> np.ndarray:
+    rng = np.random.default_rng(1)
+
+    return np.concatenate((temporal_set, np.nextafter(temporal_set, -np.inf), np.nextafter(temporal_set, np.inf),
+                           rng.uniform(temporal_set[0] - 1, temporal_set[-1] + 1, 2000),
+                           [0, temporal_set[0] - PERIOD, temporal_set[-1] + 100]))
+
+
+TEMPORAL_SETS = {"uniform": get_temporal_set(0),
+                 "jittered": get_temporal_set(UNIFORM_SAMPLING_TOLERANCE / 2),
+                 "irregular": get_temporal_set(0.4),
+                 "repeated times": np.repeat(1.5 + np.arange(NB_OF_FRAMES // 2) * PERIOD, 2)}
+
+
+@pytest.mark.parametrize("name, uniform", [("uniform", True), ("jittered", True), ("irregular", False),
+                                           ("repeated times", False)])
+def test_uniform_sampling_detection(name: str, uniform: bool):
+    dataset = build_dataset(TEMPORAL_SETS[name])
+
+    assert dataset.is_uniformly_sampled() == uniform
+
+    if uniform:
+        assert dataset.get_sampling_period() == pytest.approx(PERIOD, rel=1e-9)
+    else:
+        assert dataset.get_sampling_period() is None
+
+
+@pytest.mark.parametrize("name", TEMPORAL_SETS.keys())
+def test_frame_at_matches_a_binary_search(name: str):
+    temporal_set = TEMPORAL_SETS[name]
+    dataset = build_dataset(temporal_set)
+
+    for time in get_query_times(temporal_set):
+        assert dataset.get_frame_at(time) == np.searchsorted(temporal_set, time, side='right') - 1
+
+
+@pytest.mark.parametrize("name", TEMPORAL_SETS.keys())
+def test_frames_between_hold_the_range(name: str):
+    temporal_set = TEMPORAL_SETS[name]
+    dataset = build_dataset(temporal_set)
+    query_times = get_query_times(temporal_set)
+    rng = np.random.default_rng(2)
+
+    for start_time, end_time in zip(rng.choice(query_times, 500), rng.choice(query_times, 500)):
+        first_frame, end_frame = dataset.get_frames_between(start_time, end_time)
+        frames = np.flatnonzero((temporal_set >= start_time) & (temporal_set <= end_time))
+
+        if len(frames) == 0:
+            assert first_frame == end_frame
+        else:
+            assert (first_frame, end_frame) == (frames[0], frames[-1] + 1)
+
+
+def test_time_before_the_first_frame():
+    dataset = build_dataset(TEMPORAL_SETS["uniform"])
+
+    assert dataset.get_frame_at(0) == -1
+    assert dataset.get_frame_at(1.5 - 1e-9) == -1
+    assert dataset.get_frame_at(1.5) == 0
+    assert dataset.get_frames_between(0, 1) == (0, 0)
+    assert dataset.get_frames_between(0, 1.5) == (0, 1)
+
+
+def test_appended_frames_off_the_grid():
+    dataset = build_dataset(TEMPORAL_SETS["uniform"])
+    last_time = TEMPORAL_SETS["uniform"][-1]
+
+    dataset.append_frames([last_time + PERIOD, last_time + 2 * PERIOD], [[0, 0], [0, 0]])
+    assert dataset.is_uniformly_sampled()
+
+    #   A frame off the grid makes lookups go back to binary searches
+    dataset.append_frames([last_time + 3.5 * PERIOD], [[0], [0]])
+    assert not dataset.is_uniformly_sampled()
+
+    temporal_set = dataset.get_temporal_set()
+
+    for time in get_query_times(temporal_set):
+        assert dataset.get_frame_at(time) == np.searchsorted(temporal_set, time, side='right') - 1
+
+
+def test_single_frame():
+    dataset = build_dataset(np.array([2.0]))
+
+    assert not dataset.is_uniformly_sampled()
+    assert dataset.get_frame_at(1) == -1
+    assert dataset.get_frame_at(2) == 0
+    assert dataset.get_frames_between(2, 2) == (0, 1)
+
+
+@pytest.mark.parametrize("temporal_set", [[0, 0.02, 0.01], [-0.01, 0, 0.01]])
+def test_inconsistent_temporal_sets(temporal_set: list):
+    with pytest.raises(Exception, match="Temporal set inconsistency"):
+        build_dataset(np.array(temporal_set))
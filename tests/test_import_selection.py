@@ -0,0 +1,164 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining tests of the import of selected sensors and of a selected time range only
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import csv
+import io
+
+import numpy as np
+import pytest
+
+from import_module import DataImportModule, get_selected_columns, stream_numerical_body
+from import_selection import ImportSelection
+
+NB_OF_SENSORS = 4
+NB_OF_ROWS = 20000
+
+
+#   Will write a CSV+SVG pair (time in seconds, one frame every 10 ms, with "--" separator rows)
+#   Return the paths of both files and the values of each column
+def write_dsf_files(directory) -> (str, str, np.ndarray):
+    rng = np.random.default_rng(0)
+    temporal_set = [float("{:.2f}".format(i * 0.01)) for i in range(NB_OF_ROWS)]
+    values = np.vstack((temporal_set, rng.integers(0, 4096, (NB_OF_SENSORS, NB_OF_ROWS))))
+
+    rows = ["time," + ",".join("S{:d}".format(i) for i in range(NB_OF_SENSORS)) + "\n"]
+
+    for i, column in enumerate(values.T.tolist()):
+        if i % 5000 == 2500:
+            rows.append("--" + ",--" * NB_OF_SENSORS + "\n")
+
+        rows.append(",".join("{:g}".format(value) for value in column) + "\n")
+
+    csv_file_path = directory / "data.csv"
+    csv_file_path.write_text("".join(rows))
+
+    svg_file_path = directory / "layout.svg"
+    svg_file_path.write_text('<svg xmlns="http://www.w3.org/2000/svg" width="300px" height="600px">\n' +
+                             "".join('<rect id="S{:d}" x="{:d}" y="{:d}" width="20" height="30"/>\n'.format(
+                                 i, 10 + 30 * i, 50 + 60 * i) for i in range(NB_OF_SENSORS)) +
+                             '<path id="BG_PATH" d="M 10 10 L 100 10 L 100 500 Z"/>\n</svg>\n')
+
+    return str(csv_file_path), str(svg_file_path), values
+
+
+#   Will write a full data file (time in milliseconds, sensors situation and size in the last columns)
+#   Return the path of the file and the values of each column
+def write_ff_file(directory, nb_of_rows: int = 2000) -> (str, np.ndarray):
+    rng = np.random.default_rng(1)
+    values = np.vstack((np.arange(nb_of_rows) * 10.0, np.round(rng.random((NB_OF_SENSORS, nb_of_rows)) * 100, 3)))
+
+    rows = [["time"] + ["S{:d}".format(i) for i in range(NB_OF_SENSORS)] + ["", "Situation", "", "Size", ""]]
+    rows += [["{:g}".format(value) for value in column] + [""] * 5 for column in values.T.tolist()]
+
+    situation_column = NB_OF_SENSORS + 3
+    rows[1][situation_column] = "400"
+    rows[2][situation_column] = "200"
+
+    for i in range(NB_OF_SENSORS):
+        rows[5 + 3 * i][situation_column] = str(20 + 10 * i)
+        rows[6 + 3 * i][situation_column] = str(30 + 20 * i)
+
+    rows[5][situation_column + 1] = "Size"
+    rows[5][situation_column + 2] = "10"
+    rows[6][situation_column + 2] = "8"
+
+    file_path = directory / "full.csv"
+    file_path.write_text("".join(";".join(row) + "\n" for row in rows))
+
+    return str(file_path), values
+
+
+def test_selection_settings():
+    selection = ImportSelection(["S2", "S0", "S2"], (1, 2))
+
+    assert selection.get_sensors_name() == ["S2", "S0"]
+    assert selection.get_sensors_indices(["S0", "S1", "S2"]) == [0, 2]
+    assert get_selected_columns(selection, ["S0", "S1", "S2"]) == ([0, 2], [0, 1, 3])
+    assert get_selected_columns(None, ["S0", "S1"]) == ([0, 1], None)
+
+    #   The window is given in the unit of the temporal column and always contains its bounds
+    start, end = selection.get_time_window(0.001)
+    assert start < 1000 < 2000 < end and end - start < 1000.001
+
+    assert selection.get_key() != ImportSelection(["S2", "S0"]).get_key()
+
+    with pytest.raises(Exception):
+        selection.get_sensors_indices(["S0", "S1"])
+
+    with pytest.raises(Exception):
+        ImportSelection([])
+
+    with pytest.raises(Exception):
+        ImportSelection(time_range=(2, 1))
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1000, 16384])
+def test_streamed_selection_across_chunks(chunk_size: int):
+    rng = np.random.default_rng(2)
+    values = np.vstack((np.arange(5000) * 0.5, rng.integers(0, 100, (3, 5000))))
+    text = "".join(";".join("{:g}".format(value) for value in column) + "\n" for column in values.T.tolist())
+
+    decoded = stream_numerical_body(csv.reader(io.StringIO(text), delimiter=";"), 3, chunk_size=chunk_size,
+                                    column_indices=[0, 3, 1], time_window=(1000.25, 1999.75))
+
+    rows = (values[0] >= 1000.25) & (values[0] <= 1999.75)
+    assert np.array_equal(decoded, values[[0, 3, 1]][:, rows])
+
+
+def test_selected_dsf_import(tmp_path):
+    csv_file_path, svg_file_path, values = write_dsf_files(tmp_path)
+    errors = []
+
+    #   The time range crosses the end of the first chunk of rows, names are given in any order
+    selection = ImportSelection(["S3", "S1"], (150, 180))
+    model, _ = DataImportModule(selection=selection).get_model_dsf(csv_file_path, svg_file_path, lambda: ",",
+                                                                   errors.append, lambda: None, errors.append)
+    dataset = model.get_dataset()
+    rows = (values[0] >= 150 - 1e-9) & (values[0] <= 180 + 1e-9)
+
+    assert errors == []
+    assert dataset.get_sensor_names() == ["S1", "S3"]
+    assert np.array_equal(dataset.get_temporal_set(), values[0, rows])
+    assert np.array_equal(dataset.get_sensors_values_matrix(), values[[2, 4]][:, rows].T)
+
+    #   Selected sensors keep their place in the layout
+    full_model, _ = DataImportModule().get_model_dsf(csv_file_path, svg_file_path, lambda: ",", errors.append,
+                                                     lambda: None, errors.append)
+    assert np.array_equal(dataset.get_positions_array(), full_model.get_dataset().get_positions_array()[[1, 3]])
+
+
+def test_selected_ff_import(tmp_path):
+    file_path, values = write_ff_file(tmp_path)
+    errors = []
+
+    #   Times of full data files are given in milliseconds, time ranges in seconds
+    model = DataImportModule(selection=ImportSelection(["S0", "S2"], (0.5, 1))).get_model_ff(file_path,
+                                                                                             lambda: ";",
+                                                                                             errors.append)
+    dataset = model.get_dataset()
+    rows = (values[0] >= 500) & (values[0] <= 1000)
+
+    assert errors == []
+    assert dataset.get_sensor_names() == ["S0", "S2"]
+    assert np.allclose(dataset.get_temporal_set(), values[0, rows] * 0.001)
+    assert np.array_equal(dataset.get_sensors_values_matrix(), values[[1, 3]][:, rows].T)
+    assert dataset.get_positions_array().tolist() == [[20, 30], [40, 70]]
+
+
+@pytest.mark.parametrize("selection, message", [(ImportSelection(time_range=(1000, 2000)), "No data found"),
+                                                (ImportSelection(["S9"]), "cannot find the selected sensor S9")])
+def test_impossible_selections(tmp_path, selection: ImportSelection, message: str):
+    csv_file_path, svg_file_path, _ = write_dsf_files(tmp_path)
+    errors = []
+
+    assert DataImportModule(selection=selection).get_model_dsf(csv_file_path, svg_file_path, lambda: ",",
+                                                               errors.append, lambda: None, errors.append) is None
+    assert message in str(errors[0])
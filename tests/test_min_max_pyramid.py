@@ -0,0 +1,124 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining tests of the min/max/mean summaries of sensors values at power-of-two decimation levels
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+
+from min_max_pyramid import PYRAMID_BASE_LEVEL, MinMaxPyramid
+
+NB_OF_SAMPLES = 5003
+NB_OF_SENSORS = 2
+
+
+#   Will give values (shape is (number of samples, number of sensors)) and a temporal set sampled at 1 kHz
+def get_data(nb_of_samples: int = NB_OF_SAMPLES) -> (np.ndarray, np.ndarray):
+    rng = np.random.default_rng(0)
+
+    return rng.random((nb_of_samples, NB_OF_SENSORS)) * [100, 4095], np.arange(nb_of_samples) * 0.001
+
+
+#   Will compute the summaries of the groups of a level holding the frames [start; end[ directly from samples
+def get_reference_level(values: np.ndarray, temporal_set: np.ndarray, level: int, first_frame: int,
+                        end_frame: int) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+    group_size = 1 << level
+    groups = [values[start:start + group_size]
+              for start in range((first_frame >> level) * group_size, end_frame, group_size)]
+
+    return temporal_set[(first_frame >> level) * group_size:end_frame:group_size], \
+        np.array([group.min(axis=0) for group in groups]), \
+        np.array([group.max(axis=0) for group in groups]), \
+        np.array([group.mean(axis=0) for group in groups])
+
+
+#   Will check every level of the pyramid on the given frames
+def check_levels(pyramid: MinMaxPyramid, values: np.ndarray, temporal_set: np.ndarray, first_frame: int,
+                 end_frame: int) -> None:
+    for level in range(pyramid.get_max_level() + 1):
+        summary = pyramid.get_level(level, first_frame, end_frame)
+        reference = get_reference_level(values, temporal_set, level, first_frame, end_frame)
+
+        assert np.array_equal(summary[0], reference[0])
+        assert np.array_equal(summary[1], reference[1])
+        assert np.array_equal(summary[2], reference[2])
+        assert np.allclose(summary[3], reference[3], rtol=1e-12, atol=0)
+
+
+@pytest.mark.parametrize("nb_of_samples, max_level", [(1, 0), (2, 1), (16, 4), (17, 5), (NB_OF_SAMPLES, 13)])
+def test_max_level_holds_a_single_group(nb_of_samples: int, max_level: int):
+    values, temporal_set = get_data(nb_of_samples)
+    pyramid = MinMaxPyramid(values, temporal_set)
+
+    assert pyramid.get_max_level() == max_level
+    assert len(pyramid.get_level(max_level, 0, nb_of_samples)[0]) == 1
+
+
+@pytest.mark.parametrize("first_frame, end_frame", [(0, NB_OF_SAMPLES), (0, 1), (17, 18), (100, 2048),
+                                                    (NB_OF_SAMPLES - 5, NB_OF_SAMPLES), (1023, 4097)])
+def test_levels_match_samples(first_frame: int, end_frame: int):
+    values, temporal_set = get_data()
+
+    check_levels(MinMaxPyramid(values, temporal_set), values, temporal_set, first_frame, end_frame)
+
+
+def test_extended_levels_match_samples():
+    values, temporal_set = get_data()
+    pyramid = MinMaxPyramid(values[:3], temporal_set[:3])
+
+    #   Extensions end in the middle of groups, on the edge of the base level and past the single group of the top
+    for nb_of_samples in [4, 1 << PYRAMID_BASE_LEVEL, 100, 1024, 1025, NB_OF_SAMPLES]:
+        pyramid.extend(values[:nb_of_samples], temporal_set[:nb_of_samples])
+
+        assert pyramid.get_max_level() == max(0, (nb_of_samples - 1).bit_length())
+        check_levels(pyramid, values[:nb_of_samples], temporal_set[:nb_of_samples], 0, nb_of_samples)
+
+
+@pytest.mark.parametrize("nb_of_frames, pixel_width, level", [(1000, 1000, 0), (1999, 1000, 0), (2000, 1000, 1),
+                                                              (3999, 1000, 1), (4096, 1000, 2), (10, 1000, 0),
+                                                              (5000, 1, 12), (5000, 0, 12), (0, 100, 0)])
+def test_level_for_pixels(nb_of_frames: int, pixel_width: int, level: int):
+    values, temporal_set = get_data()
+    pyramid = MinMaxPyramid(values, temporal_set)
+
+    assert pyramid.get_level_for(2, 2 + nb_of_frames, pixel_width) == level
+
+    #   The level gives between one and two groups per pixel when there are enough samples
+    if nb_of_frames >= max(1, pixel_width):
+        assert pixel_width <= nb_of_frames >> level < 2 * max(1, pixel_width)
+
+
+def test_level_for_is_bounded_by_max_level():
+    values, temporal_set = get_data(100)
+
+    assert MinMaxPyramid(values, temporal_set).get_level_for(0, 1 << 20, 1) == 7
+
+
+def test_summary_reaches_both_ends_of_the_range():
+    values, temporal_set = get_data()
+    pyramid = MinMaxPyramid(values, temporal_set)
+
+    times, minimum, maximum, mean = pyramid.get_summary(1.0005, 3.0005, 500)
+
+    #   Frames just before and after the range are included
+    assert times[0] <= 1.0005 and times[-1] >= 2.9
+    assert 500 <= len(times) < 1000
+    assert np.all(minimum <= mean) and np.all(mean <= maximum)
+
+    #   A range out of the data still gives a frame
+    assert len(pyramid.get_summary(10, 20, 100)[0]) == 1
+
+
+@pytest.mark.parametrize("level, first_frame, end_frame", [(0, 5, 5), (0, -1, 10), (0, 0, NB_OF_SAMPLES + 1),
+                                                           (-1, 0, 10), (14, 0, 10)])
+def test_invalid_queries(level: int, first_frame: int, end_frame: int):
+    values, temporal_set = get_data()
+
+    with pytest.raises(Exception):
+        MinMaxPyramid(values, temporal_set).get_level(level, first_frame, end_frame)
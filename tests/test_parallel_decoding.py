@@ -0,0 +1,115 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining tests of the decoding of CSV bodies split into byte ranges decoded by a pool of processes
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import csv
+
+import numpy as np
+import pytest
+
+from import_module import decode_numerical_body_parallel, split_at_newlines, stream_numerical_body
+from import_progress import ImportCancelled, ImportProgress
+
+CSV_DIALECT = {"delimiter": ";"}
+NB_OF_COLUMNS = 4
+NB_OF_ROWS = 30000
+
+
+#   Will write a CSV file whose second column uses a decimal comma, with "--" separator rows
+#   Return the path of the file and the byte where its body starts
+def write_csv_file(directory, nb_of_rows: int = NB_OF_ROWS) -> (str, int):
+    rng = np.random.default_rng(0)
+    header = "time;a;b;c\n"
+    rows = []
+
+    for i in range(nb_of_rows):
+        if i % 997 == 500:
+            rows.append("--;;;\n")
+
+        rows.append("{:d};{:s};{:.3f};{:d}\n".format(i * 10, "{:.2f}".format(rng.random() * 100).replace(".", ","),
+                                                    rng.random() * 4095, int(rng.integers(0, 4096))))
+
+    file_path = str(directory / "body.csv")
+
+    with open(file_path, 'w', newline='') as file:
+        file.write(header + "".join(rows))
+
+    return file_path, len(header)
+
+
+#   Will decode the body of a CSV file in a single pass, as imports without any worker process do
+def decode_serially(file_path: str, **kwargs) -> np.ndarray:
+    with open(file_path, 'r', newline='', encoding="ISO-8859-1") as file:
+        file.readline()
+        nb_of_columns = len(kwargs["column_indices"]) if kwargs.get("column_indices") else NB_OF_COLUMNS
+
+        return stream_numerical_body(csv.reader(file, **CSV_DIALECT), nb_of_columns, **kwargs)
+
+
+@pytest.mark.parametrize("nb_of_ranges", [1, 2, 7, 64])
+def test_ranges_end_on_newlines(tmp_path, nb_of_ranges: int):
+    file_path, body_start = write_csv_file(tmp_path, 2000)
+
+    with open(file_path, 'rb') as file:
+        content = file.read()
+
+    byte_ranges = split_at_newlines(file_path, body_start, len(content), nb_of_ranges)
+
+    assert 1 <= len(byte_ranges) <= nb_of_ranges
+    assert byte_ranges[0][0] == body_start and byte_ranges[-1][1] == len(content)
+
+    for (start, end), (next_start, _) in zip(byte_ranges, byte_ranges[1:]):
+        assert start < end == next_start
+        assert content[end - 1:end] == b"\n"
+
+
+def test_more_ranges_than_rows(tmp_path):
+    file_path, body_start = write_csv_file(tmp_path, 3)
+    byte_ranges = split_at_newlines(file_path, body_start, len(open(file_path, 'rb').read()), 16)
+
+    assert len(byte_ranges) <= 3
+    assert all(start < end for start, end in byte_ranges)
+
+
+@pytest.mark.parametrize("selection", [{},
+                                       {"column_indices": [0, 1, 3]},
+                                       {"time_window": (12345, 250000)}])
+def test_parallel_decoding_equals_serial_decoding(tmp_path, selection: dict):
+    file_path, body_start = write_csv_file(tmp_path)
+    nb_of_columns = len(selection["column_indices"]) if "column_indices" in selection else NB_OF_COLUMNS
+
+    parallel_body = decode_numerical_body_parallel(file_path, body_start, nb_of_columns, CSV_DIALECT, 3, **selection)
+    serial_body = decode_serially(file_path, **selection)
+
+    assert parallel_body.shape == serial_body.shape
+    assert np.array_equal(parallel_body, serial_body)
+
+    #   Decimal commas are decoded in every range, even the ones far from the start of the file
+    last_range = parallel_body[1, -parallel_body.shape[1] // 3:]
+    assert np.any(last_range != np.trunc(last_range))
+
+
+def test_parallel_decoding_reports_invalid_cells(tmp_path):
+    file_path, body_start = write_csv_file(tmp_path)
+
+    with open(file_path, 'a') as file:
+        file.write("300000;1,5;abc;4\n")
+
+    with pytest.raises(Exception, match="non numerical value found for the sensor 1"):
+        decode_numerical_body_parallel(file_path, body_start, NB_OF_COLUMNS, CSV_DIALECT, 2)
+
+
+def test_cancelled_parallel_decoding(tmp_path):
+    file_path, body_start = write_csv_file(tmp_path)
+    progress = ImportProgress()
+    progress.cancel()
+
+    with pytest.raises(ImportCancelled):
+        decode_numerical_body_parallel(file_path, body_start, NB_OF_COLUMNS, CSV_DIALECT, 2, progress=progress)
@@ -0,0 +1,132 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining tests of the resampling of imported data, given block by block while it is parsed
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+
+from import_module import CsvFollower
+from resampling import ResamplingMethod, ResamplingSettings
+
+SETTINGS = [ResamplingSettings(method, **setting) for method in ResamplingMethod
+            for setting in [{"decimation_factor": 1}, {"decimation_factor": 7}, {"target_rate": 30}]]
+
+
+#   Will give numerical columns (temporal column first) sampled at about 1 kHz with some jitter and a gap
+def get_columns(nb_of_samples: int = 5000, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+
+    temporal_set = np.cumsum(rng.uniform(0.0009, 0.0011, nb_of_samples))
+    temporal_set[nb_of_samples // 2:] += 0.5
+
+    return np.vstack((temporal_set, rng.random((3, nb_of_samples)) * 100))
+
+
+#   Will resample columns given in blocks of the given sizes (the last block gets the remaining samples)
+def resample_by_blocks(settings: ResamplingSettings, columns: np.ndarray, block_sizes: [int]) -> np.ndarray:
+    resampler = settings.create_resampler()
+    bounds = np.cumsum([0] + block_sizes + [columns.shape[1]])
+    bounds = np.minimum(bounds, columns.shape[1])
+
+    blocks = [resampler.feed(columns[:, start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+
+    return np.concatenate(blocks + [resampler.flush()], axis=1)
+
+
+@pytest.mark.parametrize("settings", SETTINGS, ids=[settings.get_key() for settings in SETTINGS])
+def test_blocks_give_the_same_samples(settings: ResamplingSettings):
+    columns = get_columns()
+    reference = resample_by_blocks(settings, columns, [])
+
+    #   Groups are continued from one block to another, whatever the size of blocks (even empty or single samples)
+    for block_sizes in [[1] * 300, [7, 0, 13, 256, 1000], [2499, 2]]:
+        assert np.allclose(resample_by_blocks(settings, columns, block_sizes), reference, rtol=0, atol=1e-9)
+
+
+def test_decimation_groups_consecutive_samples():
+    columns = get_columns(1003)
+
+    mean = resample_by_blocks(ResamplingSettings(ResamplingMethod.mean, decimation_factor=10), columns, [333])
+    maximum = resample_by_blocks(ResamplingSettings(ResamplingMethod.max, decimation_factor=10), columns, [333])
+
+    #   The last incomplete group is given by flush()
+    assert mean.shape == (4, 101)
+    assert np.array_equal(mean[0], columns[0, ::10])
+    assert np.allclose(mean[1:, :100], columns[1:, :1000].reshape(3, 100, 10).mean(axis=2))
+    assert np.allclose(mean[1:, 100], columns[1:, 1000:].mean(axis=1))
+    assert np.array_equal(maximum[1:, :100], columns[1:, :1000].reshape(3, 100, 10).max(axis=2))
+
+
+def test_target_rate_groups_time_slots():
+    columns = get_columns()
+    resampled = resample_by_blocks(ResamplingSettings(ResamplingMethod.mean, target_rate=100), columns, [1234])
+
+    #   Samples are dated at the start of their time slot, empty slots (the gap) give nothing
+    slots = np.round((resampled[0] - columns[0, 0]) * 100, 6)
+    assert np.array_equal(slots, np.trunc(slots))
+    assert np.all(np.diff(slots) >= 1)
+    assert np.any(np.diff(slots) > 40)
+
+    first_slot = columns[0] < columns[0, 0] + 0.01
+    assert np.allclose(resampled[1:, 0], columns[1:, first_slot].mean(axis=1))
+
+
+def test_anti_aliasing_filter():
+    temporal_set = np.arange(4000) * 0.001
+    constant = np.full(4000, 42.0)
+    #   Well above the Nyquist frequency of the target rate
+    aliased = np.sin(2 * np.pi * 400 * temporal_set)
+
+    resampled = resample_by_blocks(ResamplingSettings(ResamplingMethod.anti_aliased, decimation_factor=20),
+                                   np.vstack((temporal_set, constant, aliased)), [100, 900])
+
+    assert resampled.shape == (3, 200)
+    assert np.allclose(resampled[1], 42)
+    assert np.abs(resampled[2, 10:-10]).max() < 0.05
+
+
+def test_follower_keeps_groups_between_reads(tmp_path):
+    columns = get_columns(500)
+    rows = ["{:.6f};{:.3f};{:.3f};{:.3f}\n".format(*column) for column in columns.T.tolist()]
+    settings = ResamplingSettings(ResamplingMethod.mean, decimation_factor=8)
+
+    file_path = tmp_path / "rows.csv"
+    file_path.write_text("".join(rows[:101]))
+
+    with open(file_path, 'rb') as file:
+        follower = CsvFollower(file, {"delimiter": ";"}, 4, resampler=settings.create_resampler())
+        first_read = follower.read_new_rows()
+
+        with open(file_path, 'a') as writer:
+            writer.write("".join(rows[101:]))
+
+        second_read = follower.read_new_rows()
+
+    decoded = np.array([[float(cell) for cell in row.split(";")] for row in rows]).T
+    reference = settings.create_resampler().feed(decoded)
+
+    assert first_read.shape[1] == 12
+    assert np.allclose(np.concatenate((first_read, second_read), axis=1), reference, rtol=0, atol=1e-9)
+
+
+def test_invalid_settings():
+    with pytest.raises(Exception):
+        ResamplingSettings(ResamplingMethod.mean)
+
+    with pytest.raises(Exception):
+        ResamplingSettings(ResamplingMethod.mean, target_rate=10, decimation_factor=2)
+
+    with pytest.raises(Exception):
+        ResamplingSettings(ResamplingMethod.max, decimation_factor=0)
+
+    with pytest.raises(Exception):
+        ResamplingSettings(ResamplingMethod.max, target_rate=-1)
+
+    assert len({settings.get_key() for settings in SETTINGS}) == len(SETTINGS)
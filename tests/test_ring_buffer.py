@@ -0,0 +1,223 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining tests of ring buffers and of datasets retaining only their last frames
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+
+from dataset import DataSet
+from ring_buffer import RingBuffer
+from ring_buffer_dataset import RING_FRAME_BYTES, RingBufferDataSet, get_capacity_for_memory
+
+SENSORS_NAME = ["S0", "S1", "S2"]
+SENSORS_POSITIONS = [[10, 50], [60, 110], [110, 170]]
+SENSORS_CHARACTERISTICS = [[20, 30, 0]] * 3
+
+
+#   Will give frames sampled every 10 ms from the given one, values of a frame are (number of sensors, number of frames)
+def get_frames(first_frame: int, end_frame: int, scale: float = 100) -> (np.ndarray, np.ndarray):
+    rng = np.random.default_rng(first_frame)
+
+    return np.arange(first_frame, end_frame) * 0.01, rng.random((len(SENSORS_NAME), end_frame - first_frame)) * scale
+
+
+#   Will build a ring buffer dataset from the given frames
+def build_ring_dataset(capacity: int, temporal_set: np.ndarray, sensors_data: np.ndarray) -> RingBufferDataSet:
+    return RingBufferDataSet(capacity, temporal_set, SENSORS_NAME, SENSORS_POSITIONS, SENSORS_CHARACTERISTICS,
+                             sensors_data, 300, 600)
+
+
+#   Will check a ring buffer dataset against a dataset built from every frame counted in its running bounds (frames
+#   dropped at the creation or in a block longer than the capacity are not): retained frames are the last ones,
+#   normalized with the bounds of every counted frame
+def check_retained_frames(dataset: RingBufferDataSet, temporal_set: np.ndarray, sensors_data: np.ndarray) -> None:
+    reference = DataSet(temporal_set, SENSORS_NAME, SENSORS_POSITIONS, SENSORS_CHARACTERISTICS, sensors_data, 300, 600)
+    nb_of_frames = len(dataset.get_temporal_set())
+
+    assert nb_of_frames == min(dataset.get_capacity(), len(temporal_set))
+
+    assert np.array_equal(dataset.get_temporal_set(), temporal_set[-nb_of_frames:])
+    assert np.array_equal(dataset.get_sensors_values_matrix(), sensors_data[:, -nb_of_frames:].T)
+    assert np.allclose(dataset.get_sensors_normalized_values_matrix(),
+                       reference.get_sensors_normalized_values_matrix()[-nb_of_frames:], rtol=0, atol=1e-12)
+    assert np.allclose(dataset.get_c_o_m_positions(), reference.get_c_o_m_positions()[-nb_of_frames:], rtol=0,
+                       atol=1e-9)
+
+    for i, sensor in enumerate(dataset.get_sensor_set()):
+        assert np.array_equal(sensor.get_data(), sensors_data[i, -nb_of_frames:])
+
+
+def test_ring_buffer_wraparound():
+    ring = RingBuffer(2, 5)
+    rows = np.arange(40, dtype=float).reshape(20, 2)
+
+    assert ring.append(rows[:3]) == 0
+    assert np.array_equal(ring.get_rows(), rows[:3])
+
+    #   The oldest rows are dropped once the capacity is reached, retained rows stay contiguous
+    assert ring.append(rows[3:7]) == 2
+    assert len(ring) == 5 and np.array_equal(ring.get_rows(), rows[2:7])
+
+    for end in range(8, 20):
+        assert ring.append(rows[end - 1:end]) == 1
+        assert np.array_equal(ring.get_rows(), rows[end - 5:end])
+        assert np.array_equal(ring.get_columns(), rows[end - 5:end].T)
+
+    assert ring.append(rows[:0]) == 0
+    assert np.array_equal(ring.get_rows(), rows[14:19])
+
+
+def test_ring_buffer_block_longer_than_capacity():
+    ring = RingBuffer(1, 4)
+    ring.append(np.arange(3.0)[:, np.newaxis])
+
+    #   Only the last rows of the block are retained, every older row is dropped
+    assert ring.append(np.arange(10.0, 20.0)[:, np.newaxis]) == 9
+    assert np.array_equal(ring.get_columns()[0], [16, 17, 18, 19])
+
+    assert ring.append(np.array([[20.0]])) == 1
+    assert np.array_equal(ring.get_columns()[0], [17, 18, 19, 20])
+
+
+def test_ring_buffer_overwrite():
+    ring = RingBuffer(1, 3, dtype=bool)
+    ring.append(np.array([[True], [False], [True], [True]]))
+    ring.overwrite(np.array([[False], [True], [False]]))
+
+    assert ring.get_columns()[0].tolist() == [False, True, False]
+
+    with pytest.raises(Exception):
+        ring.overwrite(np.array([[True]]))
+
+
+@pytest.mark.parametrize("nb_of_columns, capacity", [(0, 5), (2, 0)])
+def test_invalid_ring_buffers(nb_of_columns: int, capacity: int):
+    with pytest.raises(Exception):
+        RingBuffer(nb_of_columns, capacity)
+
+
+@pytest.mark.parametrize("nb_of_frames", [1, 50, 100, 250])
+def test_retained_frames_at_creation(nb_of_frames: int):
+    temporal_set, sensors_data = get_frames(0, nb_of_frames)
+    dataset = build_ring_dataset(100, temporal_set, sensors_data)
+
+    #   Frames dropped at the creation don't count in the bounds of the dataset
+    retained = slice(max(0, nb_of_frames - 100), nb_of_frames)
+    check_retained_frames(dataset, temporal_set[retained], sensors_data[:, retained])
+
+    assert dataset.get_nb_of_dropped_frames() == retained.start
+
+
+def test_appended_frames_drop_the_oldest_ones():
+    temporal_set, sensors_data = get_frames(0, 60)
+    dataset = build_ring_dataset(100, temporal_set, sensors_data)
+
+    #   Blocks fill the capacity, wrap around it and are longer than it
+    for first_frame, end_frame in [(60, 99), (99, 100), (100, 101), (101, 170), (170, 420), (420, 421)]:
+        new_temporal_set, new_sensors_data = get_frames(first_frame, end_frame)
+        dataset.append_frames(new_temporal_set, new_sensors_data)
+
+        #   Frames of a block which would be dropped at once are ignored
+        temporal_set = np.concatenate((temporal_set, new_temporal_set[-100:]))
+        sensors_data = np.concatenate((sensors_data, new_sensors_data[:, -100:]), axis=1)
+
+        check_retained_frames(dataset, temporal_set, sensors_data)
+        assert dataset.get_nb_of_dropped_frames() == max(0, end_frame - 100)
+
+    assert dataset.get_nb_of_dropped_frames() == 321
+
+
+def test_appended_frames_out_of_bounds_modify_frames():
+    temporal_set, sensors_data = get_frames(0, 150)
+    dataset = build_ring_dataset(100, temporal_set, sensors_data)
+    temporal_set, sensors_data = temporal_set[50:], sensors_data[:, 50:]
+
+    new_temporal_set, new_sensors_data = get_frames(150, 160)
+    assert not dataset.append_frames(new_temporal_set, new_sensors_data)
+
+    #   Running bounds never shrink, even when the frame holding them is dropped
+    peak_temporal_set, peak_sensors_data = get_frames(160, 161, 1000)
+    assert dataset.append_frames(peak_temporal_set, peak_sensors_data)
+
+    after_temporal_set, after_sensors_data = get_frames(161, 250)
+    assert not dataset.append_frames(after_temporal_set, after_sensors_data)
+    assert dataset.get_sensor_set_max() == peak_sensors_data.max()
+
+    temporal_set = np.concatenate((temporal_set, new_temporal_set, peak_temporal_set, after_temporal_set))
+    sensors_data = np.concatenate((sensors_data, new_sensors_data, peak_sensors_data, after_sensors_data), axis=1)
+    check_retained_frames(dataset, temporal_set, sensors_data)
+
+
+def test_appended_frames_must_be_consistent():
+    temporal_set, sensors_data = get_frames(0, 50)
+    dataset = build_ring_dataset(20, temporal_set, sensors_data)
+
+    with pytest.raises(Exception, match="not chronological"):
+        dataset.append_frames([0.1], [[1], [1], [1]])
+
+    with pytest.raises(Exception, match="not chronological"):
+        dataset.append_frames([0.6, 0.55], [[1, 1], [1, 1], [1, 1]])
+
+    with pytest.raises(Exception, match="number of sensors"):
+        dataset.append_frames([0.6], [[1], [1]])
+
+    assert not dataset.append_frames([], [[], [], []])
+    assert len(dataset.get_temporal_set()) == 20
+
+    with pytest.raises(Exception):
+        build_ring_dataset(0, temporal_set, sensors_data)
+
+
+def test_full_arrays_are_not_kept():
+    temporal_set, sensors_data = get_frames(0, 10000)
+    dataset = build_ring_dataset(100, temporal_set, sensors_data)
+
+    #   Rings hold every retained frame twice, no array of the dataset holds the dropped frames
+    for value in vars(dataset).values():
+        if isinstance(value, np.ndarray):
+            assert len(value) <= 200
+
+    for sensor in dataset.get_sensor_set():
+        assert len(sensor.get_data()) == 100
+        assert not np.shares_memory(sensor.get_data(), sensors_data)
+
+
+def test_normalized_values_are_read_from_the_dataset():
+    temporal_set, sensors_data = get_frames(0, 50)
+    dataset = build_ring_dataset(20, temporal_set, sensors_data)
+    sensor = dataset.get_sensor_set()[1]
+
+    with pytest.raises(Exception, match="must be read from its dataset"):
+        sensor.get_data_normalized()
+
+    with pytest.raises(Exception, match="must be read from its dataset"):
+        sensor.get_data_point_normalized(0)
+
+    assert np.array_equal(dataset.get_sensors_normalized_values()[1],
+                          dataset.get_sensors_normalized_values_matrix()[:, 1])
+
+
+def test_statistics_follow_appended_frames():
+    temporal_set, sensors_data = get_frames(0, 150)
+    dataset = build_ring_dataset(100, temporal_set, sensors_data)
+    assert np.allclose(dataset.get_statistics().get_mean(0, 100), sensors_data[:, 50:].mean(axis=1))
+
+    dataset.append_frames(*get_frames(150, 170))
+    values = dataset.get_sensors_values_matrix()
+
+    assert np.allclose(dataset.get_statistics().get_mean(0, 100), values.mean(axis=0))
+    assert np.array_equal(dataset.get_min_max_pyramid().get_level(0, 0, 100)[1], values)
+
+
+@pytest.mark.parametrize("memory_limit, nb_of_sensors, capacity", [(0, 3, 1), (RING_FRAME_BYTES + 48, 3, 1),
+                                                                   (100 * (RING_FRAME_BYTES + 48) - 1, 3, 99),
+                                                                   (100 * (RING_FRAME_BYTES + 1600), 100, 100)])
+def test_capacity_for_memory(memory_limit: int, nb_of_sensors: int, capacity: int):
+    assert get_capacity_for_memory(memory_limit, nb_of_sensors) == capacity
@@ -0,0 +1,162 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining tests of the precision of sensors values stored with each storage type
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+import numpy as np
+import pytest
+
+from dataset import DataSet
+from sensors_storage import DecodedValues, StorageType
+
+NB_OF_SENSORS = 6
+NB_OF_FRAMES = 20000
+
+
+#   Will build a dataset of 12-bit ADC like values (with frames without any load) with the given storage type
+def build_dataset(storage_type: StorageType, seed: int = 0) -> (DataSet, np.ndarray, np.ndarray):
+    rng = np.random.default_rng(seed)
+
+    temporal_set = np.arange(NB_OF_FRAMES) * 0.01
+    sensors_data = rng.random((NB_OF_SENSORS, NB_OF_FRAMES)) * 4095 * rng.random((NB_OF_SENSORS, 1))
+    sensors_data[:, 100:120] = 0
+    sensors_data[2] = 7
+
+    positions = rng.integers(0, 200, (NB_OF_SENSORS, 2))
+    characteristics = [[10, 20, int(angle)] for angle in rng.integers(-20, 20, NB_OF_SENSORS)]
+    names = ["s{:d}".format(i) for i in range(NB_OF_SENSORS)]
+
+    return DataSet(temporal_set, names, positions, characteristics, sensors_data, 300, 300,
+                   storage_type=storage_type), temporal_set, sensors_data
+
+
+#   Get the largest decoding error of each sensor allowed by the storage of the dataset
+def get_max_error(dataset: DataSet) -> np.ndarray:
+    return dataset.get_storage().get_max_error(np.array(dataset.get_sensors_min()), np.array(dataset.get_sensors_max()))
+
+
+def assert_c_o_m_close(dataset: DataSet, reference: DataSet, tolerance: float) -> None:
+    positions = dataset.get_c_o_m_positions()
+    reference_positions = reference.get_c_o_m_positions()
+
+    assert np.array_equal(dataset.get_c_o_m_zero_load_mask(), reference.get_c_o_m_zero_load_mask())
+    assert np.array_equal(np.isnan(positions), np.isnan(reference_positions))
+    assert np.nanmax(np.abs(positions - reference_positions)) <= tolerance
+
+
+@pytest.mark.parametrize("storage_type, bytes_per_value", [(StorageType.float64, 8),
+                                                           (StorageType.float32, 4),
+                                                           (StorageType.int16, 2)])
+def test_memory_of_stored_values(storage_type: StorageType, bytes_per_value: int):
+    dataset = build_dataset(storage_type)[0]
+    stored_values = dataset.get_stored_values_matrix()
+
+    assert stored_values.dtype == dataset.get_storage().get_dtype()
+    assert stored_values.nbytes == NB_OF_FRAMES * NB_OF_SENSORS * bytes_per_value
+
+    #   Normalized values are only stored with full precision
+    if storage_type != StorageType.float64:
+        assert not np.shares_memory(dataset.get_sensors_normalized_values_matrix(), stored_values)
+
+
+@pytest.mark.parametrize("storage_type", list(StorageType))
+def test_decoding_error_is_bounded(storage_type: StorageType):
+    dataset = build_dataset(storage_type)[0]
+    reference = build_dataset(StorageType.float64)[0]
+
+    error = np.abs(dataset.get_sensors_values_matrix() - reference.get_sensors_values_matrix()).max(axis=0)
+    assert np.all(error <= get_max_error(dataset) * (1 + 1e-9))
+
+    #   Minimums are exact, so bounds and normalization are the same as with full precision
+    assert dataset.get_sensors_min() == reference.get_sensors_min()
+    assert dataset.get_sensors_max_normalized() == reference.get_sensors_max_normalized()
+
+    assert np.allclose(dataset.get_sensors_values_at(10), reference.get_sensors_values_at(10),
+                       rtol=0, atol=get_max_error(dataset).max())
+    assert np.allclose(dataset.get_sensors_normalized_values_matrix(), reference.get_sensors_normalized_values_matrix(),
+                       rtol=0, atol=get_max_error(dataset).max() / (reference.get_sensor_set_max() + 1e-300))
+
+    assert_c_o_m_close(dataset, reference, 0.01)
+
+
+@pytest.mark.parametrize("storage_type", list(StorageType))
+def test_statistics_and_pyramid_are_decoded(storage_type: StorageType):
+    dataset = build_dataset(storage_type)[0]
+    reference = build_dataset(StorageType.float64)[0]
+    tolerance = get_max_error(dataset).max()
+
+    if storage_type != StorageType.float64:
+        assert isinstance(dataset.get_storage().get_decoded_values(dataset.get_stored_values_matrix()),
+                          DecodedValues)
+
+    statistics = dataset.get_statistics()
+    reference_statistics = reference.get_statistics()
+
+    for start, end in [(0, NB_OF_FRAMES), (5, 777), (4000, 15001)]:
+        assert np.allclose(statistics.get_min(start, end), reference_statistics.get_min(start, end),
+                           rtol=0, atol=tolerance)
+        assert np.allclose(statistics.get_max(start, end), reference_statistics.get_max(start, end),
+                           rtol=0, atol=tolerance)
+        assert np.allclose(statistics.get_mean(start, end), reference_statistics.get_mean(start, end),
+                           rtol=0, atol=tolerance)
+
+    pyramid = dataset.get_min_max_pyramid()
+    reference_pyramid = reference.get_min_max_pyramid()
+
+    for level in range(pyramid.get_max_level() + 1):
+        for summary, reference_summary in zip(pyramid.get_level(level, 3, NB_OF_FRAMES - 2)[1:],
+                                              reference_pyramid.get_level(level, 3, NB_OF_FRAMES - 2)[1:]):
+            assert np.allclose(summary, reference_summary, rtol=0, atol=tolerance)
+
+
+@pytest.mark.parametrize("storage_type", list(StorageType))
+def test_appended_frames_out_of_range(storage_type: StorageType):
+    dataset, temporal_set, _ = build_dataset(storage_type)
+    reference = build_dataset(StorageType.float64)[0]
+    rng = np.random.default_rng(1)
+
+    previous_error = get_max_error(dataset)
+    statistics = dataset.get_statistics()
+    pyramid = dataset.get_min_max_pyramid()
+
+    #   The first block fits in the ranges of sensors, the second one makes them encoded again with wider ranges
+    for i, maximum in enumerate([np.array(dataset.get_sensors_max())[:, np.newaxis], 3 * 4095]):
+        new_temporal_set = temporal_set[-1] + 10 * i + 0.01 * (1 + np.arange(1000))
+        new_sensors_data = rng.random((NB_OF_SENSORS, 1000)) * maximum
+
+        dataset.append_frames(new_temporal_set, new_sensors_data)
+        reference.append_frames(new_temporal_set, new_sensors_data)
+
+        #   Views share the buffer of appended frames
+        if i == 0:
+            view = dataset.window(10, 50)
+            reference_view = reference.window(10, 50)
+
+    assert dataset.get_stored_values_matrix().dtype == dataset.get_storage().get_dtype()
+    assert np.array_equal(dataset.get_temporal_set(), reference.get_temporal_set())
+    assert dataset.get_sensors_max() == reference.get_sensors_max()
+
+    #   Errors of both encodings add up
+    tolerance = previous_error + get_max_error(dataset)
+    error = np.abs(dataset.get_sensors_values_matrix() - reference.get_sensors_values_matrix()).max(axis=0)
+    assert np.all(error <= tolerance * (1 + 1e-9))
+
+    nb_of_frames = len(reference.get_temporal_set())
+    assert np.allclose(statistics.get_max(0, nb_of_frames), reference.get_statistics().get_max(0, nb_of_frames),
+                       rtol=0, atol=tolerance.max())
+    assert np.allclose(pyramid.get_level(pyramid.get_max_level(), 0, nb_of_frames)[3],
+                       reference.get_min_max_pyramid().get_level(pyramid.get_max_level(), 0, nb_of_frames)[3],
+                       rtol=0, atol=tolerance.max())
+
+    assert_c_o_m_close(dataset, reference, 0.05)
+
+    #   Views taken before frames are encoded again keep decoding their own frames
+    assert np.allclose(view.get_sensors_values_matrix(), reference_view.get_sensors_values_matrix(),
+                       rtol=0, atol=previous_error.max())
+    assert_c_o_m_close(view, reference_view, 0.05)
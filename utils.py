@@ -9,15 +9,18 @@
 ------------------------------------------------------------------------------------------------------------------------
 """
 #   Import of basic modules
-import math
+import gzip
+import io
+import lzma
+import os
 import re as regexp
-from tkinter import Scale, Button, OptionMenu, Entry, Menu
-from tkinter.constants import DISABLED, NORMAL
-from tkinter.ttk import Widget
+import struct
+import zipfile
+
+import numpy as np
 
 #   Import of custom modules
 from svg.path import Path, Line, Arc, CubicBezier, QuadraticBezier, Move, Close
-from position import Position
 
 """
 
@@ -27,29 +30,136 @@ from position import Position
 
 """
 
+#   Regular expressions used to check and extract single values, compiled only once
+__INT_VALUE_REGEXP = regexp.compile("^-?[0-9]+$")
+__NUMERICAL_VALUE_REGEXP = regexp.compile("^-?[0-9]+((.|,)[0-9]+)?$")
+__NUMERICAL_VALUE_SEARCH_REGEXP = regexp.compile("-?[0-9]+((.|,)[0-9]+)?")
+__POSITIVE_NUMERICAL_VALUE_SEARCH_REGEXP = regexp.compile("[0-9]+((.|,)[0-9]+)?")
+
+#   Character codes used by the bulk decoder of numerical values
+__CODE_ZERO = ord('0')
+__CODE_NINE = ord('9')
+__CODE_MINUS = ord('-')
+__CODE_POINT = ord('.')
+__CODE_COMMA = ord(',')
+
+#   Magic bytes starting compressed files, associated with the name of their compression
+__COMPRESSION_MAGIC_BYTES = [(b"\x1f\x8b", "gzip"),
+                             (b"\xfd7zXZ\x00", "xz"),
+                             (b"PK\x03\x04", "zip")]
+
+
+#   Will detect the compression of a file from its first bytes
+#   Return "gzip", "xz", "zip" or None if the file isn't compressed
+def get_compression(file_path: str) -> str | None:
+    with open(file_path, 'rb') as file:
+        first_bytes = file.read(8)
+
+    for magic_bytes, compression in __COMPRESSION_MAGIC_BYTES:
+        if first_bytes.startswith(magic_bytes):
+            return compression
+
+    return None
+
+
+#   Will find the member of a zip archive whose name ends with the given extension (e.g. ".csv")
+#   Raise an exception if there isn't exactly one such member
+def get_zip_member(archive: zipfile.ZipFile, extension: str) -> zipfile.ZipInfo:
+    members = [member for member in archive.infolist()
+               if not member.is_dir() and member.filename.lower().endswith(extension)]
+
+    if len(members) != 1:
+        raise Exception("Archive must contain exactly one {:s} file, {:d} found !".format(extension, len(members)))
+
+    return members[0]
+
+
+#   In order to know if a file is a zip archive containing a file with the given extension (e.g. ".svg")
+def zip_contains(file_path: str, extension: str) -> bool:
+    if get_compression(file_path) != "zip":
+        return False
+
+    with zipfile.ZipFile(file_path) as archive:
+        return any(not member.is_dir() and member.filename.lower().endswith(extension)
+                   for member in archive.infolist())
+
+
+#   In order to get a binary file, compressed files (gzip, xz, zip) are decompressed while they are read
+#   For a zip archive, its only member with the given extension is read
+def get_binary_file(file_path: str, extension: str = ".csv"):
+    compression = get_compression(file_path)
+
+    if compression == "gzip":
+        return gzip.open(file_path, 'rb')
+
+    if compression == "xz":
+        return lzma.open(file_path, 'rb')
 
-#   In order to get a file
-def get_file(file_path: str, encoding: str = "ISO-8859-1"):
-    return open(file_path, newline='', encoding=encoding)
+    if compression == "zip":
+        archive = zipfile.ZipFile(file_path)
+
+        #   The member keeps the archive file open until it is closed
+        try:
+            return archive.open(get_zip_member(archive, extension))
+        finally:
+            archive.close()
+
+    return open(file_path, 'rb')
+
+
+#   In order to get a file, compressed files (gzip, xz, zip) are decompressed while they are read
+#   For a zip archive, its only member with the given extension is read
+def get_file(file_path: str, encoding: str = "ISO-8859-1", extension: str = ".csv"):
+    if get_compression(file_path) is None:
+        return open(file_path, newline='', encoding=encoding)
+
+    return io.TextIOWrapper(get_binary_file(file_path, extension), encoding=encoding, newline='')
+
+
+#   Get the size of the content of a file (decompressed size for gzip and zip files)
+#   The size of xz files content cannot be known without reading them, their compressed size is given instead
+def get_file_size(file_path: str, extension: str = ".csv") -> int:
+    compression = get_compression(file_path)
+
+    if compression == "zip":
+        with zipfile.ZipFile(file_path) as archive:
+            return get_zip_member(archive, extension).file_size
+
+    if compression == "gzip":
+        #   The last 4 bytes of a gzip file hold its decompressed size (modulo 2^32)
+        with open(file_path, 'rb') as file:
+            file.seek(-4, os.SEEK_END)
+            return struct.unpack("<I", file.read(4))[0]
+
+    return os.path.getsize(file_path)
+
+
+#   Get the physical memory available (in bytes), None if it cannot be known on this system
+def get_available_memory() -> int | None:
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+
+    except (AttributeError, ValueError, OSError):
+        return None
 
 
 #   Used to detect difference between a simple string and a string containing an int value
 def is_a_int_value(value: str) -> bool:
     #   Check the string with some regex
-    return regexp.match("^-?[0-9]+$", value) is not None
+    return __INT_VALUE_REGEXP.match(value) is not None
 
 
 #   Used to detect difference between a simple string and a string containing a float or int value
 def is_a_numerical_value(value: str) -> bool:
     #   Check the string with some regex
-    return regexp.match("^-?[0-9]+((.|,)[0-9]+)?$", value) is not None
+    return __NUMERICAL_VALUE_REGEXP.match(value) is not None
 
 
 #   Used to extract float or int value
 #   Will return None if no value was found
 def extract_numerical_value(value: str) -> float | int | None:
     #   Extract value from string
-    regexp_extracted = regexp.search("-?[0-9]+((.|,)[0-9]+)?", value)
+    regexp_extracted = __NUMERICAL_VALUE_SEARCH_REGEXP.search(value)
 
     #   Check if the regexp found something else we quit
     if regexp_extracted is None:
@@ -72,7 +182,7 @@ def extract_numerical_value(value: str) -> float | int | None:
 #   Will return None if no value was found
 def extract_positive_numerical_value(value: str) -> float | int | None:
     #   Extract value from string
-    regexp_extracted = regexp.search("[0-9]+((.|,)[0-9]+)?", value)
+    regexp_extracted = __POSITIVE_NUMERICAL_VALUE_SEARCH_REGEXP.search(value)
 
     #   Check if the regexp found something else we quit
     if regexp_extracted is None:
@@ -91,6 +201,110 @@ def extract_positive_numerical_value(value: str) -> float | int | None:
     return float(resulted_str)
 
 
+#   Used to view an array of strings or bytes as an array of character codes, one more axis holding the characters
+#   Strings shorter than the others are padded with null codes
+def __get_character_codes(cells: np.ndarray) -> np.ndarray:
+    code_type = np.dtype(np.uint8) if cells.dtype.kind == 'S' else np.dtype(np.uint32)
+    width = cells.dtype.itemsize // code_type.itemsize
+
+    return np.ascontiguousarray(cells).view(code_type).reshape(cells.shape + (width,))
+
+
+#   Used to detect the decimal separator (',' or '.') of numerical values given as an array of strings or bytes
+#   Will return None if no separator was found at all
+def detect_decimal_separator(cells: np.ndarray) -> str | None:
+    codes = __get_character_codes(np.asarray(cells))
+
+    has_comma = bool((codes == __CODE_COMMA).any())
+    has_point = bool((codes == __CODE_POINT).any())
+
+    if has_comma and not has_point:
+        return ','
+
+    if has_point or has_comma:
+        return '.'
+
+    return None
+
+
+#   Used to detect the decimal separator (',' or '.') of each column of numerical values given as a (number of rows,
+#   number of columns) array of strings or bytes, the same way as detect_decimal_separator() does for all of them
+#   (e.g. a ';' delimited file may have a temporal column with points and sensors columns with commas)
+#   Will return one separator per column, None for columns without any separator
+def detect_decimal_separators(cells: np.ndarray) -> [str | None]:
+    codes = __get_character_codes(np.asarray(cells))
+
+    has_comma = (codes == __CODE_COMMA).any(axis=(0, 2))
+    has_point = (codes == __CODE_POINT).any(axis=(0, 2))
+
+    return ['.' if point else ',' if comma else None for comma, point in zip(has_comma.tolist(), has_point.tolist())]
+
+
+#   Used to decode whole columns of numerical values given as an array of strings or bytes (of any shape)
+#   Each value must follow the rule of is_a_numerical_value with the given decimal separator (detected if None), or
+#   with the separator of its column if one separator is given for each column (the last axis, None for '.')
+#   Will return an array of float64 values and the mask of invalid cells (decoded as NaN), both of the same shape
+def decode_numerical_columns(cells: np.ndarray,
+                             decimal_separator: str | list[str | None] | None = None) -> (np.ndarray, np.ndarray):
+    cells = np.asarray(cells)
+
+    if cells.dtype.kind not in ('U', 'S'):
+        cells = cells.astype(str)
+
+    if cells.size == 0:
+        return np.empty(cells.shape, dtype=float), np.zeros(cells.shape, dtype=bool)
+
+    if decimal_separator is None:
+        decimal_separator = detect_decimal_separator(cells) or '.'
+
+    codes = __get_character_codes(cells)
+
+    #   A second character is always needed to check values starting with a minus
+    if codes.shape[-1] < 2:
+        codes = np.concatenate((codes, np.zeros(codes.shape[:-1] + (2 - codes.shape[-1],), dtype=codes.dtype)),
+                               axis=-1)
+
+    #   Separators codes are given along the last axis of cells (one for each column or one for all of them)
+    if isinstance(decimal_separator, str):
+        separator_codes = np.array(__CODE_COMMA if decimal_separator == ',' else __CODE_POINT)
+    else:
+        separator_codes = np.array([__CODE_COMMA if separator == ',' else __CODE_POINT
+                                    for separator in decimal_separator])
+
+    separator_codes = separator_codes[..., np.newaxis].astype(codes.dtype)
+
+    is_digit = (codes >= __CODE_ZERO) & (codes <= __CODE_NINE)
+    is_minus = codes == __CODE_MINUS
+    is_separator = codes == separator_codes
+
+    #   Same rule as is_a_numerical_value: an optional leading minus, digits and an optional decimal part
+    lengths = np.count_nonzero(codes, axis=-1)
+    first_digit_index = is_minus[..., 0].astype(np.intp)
+    last_index = np.maximum(lengths - 1, 0)
+
+    valid_mask = (is_digit | is_minus | is_separator | (codes == 0)).all(axis=-1) & \
+        ~is_minus[..., 1:].any(axis=-1) & \
+        (np.count_nonzero(is_separator, axis=-1) <= 1) & \
+        np.take_along_axis(is_digit, first_digit_index[..., np.newaxis], axis=-1)[..., 0] & \
+        np.take_along_axis(is_digit, last_index[..., np.newaxis], axis=-1)[..., 0]
+
+    #   Comma decimals are replaced on a copy of the values, never in the given array
+    is_comma_separator = is_separator & (separator_codes == __CODE_COMMA)
+
+    if is_comma_separator.any():
+        cells = cells.copy()
+        replaced_codes = __get_character_codes(cells)
+        replaced_codes[is_comma_separator[..., :replaced_codes.shape[-1]]] = __CODE_POINT
+
+    if valid_mask.all():
+        return cells.astype(float), ~valid_mask
+
+    values = np.full(cells.shape, np.nan)
+    values[valid_mask] = cells[valid_mask].astype(float)
+
+    return values, ~valid_mask
+
+
 #   Used to know the number of sensors based on the first row of a CSV file
 def get_sensor_number(csv_row: [str]) -> int:
     #   Check if there is any sensor columns
@@ -198,25 +412,6 @@ def get_color_hex_array(values: list[tuple[int, int, int]]) -> [str]:
     return generated_array
 
 
-#   To update sliders actual value
-def update_slider_value(element: Scale, new_value: int | float) -> None:
-    element.set(new_value)
-
-
-#   To update sliders max value
-def update_slider_max(element: Scale, new_value: int | float) -> None:
-    element.configure(to=new_value)
-
-
-#   To lock a tkinter element
-def lock(element: Button | Scale | OptionMenu | Entry | Menu | Widget) -> None:
-    element['state'] = DISABLED
-
-#   To unlock a tkinter element
-def unlock(element: Button | Scale | OptionMenu | Entry | Menu | Widget) -> None:
-    element['state'] = NORMAL
-
-
 #   An ugly function to pass from a svg path to a group of points
 def svg_path_to_grp_pts(svg_path: Path) -> [[(int, int)]]:
     #   Abort the process if there is no svg path
@@ -305,20 +500,24 @@ def get_formatted_timestamp_from_value(value: float) -> str:
     return get_formatted_timestamp(get_timestamp(value))
 
 
-#   Pass from position and sensors characteristics to a center position
-def get_sensor_center_position(position: Position, sensor_characteristics: [int, int, int]) -> [Position]:
+#   Pass from positions and sensors characteristics to center positions
+#   positions is a (number of sensors, 2) array and sensors_characteristics a (number of sensors, 3) array of
+#   [width, height, angle], a single position and its characteristics can be given too
+def get_sensor_center_position(positions: np.ndarray, sensors_characteristics: np.ndarray) -> np.ndarray:
+    positions = np.asarray(positions)
+    sensors_characteristics = np.asarray(sensors_characteristics)
 
     #   Calculate each coordinates needed to avoid repetitive calculations
-    x_ = position.x + sensor_characteristics[0] // 2
-    y_ = position.y + sensor_characteristics[1] // 2
+    x_ = positions[..., 0] + sensors_characteristics[..., 0] // 2
+    y_ = positions[..., 1] + sensors_characteristics[..., 1] // 2
 
-    alpha = math.radians(sensor_characteristics[2])
-    cos_alpha = math.cos(alpha)
-    sin_alpha = math.sin(alpha)
+    alpha = np.radians(sensors_characteristics[..., 2])
+    cos_alpha = np.cos(alpha)
+    sin_alpha = np.sin(alpha)
 
-    #   Initialize position
-    return Position(int(x_ * cos_alpha - y_ * sin_alpha),
-                    int(x_ * sin_alpha + y_ * cos_alpha))
+    #   Coordinates are truncated like int() does
+    return np.stack((np.trunc(x_ * cos_alpha - y_ * sin_alpha),
+                     np.trunc(x_ * sin_alpha + y_ * cos_alpha)), axis=-1).astype(int)
 
 
 #   A is in [b1; b2] ?
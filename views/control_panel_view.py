@@ -14,7 +14,7 @@ from tkinter import Frame, Label, Button, Scale, IntVar, LabelFrame, OptionMenu,
 
 #   Import of custom modules
 from model import PlaySpeed
-from utils import update_slider_max, unlock, lock
+from views.widget_utils import update_slider_max, unlock, lock
 
 #   In order to avoid Circular Import problems
 from typing import TYPE_CHECKING
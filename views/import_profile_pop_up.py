@@ -0,0 +1,102 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining the pop up that will show the profile of the last import
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+#   Import of basic modules
+from tkinter import Frame, Toplevel, Label, Button
+
+#   Import of custom modules
+from import_profiler import ImportProfiler
+
+"""
+
+    ImportProfilePopUp
+
+    In charge of displaying the wall time, the CPU time and the peak of memory of each phase of an import.
+
+"""
+
+
+class ImportProfilePopUp(Toplevel):
+
+    __on_export: 'function'
+
+    #   on_export will be called when the user asks to export the profile as a JSON file
+    def __init__(self, parent, on_export: 'function'):
+        super().__init__(parent)
+        self.wm_title("Import profile")
+        self.resizable(False, False)
+
+        self.__on_export = on_export
+
+    #   Will format a number of bytes with an adapted unit
+    @staticmethod
+    def __format_memory(nb_of_bytes: int | None) -> str:
+        if nb_of_bytes is None:
+            return "-"
+
+        for unit in ["B", "KiB", "MiB"]:
+            if nb_of_bytes < 1024:
+                return "{:.1f} {:s}".format(nb_of_bytes, unit)
+            nb_of_bytes /= 1024
+
+        return "{:.1f} GiB".format(nb_of_bytes)
+
+    #   Will add a line of labels to the array
+    @staticmethod
+    def __add_line(array_frame: Frame, row: int, texts: [str], bg: str) -> None:
+        for column, text in enumerate(texts):
+            Label(array_frame,
+                  text=text,
+                  borderwidth=1,
+                  bg=bg,
+                  relief='ridge').grid(row=row,
+                                       column=column,
+                                       columnspan=1,
+                                       sticky='nswe', ipadx=10)
+
+    #   Will display the popup
+    def show(self, profiler: ImportProfiler):
+        records = profiler.get_records()
+
+        head_message = Label(self, text="The import took {:.3f} s".format(profiler.get_total_wall_time()))
+        head_message.grid(row=1, column=1, columnspan=2, padx=20, pady=20, sticky='nswe')
+
+        array_frame = Frame(self)
+        array_frame.config(borderwidth=2, bg="light gray")
+
+        #   Set array header (column titles)
+        self.__add_line(array_frame, 0, ["Phase", "Wall time", "CPU time", "Workers CPU time", "Peak memory"],
+                        'light grey')
+
+        #   Draw a line for each phase
+        for i, record in enumerate(records):
+            self.__add_line(array_frame, i + 1, [record["label"],
+                                                 "{:.3f} s".format(record["wall_time"]),
+                                                 "{:.3f} s".format(record["cpu_time"]),
+                                                 "{:.3f} s".format(record["children_cpu_time"]),
+                                                 self.__format_memory(record["peak_memory"])], 'white')
+
+        #   Add a line with totals
+        self.__add_line(array_frame, len(records) + 1, ["Total",
+                                                        "{:.3f} s".format(profiler.get_total_wall_time()),
+                                                        "{:.3f} s".format(sum(record["cpu_time"]
+                                                                              for record in records)),
+                                                        "{:.3f} s".format(sum(record["children_cpu_time"]
+                                                                              for record in records)),
+                                                        self.__format_memory(profiler.get_peak_memory())],
+                        'light grey')
+
+        array_frame.grid(row=2, column=1, columnspan=2, padx=20, pady=0, sticky='nswe')
+
+        export_button = Button(self, text="Export JSON", command=self.__on_export)
+        export_button.grid(row=3, column=1, padx=20, pady=20, sticky='nswe')
+
+        close_button = Button(self, text="Close", command=self.destroy)
+        close_button.grid(row=3, column=2, padx=20, pady=20, sticky='nswe')
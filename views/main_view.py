@@ -11,6 +11,7 @@
 #   Import of basic modules
 from tkinter import Frame, Toplevel, Label, Button, Radiobutton, StringVar, BooleanVar, Widget, Menu
 from tkinter.constants import DISABLED, NORMAL
+from tkinter.ttk import Progressbar
 
 #   Import of custom modules
 from views.control_panel_view import ControlPanel
@@ -40,6 +41,11 @@ class MainView(Frame):
     __generation_menu_toolbox: Menu
     __control_panel_ui: ControlPanel
 
+    __import_progress_frame: Frame | None
+    __import_progress_label: Label
+    __import_progress_bar: Progressbar
+    __import_cancel_button: Button
+
     def __init__(self, parent, controller: 'Controller'):
         super().__init__(parent)
         self.__controller = controller
@@ -55,6 +61,8 @@ class MainView(Frame):
         self.__import_menu_toolbox = None
         self.__generation_menu_toolbox = None
 
+        self.__import_progress_frame = None
+
     def ui_init(self):
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=3)
@@ -116,6 +124,44 @@ class MainView(Frame):
         self.__menu_toolbox.entryconfig("Generate", state=NORMAL)
 
 
+    #   Will show the progress of an import with a button to cancel it
+    def show_import_progress(self, nb_of_phases: int, on_cancel: 'function') -> None:
+        self.hide_import_progress()
+
+        self.__import_progress_frame = Frame(self, borderwidth=2, bg="light grey")
+
+        self.__import_progress_label = Label(self.__import_progress_frame, text="Starting import...",
+                                             bg="light grey", anchor='w', width=30)
+        self.__import_progress_bar = Progressbar(self.__import_progress_frame, orient='horizontal',
+                                                 mode='determinate', maximum=nb_of_phases)
+        self.__import_cancel_button = Button(self.__import_progress_frame, text="CANCEL", command=on_cancel)
+
+        self.__import_progress_frame.columnconfigure(1, weight=1)
+        self.__import_progress_label.grid(row=0, column=0, sticky='nwse', ipadx=5, padx=5, pady=5)
+        self.__import_progress_bar.grid(row=0, column=1, sticky='we', ipadx=5, padx=5, pady=5)
+        self.__import_cancel_button.grid(row=0, column=2, sticky='nwse', ipadx=5, padx=5, pady=5)
+
+        self.__import_progress_frame.pack(side='bottom', fill='x', before=self.__top_section)
+
+    #   Will update the progress of the import with the current phase name and its index
+    #   Without index, only the text is updated (and the cancel button is locked)
+    def update_import_progress(self, text: str, phase_index: int = -1) -> None:
+        if self.__import_progress_frame is None:
+            return
+
+        self.__import_progress_label['text'] = text
+
+        if phase_index > -1:
+            self.__import_progress_bar['value'] = phase_index
+        else:
+            self.__import_cancel_button['state'] = DISABLED
+
+    #   Will hide the progress of the import
+    def hide_import_progress(self) -> None:
+        if self.__import_progress_frame is not None:
+            self.__import_progress_frame.destroy()
+            self.__import_progress_frame = None
+
     #   If the dataimportmodule did not detect delimiters, application will ask for delimiter setting
     def ask_for_csv_settings(self, possible_delimiters: [(str, str)]):
         pop_up = Toplevel(self)
@@ -11,9 +11,15 @@
 #   Import of basic modules
 from tkinter import Canvas
 from tkinter.constants import BOTH
+import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib.backends._backend_tk import NavigationToolbar2Tk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.lines import Line2D
+
+#   Import of custom modules
+from min_max_pyramid import MinMaxPyramid
 
 #   In order to avoid Circular Import problems
 from typing import TYPE_CHECKING
@@ -25,6 +31,9 @@ if TYPE_CHECKING:
     SensorsGraphView
 
     Just show a view with graph drawing with matplotlib
+    Only summaries of the shown time range are drawn (the mean of each sensor and its min/max envelope), taken from the
+    min/max pyramid at the level matching the width of the graph, so drawing costs the same whatever the length of
+    the recording. They are drawn again each time the shown time range changes (zoom, pan...).
 
 """
 
@@ -32,18 +41,21 @@ if TYPE_CHECKING:
 class SensorsGraphView(Canvas):
 
     __controller: 'Controller'
+    __lines: [Line2D]
+    __envelopes: [PolyCollection]
 
     def __init__(self,
                  parent,
                  controller: 'Controller'):
         super().__init__(parent, borderwidth=2, bg="white")
         self.__controller = controller
+        self.__lines = []
+        self.__envelopes = []
 
     #   Call it once to draw a graph
     def plot(self,
-             sensor_data: [[float]],
-             sensors_names: [str],
-             temporal_set: [float]):
+             pyramid: MinMaxPyramid,
+             sensors_names: [str]):
 
         fig, ax = plt.subplots()
 
@@ -52,17 +64,26 @@ class SensorsGraphView(Canvas):
         ax.set_ylabel('sensors_values')
 
         #   Draw each sensors data
-        for data in sensor_data:
-            ax.plot(temporal_set, data)
+        times, sensors_min, sensors_max, sensors_mean = pyramid.get_summary(-np.inf, np.inf,
+                                                                            self.__get_pixel_width(ax))
+
+        self.__lines = ax.plot(times, sensors_mean)
+        self.__envelopes = self.__draw_envelopes(ax, times, sensors_min, sensors_max)
 
         #   Put legends
-        ax.legend(sensors_names)
+        ax.legend(self.__lines, sensors_names)
 
         ax.margins(x=0.02, y=0.02)
         ax.tick_params(axis='both')
 
         plt.autoscale(enable=True, axis='both', tight=False)
 
+        #   Summaries are taken again for the new time range
+        def on_xlim_changed(axes) -> None:
+            self.__update_summaries(axes, pyramid)
+
+        ax.callbacks.connect('xlim_changed', on_xlim_changed)
+
         canvas = FigureCanvasTkAgg(fig, master=self)
         toolbar = NavigationToolbar2Tk(canvas, self)
         toolbar.update()
@@ -72,7 +93,34 @@ class SensorsGraphView(Canvas):
                                     fill=BOTH,
                                     expand=True)
 
+    #   Get the width of the drawing area of the graph (in pixels)
+    @staticmethod
+    def __get_pixel_width(ax) -> int:
+        return max(1, int(ax.bbox.width))
+
+    #   Will draw the min/max envelope of each sensor with the color of its line
+    def __draw_envelopes(self, ax, times: np.ndarray, sensors_min: np.ndarray,
+                         sensors_max: np.ndarray) -> [PolyCollection]:
+        return [ax.fill_between(times, sensors_min[:, i], sensors_max[:, i],
+                                color=line.get_color(), alpha=0.2, linewidth=0)
+                for i, line in enumerate(self.__lines)]
+
+    #   Will draw again summaries of the time range shown by the graph
+    #   Existing artists are only updated: adding new ones would make the graph rescale, and change the range again
+    def __update_summaries(self, ax, pyramid: MinMaxPyramid) -> None:
+        start_time, end_time = ax.get_xlim()
+        times, sensors_min, sensors_max, sensors_mean = pyramid.get_summary(start_time, end_time,
+                                                                            self.__get_pixel_width(ax))
+
+        for i, (line, envelope) in enumerate(zip(self.__lines, self.__envelopes)):
+            line.set_data(times, sensors_mean[:, i])
+            envelope.set_verts([np.concatenate((np.column_stack((times, sensors_max[:, i])),
+                                                np.column_stack((times[::-1], sensors_min[::-1, i]))))])
+
     #   Used to clear the view
     def clear(self):
         for widgets in self.winfo_children():
             widgets.destroy()
+
+        self.__lines = []
+        self.__envelopes = []
@@ -8,11 +8,15 @@
         Quentin GOMES DOS REIS
 ------------------------------------------------------------------------------------------------------------------------
 """
-import math
 from tkinter import Canvas
 from tkinter.font import Font
 
-from position import Position
+import numpy as np
+
+#   Import of custom modules
+from growable_buffer import GrowableBuffer
+from ring_buffer import RingBuffer
+from ring_buffer_dataset import RingBufferDataSet
 
 #   In order to avoid Circular Import problems
 from typing import TYPE_CHECKING
@@ -33,7 +37,8 @@ class SensorsMapView(Canvas):
     __controller: 'Controller'
     __scale_factor: float
     __cache_sensors_positions: [[(int, int)]]
-    __cache_c_o_m_positions: [(int, int)]
+    #   Rows are scaled positions, a ring buffer of the same capacity as a dataset only keeping its last frames
+    __cache_c_o_m_positions: GrowableBuffer | RingBuffer
     __com_font: Font
     __sensor_name_font: Font
     __svg_bg_path: str
@@ -116,12 +121,13 @@ class SensorsMapView(Canvas):
             pts: [[int, int]] = [[int(p[0] * self.__scale_factor), int(p[1] * self.__scale_factor)] for p in poly]
             self.create_polygon(pts, fill="silver", tags='bg')
 
-    #   Will draw sensors names at given position
-    #       WARNING:    len(position) and len(sensors_names) must be equal
-    def draw_sensor_names(self, position: [[int, int]], sensors_names: [str]) -> None:
-        for index in range (len(sensors_names)):
-            self.create_text(position[index].x * self.__scale_factor,
-                             position[index].y * self.__scale_factor,
+    #   Will draw sensors names at given positions, a (number of sensors, 2) array
+    #       WARNING:    len(positions) and len(sensors_names) must be equal
+    def draw_sensor_names(self, positions: np.ndarray, sensors_names: [str]) -> None:
+        scaled_positions = (np.asarray(positions) * self.__scale_factor).tolist()
+
+        for index in range(len(sensors_names)):
+            self.create_text(scaled_positions[index],
                              font=self.__sensor_name_font,
                              fill='white',
                              text=sensors_names[index])
@@ -131,11 +137,15 @@ class SensorsMapView(Canvas):
     def draw_sensor(self, index: int, color: str, id: str) -> None:
         self.create_polygon(self.__cache_sensors_positions[index], fill=color, tags=id)
 
-    #   Will draw center of mass with at a given temporal index
+    #   Will draw center of mass with at a given temporal index, nothing is drawn for frames without any load
     #       WARNING:    center of mass position cache must be initialized properly with update_cache_position()
     def draw_center_of_mass(self, index: int) -> None:
         self.delete('com')
-        self.create_text(self.__cache_c_o_m_positions[index], font=self.__com_font, tags='com', text='+')
+
+        position = self.__cache_c_o_m_positions.get_rows()[index]
+
+        if not np.isnan(position[0]):
+            self.create_text(position.tolist(), font=self.__com_font, tags='com', text='+')
 
     #   Will update sensor based on his drawing id
     #       NOTE: Much more efficient that redrawing sensors
@@ -168,87 +178,86 @@ class SensorsMapView(Canvas):
     #   So it might be a part that will be moved or merged into the draw_sensor method
     #
     def __calculate_cache_position(self,
-                                   positions: [Position],
-                                   sensors_characteristics: [int, int, int]) -> [[[int, int]]]:
-        new_cache: [[[int, int]]] = list(list())
+                                   positions: np.ndarray,
+                                   sensors_characteristics: [[int, int, int]]) -> [[[int, int]]]:
 
         #   ONLY FOR DEBUG
         #   print("RECALCULATE CACHE")
 
-        for i in range(len(positions)):
-
-            #   Scale sensor dimensions
-            scaled_width = sensors_characteristics[i][0] * self.__scale_factor
-            scaled_height = sensors_characteristics[i][1] * self.__scale_factor
-
-            #   Scale initial position
-            scaled_x = positions[i].x * self.__scale_factor
-
-            #   Need y-axis inversion ?
-            if self.__y_axis_inversion:
-                scaled_y = (self.__map_height - positions[i].y) * self.__scale_factor
-            else:
-                scaled_y = positions[i].y * self.__scale_factor
-
-            #   Calculate other points needed and cos and sin values to avoid repetitive calculation in the next part
-            s_x_1 = scaled_x + scaled_width
-            s_y_1 = scaled_y + scaled_height
-            alpha = math.radians(sensors_characteristics[i][2])
-            cos_alpha = math.cos(alpha)
-            sin_alpha = math.sin(alpha)
-
-            #   Initialize sensor array
-            new_cache.append([])
-
-            #   Add each coordinates points
-            #   A -- B
-            #   |    |
-            #   D -- C
-            #
-            #   A
-            new_cache[i].append([int(scaled_x * cos_alpha - scaled_y * sin_alpha),
-                                 int(scaled_x * sin_alpha + scaled_y * cos_alpha)])
-            #   B
-            new_cache[i].append([int(s_x_1 * cos_alpha - scaled_y * sin_alpha),
-                                 int(s_x_1 * sin_alpha + scaled_y * cos_alpha)])
-            #   C
-            new_cache[i].append([int(s_x_1 * cos_alpha - s_y_1 * sin_alpha),
-                                 int(s_x_1 * sin_alpha + s_y_1 * cos_alpha)])
-            #   D
-            new_cache[i].append([int(scaled_x * cos_alpha - s_y_1 * sin_alpha),
-                                 int(scaled_x * sin_alpha + s_y_1 * cos_alpha)])
-
-            #   For debugging purposes
-            #   print(i)
-            #   print(new_cache[i])
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        sensors_characteristics = np.asarray(sensors_characteristics, dtype=float).reshape(-1, 3)
 
-        return new_cache
+        #   Scale sensors dimensions
+        scaled_width = sensors_characteristics[:, 0] * self.__scale_factor
+        scaled_height = sensors_characteristics[:, 1] * self.__scale_factor
+
+        #   Scale initial positions
+        scaled_x = positions[:, 0] * self.__scale_factor
+
+        #   Need y-axis inversion ?
+        if self.__y_axis_inversion:
+            scaled_y = (self.__map_height - positions[:, 1]) * self.__scale_factor
+        else:
+            scaled_y = positions[:, 1] * self.__scale_factor
+
+        #   Calculate other points needed and cos and sin values to avoid repetitive calculation in the next part
+        s_x_1 = scaled_x + scaled_width
+        s_y_1 = scaled_y + scaled_height
+        alpha = np.radians(sensors_characteristics[:, 2])
+        cos_alpha = np.cos(alpha)
+        sin_alpha = np.sin(alpha)
+
+        #   Each coordinates points of each sensor, shape is (number of sensors, 4, 2)
+        #   A -- B
+        #   |    |
+        #   D -- C
+        #
+        corners_x = np.stack((scaled_x, s_x_1, s_x_1, scaled_x), axis=1)
+        corners_y = np.stack((scaled_y, scaled_y, s_y_1, s_y_1), axis=1)
+
+        corners = np.stack((corners_x * cos_alpha[:, np.newaxis] - corners_y * sin_alpha[:, np.newaxis],
+                            corners_x * sin_alpha[:, np.newaxis] + corners_y * cos_alpha[:, np.newaxis]), axis=2)
+
+        #   Coordinates are truncated like int() does
+        return np.trunc(corners).astype(int).tolist()
 
     #   Will calculate and put in cache the position of the center of mass points
-    def __calculate_cache_c_o_m_position(self, positions: [Position]) -> [[int, int]]:
-        new_cache: [[int, int]] = list(list())
+    #   positions is a (number of positions, 2) array, scaled positions are given the same way (NaN are kept)
+    def __calculate_cache_c_o_m_position(self, positions: np.ndarray) -> np.ndarray:
 
         #   ONLY FOR DEBUG
         #   print("RECALCULATE C_O_M CACHE")
 
-        for i in range(len(positions)):
-
-            #   Scale initial position
-            scaled_x = positions[i].x * self.__scale_factor
+        #   Scale initial positions
+        new_cache = np.asarray(positions, dtype=float) * self.__scale_factor
 
-            #   Need y-axis inversion ?
-            if self.__y_axis_inversion:
-                scaled_y = (self.__map_height - positions[i].y) * self.__scale_factor
-            else:
-                scaled_y = positions[i].y * self.__scale_factor
-
-            #   Initialize sensor array
-            new_cache.append([scaled_x, scaled_y])
+        #   Need y-axis inversion ?
+        if self.__y_axis_inversion:
+            new_cache[:, 1] = (self.__map_height - positions[:, 1]) * self.__scale_factor
 
         return new_cache
 
     #   Called to update both caches
     def update_cache_position(self):
-        self.__cache_sensors_positions = self.__calculate_cache_position(self.__controller.get_dataset().get_positions(),
-                                                                         self.__controller.get_dataset().get_sensors_characteristics())
-        self.__cache_c_o_m_positions = self.__calculate_cache_c_o_m_position(self.__controller.get_dataset().get_c_o_m_positions())
+        dataset = self.__controller.get_dataset()
+
+        self.__cache_sensors_positions = self.__calculate_cache_position(dataset.get_positions_array(),
+                                                                         dataset.get_sensors_characteristics())
+
+        c_o_m_positions = self.__calculate_cache_c_o_m_position(dataset.get_c_o_m_positions())
+
+        #   The cache is filled in place when positions are appended (see extend_cache_c_o_m_position())
+        if isinstance(dataset, RingBufferDataSet):
+            cache = RingBuffer(2, dataset.get_capacity())
+        else:
+            cache = GrowableBuffer(2, len(c_o_m_positions), row_major=True)
+
+        cache.append(c_o_m_positions)
+        self.__cache_c_o_m_positions = cache
+
+    #   Called when center of mass positions have been appended to the dataset, only new positions are put in cache
+    #   Positions of frames dropped from the start of the dataset (see RingBufferDataSet) are dropped from the cache
+    #   the same way, as it has the same capacity
+    def extend_cache_c_o_m_position(self, first_new_position: int) -> None:
+        c_o_m_positions = self.__controller.get_dataset().get_c_o_m_positions()
+        self.__cache_c_o_m_positions.append(self.__calculate_cache_c_o_m_position(c_o_m_positions[first_new_position:]))
@@ -0,0 +1,42 @@
+"""
+------------------------------------------------------------------------------------------------------------------------
+    Defining functions used by views to update tkinter widgets
+
+    MIT Licence
+
+    STAGE 2021 - 2022
+        Quentin GOMES DOS REIS
+------------------------------------------------------------------------------------------------------------------------
+"""
+
+#   Import of basic modules
+from tkinter import Scale, Button, OptionMenu, Entry, Menu
+from tkinter.constants import DISABLED, NORMAL
+from tkinter.ttk import Widget
+
+"""
+
+    Widget utils
+
+    Kept apart from utils so modules without any view (e.g. the command-line interface) never import tkinter
+
+"""
+
+
+#   To update sliders actual value
+def update_slider_value(element: Scale, new_value: int | float) -> None:
+    element.set(new_value)
+
+
+#   To update sliders max value
+def update_slider_max(element: Scale, new_value: int | float) -> None:
+    element.configure(to=new_value)
+
+
+#   To lock a tkinter element
+def lock(element: Button | Scale | OptionMenu | Entry | Menu | Widget) -> None:
+    element['state'] = DISABLED
+
+#   To unlock a tkinter element
+def unlock(element: Button | Scale | OptionMenu | Entry | Menu | Widget) -> None:
+    element['state'] = NORMAL